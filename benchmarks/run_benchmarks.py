@@ -0,0 +1,257 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+# Sin ventana ni audio: los benchmarks se pueden correr en un servidor
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_SIZES = [12, 64, 256]
+
+CASES = {}
+
+def benchmark(name):
+    """
+    Registra un caso de benchmark. La función recibe (tamaño, rng) y devuelve
+    `prepare`, que se llama antes de cada ronda (sin medir) y devuelve la
+    función a medir. Esa función puede devolver cuántas operaciones hizo.
+    """
+    def register(make):
+        CASES[name] = make
+        return make
+    return register
+
+def _new_player(name, size, rng, place=True):
+    from modules.board import Board
+    from modules.player import Player
+
+    player = Player(name, Board(size), rng=rng)
+    if place:
+        player.place_fleet_randomly()
+    return player
+
+@benchmark("board_draw_full")
+def bench_board_draw_full(size, rng):
+    """Dibujo completo del tablero (superficie en caché invalidada)."""
+    from modules.ui import ui
+
+    player = _new_player("Jugador", size, rng)
+
+    def prepare():
+        player.board.renderer.invalidate()
+        return lambda: player.board.draw(ui.screen)
+    return prepare
+
+@benchmark("board_draw_dirty")
+def bench_board_draw_dirty(size, rng):
+    """Cuadro típico: una celda cambia y se repinta solo esa celda."""
+    from modules.ui import ui
+
+    player = _new_player("Jugador", size, rng)
+    player.board.draw(ui.screen)
+
+    def prepare():
+        row, col = rng.randrange(size), rng.randrange(size)
+        player.board.update_cell(row, col, **player.board.get_cell(row, col))
+        return lambda: player.board.draw(ui.screen)
+    return prepare
+
+@benchmark("draw_game_state")
+def bench_draw_game_state(size, rng):
+    """Cuadro completo del turno del jugador: fondo, paneles y ambos tableros."""
+    from modules.ui import ui
+
+    player = _new_player("Jugador", size, rng)
+    bot = _new_player("Bot", size, rng)
+
+    def frame():
+        ui.draw_game_state(ui.screen, player, bot, player.board, bot.board, "player_turn", 1)
+
+    def prepare():
+        return frame
+    return prepare
+
+@benchmark("place_fleet_randomly")
+def bench_place_fleet_randomly(size, rng):
+    """Colocación aleatoria de la flota completa en un tablero vacío."""
+    def prepare():
+        player = _new_player("Bot", size, rng, place=False)
+        return player.place_fleet_randomly
+    return prepare
+
+@benchmark("receive_attack")
+def bench_receive_attack(size, rng):
+    """Un ataque por celda hasta recorrer todo el tablero; se mide por ataque."""
+    cells = [(row, col) for row in range(size) for col in range(size)]
+
+    def prepare():
+        player = _new_player("Jugador", size, rng)
+        rng.shuffle(cells)
+
+        def attack_all():
+            for row, col in cells:
+                player.receive_attack(row, col)
+            return len(cells)
+        return attack_all
+    return prepare
+
+@benchmark("bot_turn")
+def bench_bot_turn(size, rng):
+    """
+    Decisión y resolución de los disparos del bot (sin pausas ni dibujo)
+    durante una partida completa; se mide por disparo.
+    """
+    from modules.attacks_logic import update_attack_board
+    from modules.bot_ai import DensityTargeting
+
+    def prepare():
+        player = _new_player("Jugador", size, rng)
+        bot = _new_player("Bot", size, rng, place=False)
+        bot.targeting = DensityTargeting(size, bot.fleet)
+
+        def play():
+            shots = 0
+            while player.life > 0:
+                target = bot.targeting.choose_target(rng)
+                if target is None:
+                    break
+                result = player.receive_attack(*target)
+                update_attack_board(bot, *target, result)
+                shots += 1
+            return shots
+        return play
+    return prepare
+
+def run_case(name, size, rounds, min_time, seed):
+    """Mide un caso y devuelve sus estadísticas en segundos por operación."""
+    rng = random.Random(seed)
+    prepare = CASES[name](size, rng)
+    prepare()()  # Calentamiento: fuentes, cachés y superficies
+
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < rounds or (time.perf_counter() - started < min_time and len(timings) < 10000):
+        target = prepare()
+        start = time.perf_counter()
+        ops = target()
+        elapsed = time.perf_counter() - start
+        ops = ops if isinstance(ops, int) and ops > 0 else 1
+        timings.append(elapsed / ops)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "rounds": len(timings),
+    }
+
+def run_benchmarks(names, sizes, rounds=20, min_time=0.5, seed=0):
+    """Ejecuta los casos indicados en cada tamaño de tablero."""
+    import pygame
+    from modules.ui import ui
+
+    pygame.init()
+    ui.init_screen()
+    results = {}
+    for name in names:
+        for size in sizes:
+            results[f"{name}[{size}]"] = run_case(name, size, rounds, min_time, seed)
+    return results
+
+def machine_info():
+    import numpy
+    import pygame
+
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+    }
+
+def compare_results(current, baseline, threshold=0.25, stat="median"):
+    """
+    Compara contra la línea base. Devuelve filas (nombre, base, actual, razón,
+    regresión) para los casos presentes en ambos resultados.
+    """
+    rows = []
+    for key in current:
+        if key not in baseline:
+            continue
+        before = baseline[key][stat]
+        after = current[key][stat]
+        ratio = after / before if before else float("inf")
+        rows.append((key, before, after, ratio, ratio > 1 + threshold))
+    return rows
+
+def format_time(seconds):
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:9.3f} ms"
+    return f"{seconds * 1e6:9.2f} µs"
+
+def format_results(results):
+    lines = [f"{'Caso':<28}{'mín':>13}{'mediana':>13}{'media':>13}{'rondas':>8}"]
+    for key, stats in results.items():
+        lines.append(
+            f"{key:<28}{format_time(stats['min']):>13}{format_time(stats['median']):>13}"
+            f"{format_time(stats['mean']):>13}{stats['rounds']:>8}"
+        )
+    return "\n".join(lines)
+
+def format_comparison(rows):
+    lines = [f"{'Caso':<28}{'base':>13}{'actual':>13}{'razón':>9}"]
+    for key, before, after, ratio, regression in rows:
+        mark = "  REGRESIÓN" if regression else ""
+        lines.append(f"{key:<28}{format_time(before):>13}{format_time(after):>13}{ratio:>8.2f}x{mark}")
+    return "\n".join(lines)
+
+def main():
+    """Ejecuta la suite de benchmarks desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks de tablero, dibujo y bot.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Tamaños de tablero.")
+    parser.add_argument("--filter", default="", help="Solo casos cuyo nombre contenga este texto.")
+    parser.add_argument("--rounds", type=int, default=20, help="Rondas mínimas por caso.")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Segundos mínimos por caso.")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los casos aleatorios.")
+    parser.add_argument("--save", nargs="?", const=BASELINE, help="Guarda los resultados como línea base.")
+    parser.add_argument("--compare", nargs="?", const=BASELINE, help="Compara contra una línea base.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Tolerancia antes de marcar regresión (0.25 = 25%%).")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)  # Los recursos del juego usan rutas relativas a la raíz
+    names = [name for name in CASES if args.filter in name]
+    if not names:
+        parser.error(f"Ningún caso coincide con '{args.filter}'.")
+
+    results = run_benchmarks(names, args.sizes, args.rounds, args.min_time, args.seed)
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({"machine": machine_info(), "results": results}, file, indent=2)
+        print(f"Línea base guardada en {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        rows = compare_results(results, baseline, args.threshold)
+        print()
+        print(format_comparison(rows))
+        regressions = [row for row in rows if row[4]]
+        if regressions:
+            print(f"{len(regressions)} caso(s) más lentos que la línea base por encima del {args.threshold:.0%}.")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import argparse
+import os
+import time
+import pygame
+from modules.config import config
+from modules.assets import PACK_PATH, build_asset_pack
+
+def main():
+    """Genera el paquete de recursos preprocesados que el juego usa al arrancar."""
+    parser = argparse.ArgumentParser(description="Genera el paquete de imágenes ya escaladas.")
+    parser.add_argument("--output", default=PACK_PATH, help="Ruta del paquete.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    size = (config.WINDOW_WIDTH, config.WINDOW_HEIGHT)
+    start = time.perf_counter()
+    index = build_asset_pack([("menu", size, False), ("battle", size, False)], args.output)
+    elapsed = time.perf_counter() - start
+    print(f"{len(index)} imágenes en {args.output} ({os.path.getsize(args.output) / 1e6:.1f} MB, {elapsed:.2f} s)")
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,85 @@
+import argparse
+import random
 import pygame
-import time
 from modules.config import config
+from modules.fonts import get_font, render_text
 from modules.board import Board
 from modules.ui import ui
+from modules.scheduler import scheduler
+from modules.assets import assets
 from modules.player import Player
 from modules.game_logic import place_ships, draw_central_area
 from modules.utils import handle_menu_navigation, display_message
-from modules.buttons import draw_button, handle_button_interaction, is_mouse_over_button
+from modules.buttons import draw_button, handle_button_interaction
+from modules.scenes import Scene, dispatcher
 from modules.attacks_logic import bot_attack
-
-def initialize_game():
-    """Inicializa los elementos principales del juego: tableros y jugadores."""
-    board_size = 12
+from modules.bot_ai import DensityTargeting
+from modules.snapshot import save_game, load_game
+from modules.replay import seed_argument
+
+MIN_BOARD_SIZE = 8  # El barco más grande mide 6 celdas
+
+def initialize_game(seed=None, board_size=None):
+    """
+    Inicializa los elementos principales del juego: tableros y jugadores.
+    Todas las decisiones al azar de la partida salen de un generador con
+    `seed`; si no se indica, se elige una y se muestra para poder repetirla.
+    """
+    board_size = board_size or config.game_board_size
+    if not MIN_BOARD_SIZE <= board_size <= config.MAX_BOARD_SIZE:
+        raise ValueError(f"El tablero debe medir entre {MIN_BOARD_SIZE} y {config.MAX_BOARD_SIZE} celdas por lado.")
+    if seed is None:
+        seed = random.getrandbits(64)  # Todo el rango de --seed
+    print(f"Semilla de la partida: {seed}")
+    rng = random.Random(seed)
     player_board = Board(board_size)
-    player = Player("Jugador", player_board)
+    player = Player("Jugador", player_board, rng=rng)
     bot_board = Board(board_size)
-    bot = Player("Bot", bot_board)
+    bot = Player("Bot", bot_board, rng=rng)
+    bot.targeting = DensityTargeting(board_size, bot.fleet)
     return player_board, player, bot_board, bot
 
+class MenuScene(Scene):
+    """Botones del menú principal; se redibujan solo al cambiar la selección."""
+    def __init__(self, button_specs, font):
+        super().__init__()
+        self.button_specs = button_specs
+        self.font = font
+        self.selected_index = 0
+        self.hovered_index = self.button_at(pygame.mouse.get_pos())
+
+    def button_at(self, position):
+        return handle_button_interaction(*position, [(x, y, w, h) for x, y, w, h, _ in self.button_specs])
+
+    def handle_event(self, event):
+        before = (self.selected_index, self.hovered_index)
+        self.selected_index, confirm = handle_menu_navigation(event, self.selected_index, len(self.button_specs))
+        if confirm:
+            self.finish(self.button_specs[self.selected_index][4])
+            return
+
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            self.hovered_index = self.button_at(event.pos)
+            if self.hovered_index is not None:
+                self.selected_index = self.hovered_index
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    self.finish(self.button_specs[self.hovered_index][4])
+        if before != (self.selected_index, self.hovered_index):
+            self.dirty = True
+
+    def draw(self, screen):
+        ui.fill_background()
+        for i, (x, y, width, height, text) in enumerate(self.button_specs):
+            is_selected = i in (self.hovered_index, self.selected_index)
+            draw_button(screen, x, y, width, height, text, self.font, is_selected)
+
 def main_menu():
     """Despliega el menú principal y maneja la navegación entre opciones."""
     ui.init_screen(backgraound_image="menu")
-    font = pygame.font.Font(config.font_bold, 30)
+    font = get_font(config.font_bold, 30)
     
-    # Carga el archivo MP3
-    pygame.mixer.music.load("./assets/sounds/menu.mp3")
-    # Reproduce el MP3 en bucle (-1 significa bucle infinito)
-    pygame.mixer.music.play(loops=-1)
+    # Reproduce la música del menú en bucle
+    assets.play_music("menu")
 
     # Definir los botones del menú
     button_specs = [
@@ -36,69 +89,25 @@ def main_menu():
         (config.WINDOW_WIDTH // 2 - 110, 500, 280, 60, "Exit"),
     ]
 
-    selected_index = 0
-    last_input = "keyboard"
-    num_buttons = len(button_specs)
-
-    while True:
-        ui.fill_background()
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-
-        # Dibujar los botones
-        for i, (x, y, width, height, text) in enumerate(button_specs):
-            is_hovered = is_mouse_over_button(mouse_x, mouse_y, x, y, width, height)
-            is_selected = is_hovered or i == selected_index
-            draw_button(ui.screen, x, y, width, height, text, font, is_selected)
-
-        ui.update_display()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-
-            selected_index, confirm = handle_menu_navigation(event, selected_index, num_buttons)
-            if confirm:
-                return button_specs[selected_index][4]
+    return dispatcher.run(MenuScene(button_specs, font))
 
-            hovered_index = handle_button_interaction(
-                mouse_x, mouse_y, [(x, y, w, h) for x, y, w, h, _ in button_specs]
-            )
-            if hovered_index is not None:
-                if last_input != "mouse" or hovered_index != selected_index:
-                    selected_index = hovered_index
-                    last_input = "mouse"
-
-                if event.type == pygame.MOUSEBUTTONDOWN:                    
-                    return button_specs[hovered_index][4]
-
-def start_game(player_board, player, bot_board, bot):
-    """Inicia el flujo principal del juego."""
+def start_game(player_board, player, bot_board, bot, current_turn="placing_player_ships", current_round=1):
+    """Inicia el flujo principal del juego; también continúa una partida guardada."""
     pygame.mixer.music.stop()
     running = True
-    current_turn = "placing_player_ships"
-    current_round = 1
 
-    fondo = pygame.image.load("./assets/images/battle_1.png")
     ui.init_screen()
-    pygame.mixer.music.load("./assets/sounds/battle.mp3")
-    pygame.mixer.music.play(loops=-1)
-    
-
-    # Asegúrate de que la imagen se ajusta al tamaño de la ventana
-    fondo = pygame.transform.scale(fondo, (config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
+    assets.play_music("battle")
 
     while running:
-        ui.fill_background()
-        ui.draw_game_state(
+        # Solo se presentan las zonas del estado de la partida; cada escena muestra la suya
+        ui.present(ui.draw_game_state(
             ui.screen, player, bot, player_board, bot_board, current_turn, current_round
-        )
-        ui.update_display()
+        ))
 
         if current_turn == "placing_player_ships":
             if place_ships(ui.screen, player_board, player.fleet, player, bot, bot_board):
                 current_turn = "placing_bot_ships"
-                ui.fill_background()
                 ui.draw_game_state(
                     ui.screen,
                     player,
@@ -109,8 +118,7 @@ def start_game(player_board, player, bot_board, bot):
                     current_round,
                 )
                 display_message(ui.screen, "Calculando posiciones...")
-                ui.update_display()
-                time.sleep(3)
+                scheduler.wait(3000)
                 bot.place_fleet_randomly()
                 current_turn = "player_turn"
 
@@ -123,24 +131,20 @@ def start_game(player_board, player, bot_board, bot):
                 bot_board=bot_board,
                 current_round=current_round
             )
-            ui.update_display()
-            time.sleep(1.5)
+            scheduler.wait(1500)
 
             # Al final del turno del jugador, ajustar estamina
             if current_turn == "bot_turn":
                 if player.last_attack_type == "normal_attack":
-                    ui.update_display()
                     player.stamina += 2
                 else:
                     player.stamina += 1
-                    ui.update_display()
 
         elif current_turn == "bot_turn":
             # Lógica de ataque del bot
             current_turn = bot_attack(
                 ui.screen, bot, player, player_board, current_round
             )
-            ui.update_display()
             current_round += 1  # Incrementar la ronda
 
             # Al final del turno del bot, ajustar estamina
@@ -163,6 +167,8 @@ def start_game(player_board, player, bot_board, bot):
                 pygame.quit()
                 exit()
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                if not current_turn.startswith("placing"):
+                    save_current_game(player, bot, current_turn, current_round)
                 pygame.mixer.music.stop()
                 while True:
                     player_board, player, bot_board, bot = initialize_game()
@@ -179,38 +185,63 @@ def start_game(player_board, player, bot_board, bot):
                         exit()
                     running = False
 
+def save_current_game(player, bot, current_turn, current_round):
+    """
+    Guarda la partida en curso para poder continuarla con --load. La fase
+    guarda si el jugador ya tiró los dados, para no regalarle otra tirada.
+    """
+    turn = 0 if current_turn.startswith("player_turn") else 1
+    phase = "attack" if current_turn == "player_turn_attack" else "roll"
+    save_game(config.SAVE_PATH, (player, bot), turn=turn, current_round=current_round, phase=phase, rng=player.rng)
+    display_message(ui.screen, f"Partida guardada en {config.SAVE_PATH}")
+
+def resume_game(path):
+    """Continúa la partida guardada en `path` (opción --load) en el turno y la fase en que se guardó."""
+    state = load_game(path)
+    player, bot = state["players"]
+    if state["turn"] == 1:
+        current_turn = "bot_turn"
+    elif state["phase"] == "attack":
+        current_turn = "player_turn_attack"
+    else:
+        current_turn = "player_turn"
+    start_game(player.board, player, bot.board, bot, current_turn, state["current_round"])
+
 def display_winner(winner_name):
     """Muestra la pantalla de victoria."""
-    font = pygame.font.Font(config.font_bold, 48)
+    font = get_font(config.font_bold, 48)
     message = f"¡{winner_name} ha ganado!"
-    text_surface = font.render(message, True, config.colors["text"])
+    text_surface = render_text(font, message, config.colors["text"])
     text_rect = text_surface.get_rect(center=(config.WINDOW_WIDTH // 2, config.WINDOW_HEIGHT // 2))
 
     ui.fill_background()
     ui.screen.blit(text_surface, text_rect)
     ui.update_display()
-    time.sleep(5)
+    scheduler.wait(5000)
 
-def display_text_screen(text_lines):
-    """Despliega una pantalla de texto simple."""
-    running = True
-    font = pygame.font.Font(config.font_regular, 24)
-    while running:
+class TextScene(Scene):
+    """Pantalla de texto estática: se dibuja una vez y espera ESC."""
+    def __init__(self, text_lines):
+        super().__init__()
+        self.text_lines = text_lines
+        self.font = get_font(config.font_regular, 24)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish()
+
+    def draw(self, screen):
         ui.fill_background()
         y_offset = 100
-        for line in text_lines:
-            text_surface = font.render(line, True, config.colors["text"])
+        for line in self.text_lines:
+            text_surface = render_text(self.font, line, config.colors["text"])
             text_rect = text_surface.get_rect(center=(config.WINDOW_WIDTH // 2, y_offset))
-            ui.screen.blit(text_surface, text_rect)
+            screen.blit(text_surface, text_rect)
             y_offset += 40
-        ui.update_display()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
+def display_text_screen(text_lines):
+    """Despliega una pantalla de texto simple."""
+    dispatcher.run(TextScene(text_lines))
 
 def show_rules():
     """Despliega las reglas del juego."""
@@ -243,20 +274,34 @@ def show_settings():
     """Muestra las configuraciones del juego."""
     settings = [
         "Configuraciones:",
-        "1. Tamaño del tablero: 15x15",
+        f"1. Tamaño del tablero: {config.game_board_size}x{config.game_board_size}",
         "2. Modo de juego: Clásico",
+        "3. Tableros grandes: rueda para desplazar (Shift: columnas), Ctrl + rueda o +/- para el zoom.",
         "Presiona ESC para regresar al menú principal.",
     ]
     display_text_screen(settings)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="The Seven Seas Showdown")
+    parser.add_argument("--seed", type=seed_argument, default=None, help="Semilla para repetir una partida.")
+    parser.add_argument("--board-size", type=int, default=config.game_board_size,
+                        help=f"Tamaño del tablero ({MIN_BOARD_SIZE} a {config.MAX_BOARD_SIZE}).")
+    parser.add_argument("--load", nargs="?", const=config.SAVE_PATH, default=None,
+                        help=f"Continúa una partida guardada (por defecto {config.SAVE_PATH}).")
+    args = parser.parse_args()
+    if not MIN_BOARD_SIZE <= args.board_size <= config.MAX_BOARD_SIZE:
+        parser.error(f"--board-size debe estar entre {MIN_BOARD_SIZE} y {config.MAX_BOARD_SIZE}.")
+    config.game_board_size = args.board_size
+
     pygame.init()
     pygame.font.init()
-    pygame.display.set_icon(config.icon)
+    pygame.display.set_icon(assets.image("icon"))
 
+    if args.load:
+        resume_game(args.load)
 
     while True:
-        player_board, player, bot_board, bot = initialize_game()
+        player_board, player, bot_board, bot = initialize_game(args.seed)
         action = main_menu()        
 
         if action == "Start Game":
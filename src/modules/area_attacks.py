@@ -0,0 +1,53 @@
+import numpy as np
+
+# Resultado de cada celda de un ataque de área
+RESULT_MISS, RESULT_HIT, RESULT_SHIELDED, RESULT_ALREADY = 0, 1, 2, 3
+RESULT_NAMES = ("miss", "hit", "shielded", "already_attacked")
+
+def stencil(mask, anchor=None):
+    """
+    Forma de ataque a partir de una máscara (lista o arreglo de 0/1).
+    `anchor` es la celda de la máscara que cae en la celda elegida; por
+    defecto, su centro. Devuelve los desplazamientos (filas, columnas).
+    """
+    mask = np.asarray(mask, dtype=bool)
+    if anchor is None:
+        anchor = (mask.shape[0] // 2, mask.shape[1] // 2)
+    rows, cols = np.nonzero(mask)
+    return rows - anchor[0], cols - anchor[1]
+
+_LINE = [[1, 1, 1]]
+
+# Formas conocidas: (tipo de ataque, orientación) -> desplazamientos
+ATTACK_SHAPES = {
+    ("normal_attack", "H"): stencil([[1]]),
+    ("line_attack", "H"): stencil(_LINE),  # Línea de 3 centrada en la celda elegida
+    ("line_attack", "V"): stencil(np.transpose(_LINE)),
+    ("square_attack", "H"): stencil([[1, 1], [1, 1]], anchor=(0, 0)),  # 2x2 desde la esquina superior izquierda
+    ("cross_attack", "H"): stencil([[0, 1, 0], [1, 1, 1], [0, 1, 0]]),
+}
+
+def attack_shape(attack_type, orientation="H"):
+    """Desplazamientos de la forma de un tipo de ataque."""
+    shape = ATTACK_SHAPES.get((attack_type, orientation)) or ATTACK_SHAPES.get((attack_type, "H"))
+    if shape is None:
+        raise ValueError(f"Tipo de ataque desconocido: {attack_type}")
+    return shape
+
+def covered_cells(shape, row, col, board_size):
+    """Filas y columnas (arreglos) que cubre una forma en (row, col), dentro del tablero."""
+    offset_rows, offset_cols = shape
+    rows = offset_rows + row
+    cols = offset_cols + col
+    inside = (rows >= 0) & (rows < board_size) & (cols >= 0) & (cols < board_size)
+    return rows[inside], cols[inside]
+
+def count_results(codes):
+    """Cuenta los resultados de un ataque de área por tipo."""
+    counts = np.bincount(np.asarray(codes, dtype=np.int64), minlength=len(RESULT_NAMES))
+    return {
+        "hits": int(counts[RESULT_HIT]),
+        "misses": int(counts[RESULT_MISS]),
+        "shielded": int(counts[RESULT_SHIELDED]),
+        "already_attacked": int(counts[RESULT_ALREADY]),
+    }
@@ -0,0 +1,146 @@
+import numpy as np
+from modules.utils import is_within_bounds
+from modules.area_attacks import RESULT_MISS, RESULT_HIT, RESULT_ALREADY
+
+# Estados de las celdas del tablero (los mismos que usa Board)
+WATER, SHIP, MISS, HIT, SHIELDED = 0, 1, 2, 3, 4
+
+# Estados del tablero de ataque (los mismos que escribe update_attack_board)
+UNKNOWN, ATTACK_MISS, ATTACK_HIT, ATTACK_SHIELDED, RADAR = 0, 1, 2, 4, 5
+ATTACK_RESULTS = {"miss": ATTACK_MISS, "hit": ATTACK_HIT, "shielded": ATTACK_SHIELDED}
+
+class ArrayBoard:
+    """
+    Tablero compacto respaldado por arreglos int8: un plano de estados y un
+    plano con el identificador del barco de cada celda (0 = sin barco).
+    Ofrece la misma interfaz lógica que Board (update_cell, receive_attack).
+    """
+    def __init__(self, board_size=20):
+        self.board_size = board_size
+        self.state = np.zeros((board_size, board_size), dtype=np.int8)
+        self.ships = np.zeros((board_size, board_size), dtype=np.int8)
+        # Identificador -> nombre del barco. Los barcos de la flota usan su
+        # ship_id (positivo); a los que llegan solo con nombre se les da uno
+        # negativo, que se informa como 0 igual que en Board
+        self.ship_names = {0: None}
+        self._ship_ids = {}
+
+    def _ship_id(self, ship):
+        """Identificador para un barco del que solo se conoce el nombre."""
+        if ship is None:
+            return 0
+        if ship not in self._ship_ids:
+            self._ship_ids[ship] = -1 - len(self._ship_ids)
+            self.ship_names[self._ship_ids[ship]] = ship
+        return self._ship_ids[ship]
+
+    def update_cell(self, row, col, state, ship=None, ship_id=0):
+        """Actualiza el estado de una celda específica en el tablero."""
+        if is_within_bounds(row, col, self.board_size):
+            if ship_id:
+                self.ship_names[ship_id] = ship
+            else:
+                ship_id = self._ship_id(ship)
+            self.state[row, col] = state
+            self.ships[row, col] = ship_id
+
+    def get_cell(self, row, col):
+        """Devuelve el estado y el barco de una celda con el formato de Board."""
+        return {
+            "state": int(self.state[row, col]),
+            "ship": self.ship_names[self.ships[row, col]],
+            "ship_id": self.ship_id_at(row, col),
+        }
+
+    def ship_id_at(self, row, col):
+        """Identificador del barco de una celda (0 si no hay barco)."""
+        return max(0, int(self.ships[row, col]))
+
+    def receive_attack(self, row, col):
+        """Marca una celda como atacada y devuelve el resultado del disparo."""
+        state = self.state[row, col]
+        if state == SHIP:
+            self.state[row, col] = HIT
+            return "hit"
+        elif state == WATER:
+            self.state[row, col] = MISS
+            return "miss"
+        return "already_attacked"
+
+    def receive_cells(self, rows, cols):
+        """
+        Resuelve de una vez un ataque sobre varias celdas (arreglos de filas y
+        columnas sin repetir). Devuelve el código de resultado de cada celda.
+        """
+        state = self.state[rows, cols]
+        codes = np.full(len(state), RESULT_ALREADY, dtype=np.int8)
+        ship = state == SHIP
+        water = state == WATER
+        codes[ship] = RESULT_HIT
+        codes[water] = RESULT_MISS
+        self.state[rows[ship], cols[ship]] = HIT
+        self.state[rows[water], cols[water]] = MISS
+        return codes
+
+    def unattacked_cells(self):
+        """Devuelve un arreglo (N, 2) con las celdas que aún no han sido atacadas."""
+        return np.argwhere(self.state <= SHIP)
+
+    def remaining_ship_cells(self):
+        """Devuelve un arreglo (N, 2) con las celdas de barco sin impactar."""
+        return np.argwhere(self.state == SHIP)
+
+    def remaining_ship_count(self):
+        """Cantidad de celdas de barco que siguen a flote."""
+        return int(np.count_nonzero(self.state == SHIP))
+
+    @classmethod
+    def from_board(cls, board):
+        """Crea un ArrayBoard a partir de un Board basado en diccionarios."""
+        array_board = cls(board.board_size)
+        for row in range(board.board_size):
+            for col in range(board.board_size):
+                cell = board.grid[row][col]
+                array_board.update_cell(row, col, cell["state"], cell["ship"], cell.get("ship_id", 0))
+        return array_board
+
+    def to_grid(self):
+        """Devuelve la representación en listas de diccionarios que usa Board."""
+        return [
+            [self.get_cell(row, col) for col in range(self.board_size)]
+            for row in range(self.board_size)
+        ]
+
+class ArrayAttackBoard:
+    """
+    Tablero de ataque compacto: un plano int8 con lo que el jugador sabe del
+    tablero rival (0 desconocido, 1 agua, 2 impacto, 4 escudo, 5 radar).
+    """
+    def __init__(self, board_size=20):
+        self.board_size = board_size
+        self.state = np.zeros((board_size, board_size), dtype=np.int8)
+
+    def get_state(self, row, col):
+        return int(self.state[row, col])
+
+    def record(self, row, col, result):
+        """Registra el resultado de un ataque en la celda indicada."""
+        if result in ATTACK_RESULTS:
+            self.state[row, col] = ATTACK_RESULTS[result]
+
+    def unattacked_cells(self):
+        """Devuelve un arreglo (N, 2) con las celdas todavía sin atacar."""
+        return np.argwhere(self.state == UNKNOWN)
+
+    def hit_cells(self):
+        """Devuelve un arreglo (N, 2) con las celdas donde se acertó."""
+        return np.argwhere(self.state == ATTACK_HIT)
+
+    @classmethod
+    def from_attack_board(cls, attack_board):
+        """Crea un ArrayAttackBoard a partir de la lista de diccionarios de Player."""
+        array_board = cls(len(attack_board))
+        for row, cells in enumerate(attack_board):
+            for col, cell in enumerate(cells):
+                array_board.state[row, col] = cell["state"]
+        return array_board
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import pygame
+from modules.fonts import get_font
+
+IMAGES = {
+    "icon": "./assets/images/icon.png",
+    "menu": "./assets/images/menu_1.png",
+    "battle": "./assets/images/battle_1.png",
+}
+
+MUSIC = {
+    "menu": "./assets/sounds/menu.mp3",
+    "battle": "./assets/sounds/battle.mp3",
+}
+
+PACK_PATH = "./assets/pack.bin"
+PACK_MAGIC = b"SSSPACK1"
+
+def _pack_key(name, size, alpha):
+    width, height = size
+    return f"{name}@{width}x{height}{'a' if alpha else ''}"
+
+def _source_stamp(path):
+    """
+    Huella del contenido del archivo original, para detectar paquetes
+    desactualizados. No usa la fecha: un clon o una copia la cambian sin
+    tocar la imagen.
+    """
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+class AssetManager:
+    """
+    Carga perezosa de imágenes, fuentes y música, una sola vez por proceso.
+    Las imágenes se guardan ya escaladas y convertidas al formato de la
+    pantalla. Si existe un paquete preprocesado, las imágenes escaladas se
+    leen de él sin decodificar el PNG ni reescalar.
+    """
+    def __init__(self, pack_path=PACK_PATH):
+        self.pack_path = pack_path
+        self.sources = {}  # nombre -> imagen original sin convertir
+        self.images = {}  # (nombre, tamaño, alfa) -> imagen lista para dibujar
+        self.current_music = None
+        self._pack = None  # índice del paquete, o {} si no hay paquete
+        self._quit_registered = False
+
+    def _load_pack_index(self):
+        """Lee el índice del paquete preprocesado, si existe y es válido."""
+        if self._pack is not None:
+            return self._pack
+        self._pack = {}
+        if not os.path.exists(self.pack_path):
+            return self._pack
+        with open(self.pack_path, "rb") as file:
+            if file.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                return self._pack
+            index_size = int.from_bytes(file.read(4), "little")
+            index = json.loads(file.read(index_size).decode("utf-8"))
+        data_start = len(PACK_MAGIC) + 4 + index_size
+        stamps = {}  # Cada original se lee una sola vez aunque tenga varias entradas
+        for key, entry in index.items():
+            source = IMAGES.get(entry["name"])
+            if source and source not in stamps:
+                stamps[source] = _source_stamp(source) if os.path.exists(source) else None
+            # Se ignoran las entradas cuyo archivo original cambió
+            if source and stamps[source] == entry["source"]:
+                entry["offset"] += data_start
+                self._pack[key] = entry
+        return self._pack
+
+    def _from_pack(self, name, size, alpha):
+        entry = self._load_pack_index().get(_pack_key(name, size, alpha))
+        if entry is None:
+            return None
+        with open(self.pack_path, "rb") as file:
+            file.seek(entry["offset"])
+            data = file.read(entry["length"])
+        return pygame.image.frombytes(data, tuple(entry["size"]), entry["format"])
+
+    def _register_quit(self):
+        if not self._quit_registered:
+            # Las superficies convertidas dependen de la pantalla actual
+            pygame.register_quit(self.clear)
+            self._quit_registered = True
+
+    def source(self, name):
+        """Imagen original tal como está en el disco."""
+        image = self.sources.get(name)
+        if image is None:
+            self._register_quit()
+            image = pygame.image.load(IMAGES[name])
+            self.sources[name] = image
+        return image
+
+    def image(self, name, size=None, alpha=False):
+        """
+        Devuelve la imagen `name` escalada a `size` y convertida para dibujarla
+        rápido. Antes de abrir la pantalla devuelve la imagen sin convertir.
+        """
+        key = (name, tuple(size) if size else None, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+
+        image = self._from_pack(name, size, alpha) if size else None
+        if image is None:
+            image = self.source(name)
+            if size and image.get_size() != tuple(size):
+                image = pygame.transform.scale(image, size)
+
+        if pygame.display.get_surface() is None:
+            return image  # No se puede convertir todavía; no se guarda
+        image = image.convert_alpha() if alpha else image.convert()
+        self._register_quit()
+        self.images[key] = image
+        return image
+
+    def preload(self, names, size=None, alpha=False):
+        """Prepara varias imágenes de antemano para que los cambios de pantalla sean inmediatos."""
+        for name in names:
+            self.image(name, size, alpha)
+
+    def font(self, path, size):
+        """Fuente del registro compartido de fuentes."""
+        return get_font(path, size)
+
+    def play_music(self, name, loops=-1):
+        """
+        Reproduce la pista `name`; solo la vuelve a cargar si cambió.
+        Devuelve False si la música no está disponible.
+        """
+        if self.current_music != name:
+            try:
+                pygame.mixer.music.load(MUSIC[name])
+            except (pygame.error, FileNotFoundError):
+                self.current_music = None
+                return False
+            self.current_music = name
+        pygame.mixer.music.play(loops=loops)
+        return True
+
+    def clear(self):
+        """Vacía las cachés; se llama sola al ejecutar pygame.quit()."""
+        self.sources.clear()
+        self.images.clear()
+        self.current_music = None
+        self._pack = None
+        self._quit_registered = False
+
+def build_asset_pack(entries, pack_path=PACK_PATH):
+    """
+    Escribe un paquete con las imágenes ya escaladas en bytes sin comprimir.
+    `entries` es una lista de (nombre, tamaño, alfa).
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for name, size, alpha in entries:
+        image = pygame.image.load(IMAGES[name])
+        if image.get_size() != tuple(size):
+            image = pygame.transform.scale(image, size)
+        pixel_format = "RGBA" if alpha else "RGB"
+        data = pygame.image.tobytes(image, pixel_format)
+        index[_pack_key(name, size, alpha)] = {
+            "name": name,
+            "size": list(size),
+            "format": pixel_format,
+            "offset": offset,
+            "length": len(data),
+            "source": _source_stamp(IMAGES[name]),
+        }
+        blobs.append(data)
+        offset += len(data)
+
+    header = json.dumps(index).encode("utf-8")
+    with open(pack_path, "wb") as file:
+        file.write(PACK_MAGIC)
+        file.write(len(header).to_bytes(4, "little"))
+        file.write(header)
+        for data in blobs:
+            file.write(data)
+    return index
+
+# Instancia global
+assets = AssetManager()
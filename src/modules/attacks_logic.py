@@ -1,17 +1,20 @@
 import pygame
 from modules.config import config
 from modules.utils import (
-    is_within_bounds,
     display_message,
     draw_preview,
     handle_navigation_and_selection,
     toggle_orientation
 )
 from modules.ui import ui
+from modules.scheduler import scheduler
+from modules.profiler import profiler
 import math
-import random
-import time
+import numpy as np
+from modules.area_attacks import RESULT_NAMES, attack_shape, covered_cells, count_results
 from modules.dice import process_dice_roll
+from modules.bot_planner import BotPlanner
+from modules.scenes import Scene, dispatcher
 
 def handle_attack_action(screen, player, bot, bot_board, attack_type, current_round):
     """
@@ -50,10 +53,14 @@ def handle_normal_attack(screen, player, bot, bot_board, current_round):
 
     result = bot.receive_attack(selected_row, selected_col)
     update_attack_board(player, selected_row, selected_col, result)
+    sunk = report_sunk_ships(player, bot)
     # Limpiar la pantalla y dibujar el estado del juego
     screen.fill(config.colors["background"])
     ui.draw_game_state(screen, player, bot, player.board, bot_board, "player_turn_attack", current_round)
     ui.update_display()
+    if sunk:
+        display_message(screen, sunk_message(sunk))
+        return "player_turn_attack"
     if result == "hit":
         display_message(screen, "¡Impacto!")
         return "player_turn_attack"
@@ -80,34 +87,17 @@ def handle_line_attack(screen, player, bot, bot_board, current_round):
     player.stamina -= attack_cost
 
     # Ataque a 3 celdas en línea centradas en la celda seleccionada
-    cells_to_attack = []
-    offsets = [-1, 0, 1]
-    if orientation == "H":
-        for offset in offsets:
-            col = selected_col + offset
-            if is_within_bounds(selected_row, col, bot_board.board_size):
-                cells_to_attack.append((selected_row, col))
-    else:
-        for offset in offsets:
-            row = selected_row + offset
-            if is_within_bounds(row, selected_col, bot_board.board_size):
-                cells_to_attack.append((row, selected_col))
-
-    any_hit = False
-    for row, col in cells_to_attack:
-        if player.attack_board[row][col]["state"] in [0, 5]:  # Permitir atacar celdas detectadas por radar
-            result = bot.receive_attack(row, col)
-            update_attack_board(player, row, col, result)
-            if result == "hit":
-                any_hit = True
-            elif result == "shielded":
-                any_hit = True
+    outcome = resolve_area_attack(player, bot, "line_attack", selected_row, selected_col, orientation)
+    any_hit = outcome["hits"] > 0 or outcome["shielded"] > 0
 
     # Limpiar la pantalla y dibujar el estado del juego
     screen.fill(config.colors["background"])
     ui.draw_game_state(screen, player, bot, player.board, bot_board, "player_turn_attack", current_round)
     ui.update_display()
 
+    if outcome["sunk"]:
+        display_message(screen, sunk_message(outcome["sunk"]))
+        return "player_turn_attack"
     if any_hit:
         display_message(screen, "¡Ataque lineal acertó!")
         return "player_turn_attack"
@@ -134,28 +124,17 @@ def handle_square_attack(screen, player, bot, bot_board, current_round):
     # Reduce estamina
     player.stamina -= attack_cost
 
-    cells_to_attack = [
-        (selected_row + i, selected_col + j)
-        for i in range(2)
-        for j in range(2)
-        if is_within_bounds(selected_row + i, selected_col + j, bot_board.board_size)
-    ]
-
-    any_hit = False
-    for row, col in cells_to_attack:
-        if player.attack_board[row][col]["state"] in [0, 5]:  # Permitir atacar celdas detectadas por radar
-            result = bot.receive_attack(row, col)
-            update_attack_board(player, row, col, result)
-            if result == "hit":
-                any_hit = True
-            elif result == "shielded":
-                any_hit = True
+    outcome = resolve_area_attack(player, bot, "square_attack", selected_row, selected_col)
+    any_hit = outcome["hits"] > 0 or outcome["shielded"] > 0
 
     # Limpiar la pantalla y dibujar el estado del juego
     screen.fill(config.colors["background"])
     ui.draw_game_state(screen, player, bot, player.board, bot_board, "player_turn_attack", current_round)
     ui.update_display()
 
+    if outcome["sunk"]:
+        display_message(screen, sunk_message(outcome["sunk"]))
+        return "player_turn_attack"
     if any_hit:
         display_message(screen, "¡Ataque cuadrado acertó!")
         return "player_turn_attack"
@@ -182,123 +161,144 @@ def handle_shield(screen, player, bot, bot_board, current_round):
     # Permite atacar en el mismo turno
     return "player_turn_attack"
 
-def select_attack_cell(screen, bot_board, player, bot, attack_type="normal_attack", current_round=1):
+class AttackSelectionScene(Scene):
     """
-    Permite al jugador seleccionar una celda objetivo en el tablero del bot.
+    Selección del objetivo sobre el tablero del bot. Solo se redibuja cuando
+    cambia la selección o la vista: al mover el cursor se reponen las celdas
+    de la previsualización anterior y se pinta la nueva.
+    `rotatable` permite girar la previsualización con 'v' o clic derecho.
     """
-    selected_row, selected_col = 0, 0
-    clock = pygame.time.Clock()
-
-    running = True
-    orientation = None
-    while running:
-        # Manejar eventos
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-
-            # Actualizar selección basada en la entrada
-            selected_row, selected_col, orientation, confirm = handle_navigation_and_selection(
-                event,
-                selected_row,
-                selected_col,
-                bot_board.board_size,
-                None,  # La orientación no es relevante para estos ataques
-                attack_type,
-                bot_board,
-                screen
-            )
-
-            if confirm:
-                return selected_row, selected_col, orientation, True
-
-        # Actualizar la pantalla después de manejar los eventos
-        screen.fill(config.colors["background"])
-        ui.draw_game_state(screen, player, bot, player.board, bot_board, "attack_selection", current_round)
-
-        # Dibujar el tablero de ataque
-        ui.draw_attack_board(screen, bot_board, player.attack_board)
+    def __init__(self, bot_board, player, bot, attack_type, current_round, orientation=None, rotatable=False):
+        super().__init__()
+        self.bot_board, self.player, self.bot = bot_board, player, bot
+        self.attack_type = attack_type
+        self.current_round = current_round
+        self.orientation = orientation
+        self.rotatable = rotatable
+        self.selected_row, self.selected_col = 0, 0
+        self.view_state = None  # (versión, tamaño de celda) de la vista dibujada
+        self.preview_rects = []
+
+    def handle_event(self, event):
+        before = (self.selected_row, self.selected_col, self.orientation)
+        self.selected_row, self.selected_col, self.orientation, confirm = handle_navigation_and_selection(
+            event,
+            self.selected_row,
+            self.selected_col,
+            self.bot_board.board_size,
+            self.orientation,
+            self.attack_type,
+            self.bot_board,
+            ui.screen
+        )
+        if confirm:
+            self.finish((self.selected_row, self.selected_col, self.orientation, True))
+            return
+
+        # Rotación con la tecla 'v' o con clic derecho
+        if self.rotatable and (
+            (event.type == pygame.KEYDOWN and event.key == pygame.K_v)
+            or (event.type == pygame.MOUSEBUTTONDOWN and event.button == 3)
+        ):
+            self.orientation = toggle_orientation(self.orientation)
+        if event.type != pygame.MOUSEMOTION or before != (self.selected_row, self.selected_col, self.orientation):
+            self.dirty = True
+
+    def draw(self, screen):
+        viewport = self.bot_board.viewport
+        view_state = (viewport.version, viewport.cell_size)
+        if view_state != self.view_state:
+            # Primer cuadro o cambio de vista: se dibuja todo el estado de la partida
+            ui.draw_game_state(screen, self.player, self.bot, self.player.board, self.bot_board, "attack_selection", self.current_round)
+            self.view_state = view_state
+            rects = [ui.attack_board_rect(self.bot_board)]
+        else:
+            # Solo se borra la previsualización anterior con las celdas en caché del tablero
+            rects = ui.restore_attack_rects(screen, self.player.attack_board, self.preview_rects)
 
         # Dibujar la previsualización de ataque
-        draw_preview(
+        self.preview_rects = draw_preview(
             screen,
-            bot_board,
-            selected_row,
-            selected_col,
-            orientation=None,  # No es necesario para estos ataques
-            preview_type=attack_type,
-            attack_board=player.attack_board
+            self.bot_board,
+            self.selected_row,
+            self.selected_col,
+            self.orientation if self.rotatable else None,  # Solo el ataque lineal se orienta
+            preview_type=self.attack_type,
+            attack_board=self.player.attack_board
         )
+        return rects + self.preview_rects
 
-        pygame.display.flip()
-        clock.tick(60)
+def select_attack_cell(screen, bot_board, player, bot, attack_type="normal_attack", current_round=1):
+    """
+    Permite al jugador seleccionar una celda objetivo en el tablero del bot.
+    """
+    return dispatcher.run(AttackSelectionScene(bot_board, player, bot, attack_type, current_round), screen)
 
 def select_attack_line(screen, bot_board, player, bot, attack_type="line_attack", current_round=1):
     """
     Permite al jugador seleccionar una línea de 3 celdas para un ataque lineal.
     Permite rotar la orientación con la tecla 'v' o clic derecho.
     """
-    selected_row, selected_col = 0, 0
-    orientation = "H"  # 'H' para Horizontal, 'V' para Vertical
-    clock = pygame.time.Clock()
-
-    running = True
-    while running:
-        # Manejar eventos
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-
-            # Actualizar selección basada en la entrada
-            selected_row, selected_col, orientation, confirm = handle_navigation_and_selection(
-                event,
-                selected_row,
-                selected_col,
-                bot_board.board_size,
-                orientation,
-                attack_type,
-                bot_board,
-                screen
-            )
-
-            # Manejar rotación con tecla 'v'
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_v:
-                    orientation = toggle_orientation(orientation)
-
-            # Manejar rotación con clic derecho del ratón
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:  # Clic derecho
-                orientation = toggle_orientation(orientation)
-
-            if confirm:
-                return selected_row, selected_col, orientation, True
-
-        # Actualizar la pantalla después de manejar los eventos
-        screen.fill(config.colors["background"])
-        ui.draw_game_state(screen, player, bot, player.board, bot_board, "attack_selection", current_round)
-
-        # Dibujar el tablero de ataque
-        ui.draw_attack_board(screen, bot_board, player.attack_board)
-
-        # Dibujar la previsualización de ataque
-        draw_preview(
-            screen,
-            bot_board,
-            selected_row,
-            selected_col,
-            orientation,
-            preview_type=attack_type,
-            attack_board=player.attack_board
-        )
-
-        pygame.display.flip()
-        clock.tick(60)
+    scene = AttackSelectionScene(bot_board, player, bot, attack_type, current_round, orientation="H", rotatable=True)
+    return dispatcher.run(scene, screen)
+
+def get_attack_state(player, row, col):
+    """Devuelve el estado de una celda del tablero de ataque del jugador."""
+    if isinstance(player.attack_board, list):
+        return player.attack_board[row][col]["state"]
+    return player.attack_board.get_state(row, col)
+
+def _attackable(player, rows, cols):
+    """Máscara de las celdas que aún se pueden atacar: desconocidas o detectadas por radar."""
+    if isinstance(player.attack_board, list):
+        states = np.array([player.attack_board[row][col]["state"] for row, col in zip(rows.tolist(), cols.tolist())])
+    else:
+        states = player.attack_board.state[rows, cols]
+    return (states == 0) | (states == 5)
 
+def resolve_area_attack(attacker, defender, attack_type, row, col, orientation="H", only_unknown=True):
+    """
+    Resuelve un ataque de cualquier forma (línea, cuadrado, cruz o una forma
+    propia de `area_attacks.ATTACK_SHAPES`) de una sola pasada sobre el tablero
+    del defensor. Con `only_unknown` se saltan las celdas ya conocidas.
+    Devuelve las celdas atacadas con su resultado y el total de cada resultado.
+    """
+    rows, cols = covered_cells(attack_shape(attack_type, orientation), row, col, defender.board.board_size)
+    if only_unknown and len(rows):
+        keep = _attackable(attacker, rows, cols)
+        rows, cols = rows[keep], cols[keep]
+    codes = defender.receive_area_attack(rows, cols)
+
+    cells = []
+    for r, c, code in zip(rows.tolist(), cols.tolist(), codes.tolist()):
+        result = RESULT_NAMES[code]
+        update_attack_board(attacker, r, c, result)
+        cells.append((r, c, result))
+    outcome = count_results(codes)
+    outcome["cells"] = cells
+    outcome["sunk"] = report_sunk_ships(attacker, defender)
+    return outcome
+
+def report_sunk_ships(attacker, defender):
+    """Avisa a la puntería del atacante de los barcos que acaba de hundir y los devuelve."""
+    sunk = defender.pop_sunk()
+    if attacker.targeting is not None:
+        for ship in sunk:
+            attacker.targeting.on_ship_sunk(ship.size, ship.positions)
+    return sunk
+
+def sunk_message(sunk, prefix="¡Hundiste"):
+    """Mensaje con los barcos hundidos en un ataque."""
+    names = ", ".join(ship.name for ship in sunk)
+    return f"{prefix} {'el barco' if len(sunk) == 1 else 'los barcos'} {names}!"
+
+@profiler.timed("attacks.update_attack_board")
 def update_attack_board(player, row, col, result):
     """Actualiza el tablero de ataque del jugador basado en el resultado del ataque."""
-    if result == "hit":
+    if not isinstance(player.attack_board, list):
+        # Tablero de ataque compacto (ArrayAttackBoard)
+        player.attack_board.record(row, col, result)
+    elif result == "hit":
         player.attack_board[row][col]["state"] = 2  # Impacto
         player.attack_board[row][col]["color"] = config.colors["hit"]  # El mismo color para ambos
     elif result == "miss":
@@ -307,105 +307,140 @@ def update_attack_board(player, row, col, result):
     elif result == "shielded":
         player.attack_board[row][col]["state"] = 4  # Escudo
         player.attack_board[row][col]["color"] = config.colors["shielded"]  # El mismo color para ambos
+    if result in ("hit", "miss", "shielded"):
+        player.unattacked.discard(row, col)
+    ui.mark_attack_cell_dirty(player.attack_board, row, col)
+    if player.targeting is not None:
+        player.targeting.record(row, col, result)
+
+BOT_ABILITIES = ["normal_attack", "line_attack", "square_attack", "use_shield"]
+BOT_ABILITY_COSTS = {
+    "normal_attack": 0,
+    "line_attack": 3,
+    "square_attack": 4,
+    "use_shield": 2,
+}
+
+def choose_bot_ability(bot):
+    """Decide qué habilidad usa el bot según su estamina."""
+    if bot.stamina < 4:
+        attack_type = "normal_attack"
+    else:
+        attack_type = bot.rng.choice(BOT_ABILITIES)
+    # Forzar ataque normal si no tiene suficiente estamina
+    if bot.stamina < BOT_ABILITY_COSTS[attack_type]:
+        attack_type = "normal_attack"
+    return attack_type
+
+@profiler.timed("bot.choose_target")
+def choose_bot_target(bot, attack_type, board_size):
+    """
+    Elige el objetivo del bot para un tipo de ataque: (fila, columna), con la
+    orientación en el ataque lineal, o None si no queda dónde atacar.
+    """
+    if attack_type == "use_shield":
+        return ()
+    if bot.targeting is not None:
+        # Elegir según la estrategia del bot
+        if attack_type == "normal_attack":
+            return bot.targeting.choose_target(bot.rng)
+        if attack_type == "line_attack":
+            return bot.targeting.choose_line(bot.rng)
+        return bot.targeting.choose_square(bot.rng)
+
+    # Sin estrategia, al azar entre las celdas no atacadas
+    if not bot.unattacked:
+        return None
+    if attack_type == "line_attack":
+        orientation = bot.rng.choice(["H", "V"])
+        return (*bot.unattacked.sample(bot.rng), orientation)
+    selected_row, selected_col = bot.unattacked.sample(bot.rng)
+    if attack_type == "square_attack":
+        # Que el cuadrado quepa en el tablero
+        return min(selected_row, board_size - 2), min(selected_col, board_size - 2)
+    return selected_row, selected_col
+
+def decide_bot_move(bot, board_size):
+    """Jugada completa del bot: (habilidad, objetivo). Se calcula en el hilo de BotPlanner."""
+    attack_type = choose_bot_ability(bot)
+    return attack_type, choose_bot_target(bot, attack_type, board_size)
 
 def bot_attack(screen, bot, player, player_board, current_round):
     """
-    Lógica de ataque del bot.
+    Lógica de ataque del bot. Cada jugada se calcula en segundo plano
+    mientras se muestran los mensajes del turno anterior.
     """
     display_message(screen, "Tirando dados del bot...", delay=1500)
-    message = process_dice_roll(random.randint(1, 100), bot)
-    display_message(screen, message, delay=1500)
+    message = process_dice_roll(bot.rng.randint(1, 100), bot)
     if message == "Pierde turno.":
+        display_message(screen, message, delay=1500)
         return "player_turn"
-    
+
+    planner = BotPlanner(bot, decide_bot_move, player_board.board_size)
+    planner.start()
+    display_message(screen, message, delay=1500)
+
+    # Narrar la acción del bot
+    action_messages = {
+        "normal_attack": "El bot realiza ataque normal.",
+        "line_attack": "El bot utiliza ataque lineal.",
+        "square_attack": "El bot utiliza ataque cuadrado.",
+        "use_shield": "El bot activa escudo.",
+    }
+    bot_action_handlers = {
+        "normal_attack": bot_handle_normal_attack,
+        "line_attack": bot_handle_line_attack,
+        "square_attack": bot_handle_square_attack,
+        "use_shield": bot_handle_shield,
+    }
+
     continue_attacking = True  # Variable para controlar ataques adicionales
     while continue_attacking:
-        abilities = ["normal_attack", "line_attack", "square_attack", "use_shield"]
-        ability_costs = {
-            "normal_attack": 0,
-            "line_attack": 3,
-            "square_attack": 4,
-            "use_shield": 2,
-        }
-
-        # Decidir qué habilidad usar
-        if bot.stamina < 4:
-            attack_type = "normal_attack"
-        else:
-            attack_type = random.choice(abilities)
-
-        # Verificar si el bot tiene suficiente estamina
-        if bot.stamina < ability_costs[attack_type]:
-            attack_type = "normal_attack"  # Forzar ataque normal si no tiene suficiente estamina
+        attack_type, target = planner.take()
 
         # Registrar el tipo de ataque utilizado
         bot.last_attack_type = attack_type
-
-        # Narrar la acción del bot
-        action_messages = {
-            "normal_attack": "El bot realiza ataque normal.",
-            "line_attack": "El bot utiliza ataque lineal.",
-            "square_attack": "El bot utiliza ataque cuadrado.",
-            "use_shield": "El bot activa escudo.",
-        }
-
         display_message(screen, action_messages[attack_type], delay=2000)
 
         # Ejecutar la acción
-        bot_action_handlers = {
-            "normal_attack": bot_handle_normal_attack,
-            "line_attack": bot_handle_line_attack,
-            "square_attack": bot_handle_square_attack,
-            "use_shield": bot_handle_shield,
-        }
-
-        handler = bot_action_handlers.get(attack_type)
-        if handler:
-            hit_success = handler(screen, bot, player, player_board, current_round)
-            ui.update_display()
-            time.sleep(1)
-
-            if hit_success:
-                display_message(screen, "El bot ataca de nuevo.", delay=1500)
-            else:
-                continue_attacking = False  # Si el ataque falla, termina el turno del bot
-        else:
-            print(f"Tipo de ataque desconocido: {attack_type}")
-            continue_attacking = False
-            return "player_turn"
-
-        # Si se activó el escudo, el bot puede atacar de nuevo, sin cambiar el turno
-        if attack_type == "use_shield" and bot.temp_shield:
-            continue_attacking = True  # Permitir más ataques después de usar el escudo
-        
+        handler = bot_action_handlers[attack_type]
+        hit_success = handler(screen, bot, player, player_board, current_round, target=target)
+        # Si acertó o activó el escudo, el bot ataca de nuevo, sin cambiar el turno
+        continue_attacking = bool(hit_success) or (attack_type == "use_shield" and bot.temp_shield)
+        if continue_attacking:
+            planner.start()  # Pensar la siguiente jugada mientras se muestran los mensajes
+        ui.update_display()
+        scheduler.wait(1000)
+
+        if continue_attacking:
+            display_message(screen, "El bot ataca de nuevo.", delay=1500)
+
     return "player_turn"  # Cuando termine el ataque, pasa el turno al jugador
 
-def bot_handle_normal_attack(screen, bot, player, player_board, current_round):
-    """Maneja un ataque normal del bot."""
+def bot_handle_normal_attack(screen, bot, player, player_board, current_round, target=None):
+    """Maneja un ataque normal del bot; `target` es la celda ya elegida, si la hay."""
     attack_cost = 0
     bot.stamina -= attack_cost
 
-    # Seleccionar aleatoriamente una celda no atacada
-    valid_cells = [
-        (row, col)
-        for row in range(player_board.board_size)
-        for col in range(player_board.board_size)
-        if bot.attack_board[row][col]["state"] == 0
-    ]
-    if not valid_cells:
-        return False
-
-    selected_row, selected_col = random.choice(valid_cells)
+    if target is None:
+        target = choose_bot_target(bot, "normal_attack", player_board.board_size)
+        if target is None:
+            return False
+    selected_row, selected_col = target
 
     result = player.receive_attack(selected_row, selected_col)
     update_attack_board(bot, selected_row, selected_col, result)
+    sunk = report_sunk_ships(bot, player)
     # Limpiar la pantalla antes de dibujar
     screen.fill(config.colors["background"])
     ui.draw_game_state(screen, player, bot, player_board, bot.board, "bot_turn", current_round)
     ui.update_display()
 
     hit_success = False  # Variable para determinar si el bot acertó
-    if result == "hit":
+    if sunk:
+        display_message(screen, sunk_message(sunk, prefix="¡El bot hundió"), delay=1500)
+        hit_success = True
+    elif result == "hit":
         display_message(screen, "¡El bot te ha golpeado!", delay=1500)
         hit_success = True
     elif result == "shielded":
@@ -417,93 +452,68 @@ def bot_handle_normal_attack(screen, bot, player, player_board, current_round):
 
     return hit_success
 
-def bot_handle_line_attack(screen, bot, player, player_board, current_round):
+def bot_handle_line_attack(screen, bot, player, player_board, current_round, target=None):
     """
-    Maneja un ataque lineal del bot.
+    Maneja un ataque lineal del bot; `target` es (fila, columna, orientación) ya elegidos, si los hay.
     """
     attack_cost = 3
     bot.stamina -= attack_cost
 
-    # Seleccionar orientación y celda aleatoriamente
-    orientation = random.choice(["H", "V"])
-    selected_row = random.randint(0, player_board.board_size - 1)
-    selected_col = random.randint(0, player_board.board_size - 1)
+    if target is None:
+        target = choose_bot_target(bot, "line_attack", player_board.board_size)
+        if target is None:
+            return False
+    selected_row, selected_col, orientation = target
 
     # Ataque a 3 celdas en línea centradas en la celda seleccionada
-    cells_to_attack = []
-    offsets = [-1, 0, 1]
-    if orientation == "H":
-        for offset in offsets:
-            col = selected_col + offset
-            if is_within_bounds(selected_row, col, player_board.board_size):
-                cells_to_attack.append((selected_row, col))
-    else:
-        for offset in offsets:
-            row = selected_row + offset
-            if is_within_bounds(row, selected_col, player_board.board_size):
-                cells_to_attack.append((row, selected_col))
-
-    hit_success = False
-    for row, col in cells_to_attack:
-        if bot.attack_board[row][col]["state"] in [0, 5]:
-            result = player.receive_attack(row, col)
-            update_attack_board(bot, row, col, result)
-            if result == "hit":
-                hit_success = True
-            elif result == "shielded":
-                hit_success = False  # Escudo bloqueó el ataque
+    outcome = resolve_area_attack(bot, player, "line_attack", selected_row, selected_col, orientation)
+    # El escudo solo bloquea la primera celda; cualquier impacto cuenta como acierto
+    hit_success = outcome["hits"] > 0
     # Limpiar la pantalla antes de dibujar
     screen.fill(config.colors["background"])
     ui.draw_game_state(screen, player, bot, player_board, bot.board, "bot_turn", current_round)
     ui.update_display()
 
-    if hit_success:
+    if outcome["sunk"]:
+        display_message(screen, sunk_message(outcome["sunk"], prefix="¡El bot hundió"), delay=1500)
+    elif hit_success:
         display_message(screen, "¡El bot acertó!", delay=1500)
     else:
         display_message(screen, "El bot falló .", delay=1500)
 
     return hit_success
 
-def bot_handle_square_attack(screen, bot, player, player_board, current_round):
+def bot_handle_square_attack(screen, bot, player, player_board, current_round, target=None):
     """
-    Maneja un ataque cuadrado del bot.
+    Maneja un ataque cuadrado del bot; `target` es la esquina ya elegida, si la hay.
     """
     attack_cost = 4
     bot.stamina -= attack_cost
 
-    # Seleccionar aleatoriamente una celda
-    selected_row = random.randint(0, player_board.board_size - 2)
-    selected_col = random.randint(0, player_board.board_size - 2)
-
-    cells_to_attack = [
-        (selected_row + i, selected_col + j)
-        for i in range(2)
-        for j in range(2)
-        if is_within_bounds(selected_row + i, selected_col + j, player_board.board_size)
-    ]
-
-    hit_success = False
-    for row, col in cells_to_attack:
-        if bot.attack_board[row][col]["state"] in [0, 5]:
-            result = player.receive_attack(row, col)
-            update_attack_board(bot, row, col, result)
-            if result == "hit":
-                hit_success = True
-            elif result == "shielded":
-                hit_success = False  # Escudo bloqueó el ataque
+    if target is None:
+        target = choose_bot_target(bot, "square_attack", player_board.board_size)
+        if target is None:
+            return False
+    selected_row, selected_col = target
+
+    outcome = resolve_area_attack(bot, player, "square_attack", selected_row, selected_col)
+    # El escudo solo bloquea la primera celda; cualquier impacto cuenta como acierto
+    hit_success = outcome["hits"] > 0
     # Limpiar la pantalla antes de dibujar
     screen.fill(config.colors["background"])
     ui.draw_game_state(screen, player, bot, player_board, bot.board, "bot_turn", current_round)
     ui.update_display()
 
-    if hit_success:
+    if outcome["sunk"]:
+        display_message(screen, sunk_message(outcome["sunk"], prefix="¡El bot hundió"), delay=1500)
+    elif hit_success:
         display_message(screen, "¡El bot acertó!", delay=1500)
     else:
         display_message(screen, "El bot falló .", delay=1500)
 
     return hit_success
 
-def bot_handle_shield(screen, bot, player, player_board, current_round):
+def bot_handle_shield(screen, bot, player, player_board, current_round, target=None):
     """
     Maneja la habilidad del escudo del bot.
     """
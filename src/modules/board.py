@@ -1,19 +1,52 @@
+import numpy as np
 import pygame
 from modules.config import config
+from modules.fonts import get_font
 from modules.utils import is_within_bounds
+from modules.board_renderer import BoardRenderer
+from modules.viewport import Viewport
+from modules.profiler import profiler
+from modules.area_attacks import RESULT_NAMES
 
 class Board:
     def __init__(self, board_size=20):
-        self.cell_size = config.CELL_SIZE
         self.board_size = board_size
-        self.pixel_size = self.cell_size * self.board_size
+        self.viewport = Viewport(board_size)  # Zona visible; los tableros grandes se desplazan
         self.start_x = config.board_x
         self.start_y = config.board_y
         self.grid = [
-            [{"state": 0, "ship": None} for _ in range(self.board_size)]
+            [{"state": 0, "ship": None, "ship_id": 0} for _ in range(self.board_size)]
             for _ in range(self.board_size)
         ]
-        self.font = pygame.font.Font(config.font_bold, 12)
+        self._font = None
+        self._renderer = None
+
+    @property
+    def cell_size(self):
+        return self.viewport.cell_size
+
+    @property
+    def pixel_size(self):
+        """Lado en píxeles de la zona visible del tablero."""
+        return self.viewport.pixel_size
+
+    def cell_rect(self, row, col):
+        """Rectángulo de pantalla de una celda, o None si no está a la vista."""
+        if not self.viewport.is_visible(row, col):
+            return None
+        x, y = self.viewport.cell_offset(row, col)
+        return pygame.Rect(self.start_x + x, self.start_y + y, self.cell_size, self.cell_size)
+
+    def cell_at(self, x, y):
+        """Celda bajo un punto de la pantalla, o (None, None) si está fuera de la vista."""
+        return self.viewport.cell_at(x - self.start_x, y - self.start_y)
+
+    @property
+    def font(self):
+        """Carga la fuente de las etiquetas solo cuando el tablero se dibuja."""
+        if self._font is None:
+            self._font = get_font(config.font_bold, 12)
+        return self._font
 
     def get_cell_color(self, cell):
         """Obtiene el color de una celda basado en su estado."""
@@ -33,52 +66,59 @@ class Board:
         else:
             return config.colors["cell"]
 
-    def draw(self, screen):
-        """Dibuja el tablero en la pantalla."""
-        # Dibujar etiquetas de filas y columnas
-        for col in range(self.board_size):
-            number_text = self.font.render(str(col + 1), True, config.colors["text"])
-            screen.blit(
-                number_text,
-                (
-                    self.start_x + col * self.cell_size + self.cell_size // 2 - number_text.get_width() // 2,
-                    self.start_y - self.cell_size // 2 - number_text.get_height() // 2,
-                ),
-            )
-        for row in range(self.board_size):
-            letter_text = self.font.render(chr(65 + row), True, config.colors["text"])
-            screen.blit(
-                letter_text,
-                (
-                    self.start_x - self.cell_size // 2 - letter_text.get_width() // 2,
-                    self.start_y + row * self.cell_size + self.cell_size // 2 - letter_text.get_height() // 2,
-                ),
-            )
-
-        # Dibujar las celdas del tablero
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                x = self.start_x + col * self.cell_size
-                y = self.start_y + row * self.cell_size
-                cell = self.grid[row][col]
+    @property
+    def renderer(self):
+        """Superficie en caché del tablero; se crea al dibujarlo por primera vez."""
+        if self._renderer is None:
+            self._renderer = BoardRenderer(self.board_size, self.cell_size, self.font)
+        return self._renderer
 
-                # Determinar el color de la celda
-                color = self.get_cell_color(cell)
+    @profiler.timed("board.draw")
+    def draw(self, screen):
+        """
+        Dibuja el tablero en la pantalla y devuelve los rectángulos que cambiaron.
+        Solo se repintan las celdas modificadas desde el cuadro anterior.
+        """
+        return self.renderer.draw(
+            screen,
+            self.start_x,
+            self.start_y,
+            lambda row, col: self.get_cell_color(self.grid[row][col]),
+            self.viewport,
+        )
 
-                # Dibujar la celda
-                pygame.draw.rect(
-                    screen,
-                    color,
-                    pygame.Rect(x, y, self.cell_size, self.cell_size),
-                )
-                pygame.draw.rect(
-                    screen,
-                    config.colors["border"],
-                    pygame.Rect(x, y, self.cell_size, self.cell_size),
-                    width=config.BORDER_WIDTH,
-                )
+    def _mark_dirty(self, row, col):
+        if self._renderer is not None:
+            self._renderer.mark_dirty(row, col)
 
-    def update_cell(self, row, col, state, ship=None):
+    def update_cell(self, row, col, state, ship=None, ship_id=0):
         """Actualiza el estado de una celda específica en el tablero."""
         if is_within_bounds(row, col, self.board_size):
-            self.grid[row][col].update({"state": state, "ship": ship})
+            self.grid[row][col].update({"state": state, "ship": ship, "ship_id": ship_id})
+            self._mark_dirty(row, col)
+
+    def get_cell(self, row, col):
+        """Devuelve el estado y el barco de una celda."""
+        return self.grid[row][col]
+
+    def ship_id_at(self, row, col):
+        """Identificador del barco de una celda (0 si no hay barco)."""
+        return self.grid[row][col]["ship_id"]
+
+    def receive_attack(self, row, col):
+        """Marca una celda como atacada y devuelve el resultado del disparo."""
+        cell = self.grid[row][col]
+        if cell["state"] == 1:
+            cell["state"] = 3
+            self._mark_dirty(row, col)
+            return "hit"
+        elif cell["state"] == 0:
+            cell["state"] = 2
+            self._mark_dirty(row, col)
+            return "miss"
+        return "already_attacked"
+
+    def receive_cells(self, rows, cols):
+        """Resuelve un ataque sobre varias celdas y devuelve el código de resultado de cada una."""
+        results = [self.receive_attack(row, col) for row, col in zip(rows.tolist(), cols.tolist())]
+        return np.array([RESULT_NAMES.index(result) for result in results], dtype=np.int8)
@@ -0,0 +1,188 @@
+import math
+import pygame
+from modules.config import config
+from modules.fonts import render_text
+from modules.viewport import Viewport, row_label
+
+MINIMAP_GAP = 8  # Separación entre la vista del tablero y su minimapa
+
+class BoardRenderer:
+    """
+    Mantiene una superficie con la parte visible del tablero ya dibujada
+    (etiquetas y celdas) y solo vuelve a pintar las celdas marcadas como
+    modificadas. Solo se dibujan las celdas que entran en la vista, así que
+    el costo de cada cuadro no depende del tamaño del tablero.
+    """
+    def __init__(self, board_size, cell_size, font, labels_side="left"):
+        self.board_size = board_size
+        self.font = font
+        self.labels_side = labels_side  # Lado de las letras de las filas: "left" o "right"
+        self.viewport = Viewport(board_size, cell_size)  # Vista por defecto si no se indica otra
+        self.surface = None
+        self.dirty = set()
+        self.position = None
+        self.view_state = None  # (versión, tamaño de celda) de la vista dibujada
+        self.minimap = Minimap(board_size, config.MINIMAP_SIZE)
+        # Desplazamiento de la primera celda dentro de la superficie; las etiquetas
+        # ocupan siempre el mismo margen, sea cual sea el zoom
+        margin = config.CELL_SIZE
+        self.offset_x = margin if labels_side == "left" else 0
+        self.offset_y = margin
+
+    @property
+    def cell_size(self):
+        return self.viewport.cell_size
+
+    def mark_dirty(self, row, col):
+        """Marca una celda para repintarla en el siguiente cuadro."""
+        self.dirty.add((row, col))
+        self.minimap.mark_dirty(row, col)
+
+    def invalidate(self):
+        """Obliga a reconstruir toda la superficie en el siguiente cuadro."""
+        self.surface = None
+
+    def _cell_rect(self, row, col):
+        x, y = self.viewport.cell_offset(row, col)
+        return pygame.Rect(self.offset_x + x, self.offset_y + y, self.cell_size, self.cell_size)
+
+    def _paint_cell(self, row, col, color):
+        rect = self._cell_rect(row, col)
+        pygame.draw.rect(self.surface, color, rect)
+        pygame.draw.rect(self.surface, config.colors["border"], rect, width=config.BORDER_WIDTH)
+
+    def _build(self, color_at):
+        """Dibuja etiquetas y celdas visibles en una superficie nueva."""
+        viewport = self.viewport
+        cell_size = viewport.cell_size
+        margin = config.CELL_SIZE
+        size = margin + viewport.pixel_size
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        half = cell_size // 2
+
+        # Con celdas pequeñas solo se etiqueta una de cada tantas filas o columnas
+        col_step = math.ceil(24 / cell_size)
+        for col in viewport.cols():
+            if (col + 1) % col_step and col_step > 1:
+                continue
+            number_text = render_text(self.font, str(col + 1), config.colors["text"])
+            x, _ = viewport.cell_offset(0, col)
+            self.surface.blit(
+                number_text,
+                number_text.get_rect(center=(self.offset_x + x + half, margin // 2)),
+            )
+
+        row_step = math.ceil(14 / cell_size)
+        if self.labels_side == "left":
+            label_x = margin // 2
+        else:
+            label_x = viewport.pixel_size + margin // 2
+        for row in viewport.rows():
+            if row % row_step:
+                continue
+            letter_text = render_text(self.font, row_label(row), config.colors["text"])
+            _, y = viewport.cell_offset(row, 0)
+            self.surface.blit(
+                letter_text,
+                letter_text.get_rect(center=(label_x, self.offset_y + y + half)),
+            )
+
+        for row in viewport.rows():
+            for col in viewport.cols():
+                self._paint_cell(row, col, color_at(row, col))
+        self.view_state = (viewport.version, cell_size)
+
+    def draw(self, screen, start_x, start_y, color_at, viewport=None):
+        """
+        Dibuja el tablero con la esquina de la primera celda visible en
+        (start_x, start_y). Devuelve los rectángulos de pantalla que cambiaron
+        desde el cuadro anterior.
+        """
+        if viewport is not None:
+            self.viewport = viewport
+        origin = (start_x - self.offset_x, start_y - self.offset_y)
+        if self.surface is None or self.view_state != (self.viewport.version, self.viewport.cell_size):
+            self._build(color_at)
+            changed = [self.surface.get_rect(topleft=origin)]
+        else:
+            changed = []
+            for row, col in self.dirty:
+                if self.viewport.is_visible(row, col):
+                    self._paint_cell(row, col, color_at(row, col))
+                    changed.append(self._cell_rect(row, col).move(origin))
+            if origin != self.position:
+                changed = [self.surface.get_rect(topleft=origin)]
+        self.dirty.clear()
+        self.position = origin
+
+        screen.blit(self.surface, origin)
+        if self.viewport.scrollable:
+            changed.extend(self.minimap.draw(
+                screen, start_x, start_y + self.viewport.pixel_size + MINIMAP_GAP, color_at, self.viewport
+            ))
+        return changed
+
+    def restore(self, screen, rects):
+        """Copia en pantalla las zonas `rects` de la superficie ya dibujada y las devuelve."""
+        if self.surface is None or self.position is None:
+            return []
+        for rect in rects:
+            screen.blit(self.surface, rect, rect.move(-self.position[0], -self.position[1]))
+        return list(rects)
+
+class Minimap:
+    """
+    Vista reducida de un tablero grande: una superficie de un píxel por celda
+    que se escala al tamaño del minimapa, con un recuadro de la zona visible.
+    """
+    def __init__(self, board_size, size):
+        self.board_size = board_size
+        self.size = size
+        self.cells = None  # Superficie de board_size x board_size
+        self.scaled = None
+        self.dirty = set()
+        self.view_state = None
+
+    def mark_dirty(self, row, col):
+        if self.cells is not None:
+            self.dirty.add((row, col))
+
+    def rect(self, x, y):
+        return pygame.Rect(x, y, self.size, self.size)
+
+    def draw(self, screen, x, y, color_at, viewport):
+        """Dibuja el minimapa y devuelve su rectángulo si cambió."""
+        changed = False
+        if self.cells is None:
+            self.cells = pygame.Surface((self.board_size, self.board_size))
+            for row in range(self.board_size):
+                for col in range(self.board_size):
+                    self.cells.set_at((col, row), color_at(row, col))
+            self.dirty.clear()
+            self.scaled = None
+        elif self.dirty:
+            for row, col in self.dirty:
+                self.cells.set_at((col, row), color_at(row, col))
+            self.dirty.clear()
+            self.scaled = None
+
+        if self.scaled is None:
+            self.scaled = pygame.transform.scale(self.cells, (self.size, self.size))
+            changed = True
+
+        state = (viewport.version, viewport.cell_size)
+        changed = changed or state != self.view_state
+        self.view_state = state
+
+        rect = self.rect(x, y)
+        screen.blit(self.scaled, rect)
+        scale = self.size / self.board_size
+        view = pygame.Rect(
+            rect.x + int(viewport.left * scale),
+            rect.y + int(viewport.top * scale),
+            max(2, round(viewport.visible * scale)),
+            max(2, round(viewport.visible * scale)),
+        )
+        pygame.draw.rect(screen, config.colors["selected_border"], view, 1)
+        pygame.draw.rect(screen, config.colors["border"], rect, 1)
+        return [rect] if changed else []
@@ -0,0 +1,229 @@
+import random
+from collections import Counter
+import numpy as np
+from modules.warships import create_fleet
+from modules.engine import ATTACK_COSTS, _cells_with_state
+from modules.attacks_logic import choose_bot_target, decide_bot_move
+from modules.placement_counts import load_placement_tables
+
+# Lo que el bot sabe de cada celda del tablero rival
+UNKNOWN, MISS, HIT = 0, 1, 2
+
+class DensityTargeting:
+    """
+    Puntería de caza y acoso (hunt/target) basada en un mapa de densidad:
+    para cada celda cuenta cuántas posiciones de los barcos restantes la
+    cubren. El mapa se actualiza de forma incremental con cada resultado.
+    """
+    def __init__(self, board_size, fleet=None):
+        self.board_size = board_size
+        fleet = fleet if fleet is not None else create_fleet()
+        self.remaining = Counter(ship.size for ship in fleet)
+        self.known = np.zeros((board_size, board_size), dtype=np.int8)
+        self.open_hits = set()  # Impactos de barcos que aún no se hunden
+        # Copias en listas de `known` por filas y columnas para recorrer ventanas pequeñas rápido
+        self._rows = [[UNKNOWN] * board_size for _ in range(board_size)]
+        self._cols = [[UNKNOWN] * board_size for _ in range(board_size)]
+        # Con el tablero vacío, la densidad sale de las tablas precalculadas
+        self.density = load_placement_tables(board_size, fleet).density(self.remaining)
+
+    def _add_placements(self, size, weight):
+        """Suma `weight` en las celdas de cada posición libre de un barco de tamaño `size`."""
+        n = self.board_size
+        if size > n:
+            return
+        blocked = (self.known != UNKNOWN).astype(np.int32)
+        span = n - size + 1
+
+        sums = np.pad(np.cumsum(blocked, axis=1), ((0, 0), (1, 0)))
+        free_h = (sums[:, size:] - sums[:, :-size]) == 0
+        for offset in range(size):
+            self.density[:, offset:offset + span] += weight * free_h
+
+        if size > 1:  # Un barco de una celda es igual en ambas orientaciones
+            sums = np.pad(np.cumsum(blocked, axis=0), ((1, 0), (0, 0)))
+            free_v = (sums[size:, :] - sums[:-size, :]) == 0
+            for offset in range(size):
+                self.density[offset:offset + span, :] += weight * free_v
+
+    def _remove_placements_through(self, row, col):
+        """Descuenta las posiciones que pasaban por una celda que deja de estar libre."""
+        n = self.board_size
+        row_cells = self._rows[row]
+        col_cells = self._cols[col]
+        for size, count in self.remaining.items():
+            if count == 0:
+                continue
+            for start in range(max(0, col - size + 1), min(col, n - size) + 1):
+                if not any(row_cells[start:start + size]):
+                    self.density[row, start:start + size] -= count
+            if size > 1:
+                for start in range(max(0, row - size + 1), min(row, n - size) + 1):
+                    if not any(col_cells[start:start + size]):
+                        self.density[start:start + size, col] -= count
+
+    def _set_known(self, row, col, value):
+        self.known[row, col] = value
+        self._rows[row][col] = value
+        self._cols[col][row] = value
+
+    def _is_closed(self, row, col):
+        """Un impacto está cerrado cuando no le quedan vecinos desconocidos."""
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < self.board_size and 0 <= c < self.board_size and self._rows[r][c] == UNKNOWN:
+                return False
+        return True
+
+    def record(self, row, col, result):
+        """Actualiza el mapa con el resultado de un ataque."""
+        if result not in ("hit", "miss") or self._rows[row][col] != UNKNOWN:
+            return
+        self._remove_placements_through(row, col)
+        if result == "hit":
+            self._set_known(row, col, HIT)
+            self.open_hits.add((row, col))
+        else:
+            self._set_known(row, col, MISS)
+
+        # Los impactos rodeados ya no aportan celdas nuevas que probar
+        for cell in ((row, col), (row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if cell in self.open_hits and self._is_closed(*cell):
+                self.open_hits.discard(cell)
+
+    def on_ship_sunk(self, size, cells=()):
+        """Quita un barco hundido de la flota restante."""
+        if self.remaining[size] > 0:
+            self._add_placements(size, -1)
+            self.remaining[size] -= 1
+        self.open_hits.difference_update(cells)
+
+    def _target_scores(self):
+        """
+        Puntúa las celdas desconocidas por las posiciones de barcos que explican
+        los impactos abiertos. Solo recorre la vecindad de esos impactos.
+        """
+        n = self.board_size
+        scores = {}
+        for hit_row, hit_col in self.open_hits:
+            row_cells = self._rows[hit_row]
+            col_cells = self._cols[hit_col]
+            for size, count in self.remaining.items():
+                if count == 0 or size == 1:
+                    continue
+                for start in range(max(0, hit_col - size + 1), min(hit_col, n - size) + 1):
+                    window = row_cells[start:start + size]
+                    if MISS not in window:
+                        weight = count * window.count(HIT)
+                        for col in range(start, start + size):
+                            if row_cells[col] == UNKNOWN:
+                                scores[(hit_row, col)] = scores.get((hit_row, col), 0) + weight
+                for start in range(max(0, hit_row - size + 1), min(hit_row, n - size) + 1):
+                    window = col_cells[start:start + size]
+                    if MISS not in window:
+                        weight = count * window.count(HIT)
+                        for row in range(start, start + size):
+                            if col_cells[row] == UNKNOWN:
+                                scores[(row, hit_col)] = scores.get((row, hit_col), 0) + weight
+        return scores
+
+    def scores(self):
+        """Mapa de puntuación vigente: acoso si hay impactos abiertos, caza si no."""
+        if self.open_hits:
+            targets = self._target_scores()
+            if targets:
+                scores = np.zeros((self.board_size, self.board_size), dtype=np.int64)
+                for (row, col), score in targets.items():
+                    scores[row, col] = score
+                return scores
+        return np.where(self.known == UNKNOWN, self.density, 0)
+
+    def _pick_best(self, scores, rng):
+        best = np.flatnonzero(scores == scores.max())
+        return int(best[rng.randrange(len(best))])
+
+    def choose_target(self, rng=random):
+        """Elige la celda más probable para un ataque normal."""
+        if self.open_hits:
+            targets = self._target_scores()
+            if targets:
+                best = max(targets.values())
+                cells = [cell for cell, score in targets.items() if score == best]
+                return cells[rng.randrange(len(cells))]
+        scores = np.where(self.known == UNKNOWN, self.density, 0)
+        if not scores.any():
+            scores = (self.known == UNKNOWN).astype(np.int64)
+            if not scores.any():
+                return None
+        return divmod(self._pick_best(scores, rng), self.board_size)
+
+    def choose_line(self, rng=random):
+        """Elige el centro y la orientación de un ataque lineal de 3 celdas."""
+        scores = np.pad(self.scores(), 1)
+        horizontal = scores[1:-1, :-2] + scores[1:-1, 1:-1] + scores[1:-1, 2:]
+        vertical = scores[:-2, 1:-1] + scores[1:-1, 1:-1] + scores[2:, 1:-1]
+        index = self._pick_best(np.stack([horizontal, vertical]), rng)
+        orientation, cell = divmod(index, self.board_size * self.board_size)
+        row, col = divmod(cell, self.board_size)
+        return row, col, "H" if orientation == 0 else "V"
+
+    def choose_square(self, rng=random):
+        """Elige la esquina superior izquierda de un ataque cuadrado de 2x2."""
+        scores = self.scores()
+        square = scores[:-1, :-1] + scores[1:, :-1] + scores[:-1, 1:] + scores[1:, 1:]
+        row, col = divmod(self._pick_best(square, rng), self.board_size - 1)
+        return row, col
+
+def density_policy(engine, rng=None):
+    """
+    Política para GameEngine que elige habilidades como `bot_attack` pero
+    apunta con el mapa de densidad del jugador activo.
+    """
+    rng = rng if rng is not None else engine.rng
+    if engine.phase == "roll":
+        return ("roll",)
+
+    player = engine.current_player
+    if player.targeting is None:
+        player.targeting = DensityTargeting(engine.board_size, player.fleet)
+
+    if player.stamina < 4:
+        attack_type = "normal_attack"
+    else:
+        attack_type = rng.choice(list(ATTACK_COSTS))
+    if player.stamina < ATTACK_COSTS[attack_type]:
+        attack_type = "normal_attack"
+
+    if attack_type == "normal_attack":
+        target = player.targeting.choose_target(rng)
+        if target is None:
+            # Solo quedan celdas marcadas por un escudo, que pueden esconder barcos
+            target = rng.choice(_cells_with_state(player, engine.board_size, 4))
+        return ("normal_attack", *target)
+    if attack_type == "line_attack":
+        return ("line_attack", *player.targeting.choose_line(rng))
+    if attack_type == "square_attack":
+        return ("square_attack", *player.targeting.choose_square(rng))
+    return ("use_shield",)
+
+def bot_attack_policy(engine, rng=None):
+    """
+    Política para GameEngine con la misma decisión que el bot de la interfaz
+    (`decide_bot_move` de `bot_attack`), incluida su puntería de densidad.
+    """
+    rng = rng if rng is not None else engine.rng
+    if engine.phase == "roll":
+        return ("roll",)
+
+    player = engine.current_player
+    if player.targeting is None:
+        player.targeting = DensityTargeting(engine.board_size, player.fleet)
+
+    attack_type, target = decide_bot_move(player, engine.board_size)
+    if player.stamina < ATTACK_COSTS[attack_type]:
+        # En la interfaz el escudo le cuesta menos al bot que en el motor
+        attack_type = "normal_attack"
+        target = choose_bot_target(player, attack_type, engine.board_size)
+    if target is None:
+        # Solo quedan celdas marcadas por un escudo, que pueden esconder barcos
+        return ("normal_attack", *rng.choice(_cells_with_state(player, engine.board_size, 4)))
+    return (attack_type, *target)
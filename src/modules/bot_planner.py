@@ -0,0 +1,48 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from modules.scheduler import scheduler
+
+_executor = None
+
+def _get_executor():
+    """Un único hilo para todos los bots: sus decisiones usan el generador en orden."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-planner")
+    return _executor
+
+class BotPlanner:
+    """
+    Calcula la siguiente jugada del bot en un hilo aparte mientras la
+    interfaz muestra mensajes y animaciones. Las jugadas terminadas llegan
+    por una cola; `take` la recoge sin dejar de atender la ventana.
+    """
+    def __init__(self, bot, decide, *args):
+        self.bot = bot
+        self.decide = decide  # decide(bot, *args) -> jugada
+        self.args = args
+        self.results = queue.Queue()
+        self.pending = 0
+
+    def start(self):
+        """Empieza a calcular la siguiente jugada con el estado actual del juego."""
+        self.pending += 1
+        future = _get_executor().submit(self.decide, self.bot, *self.args)
+        future.add_done_callback(self.results.put)
+
+    def take(self, idle=None):
+        """
+        Devuelve la jugada pedida con `start`. Mientras no esté lista llama a
+        `idle` (por defecto, esperar un cuadro atendiendo la ventana).
+        """
+        if not self.pending:
+            self.start()
+        idle = idle or (lambda: scheduler.wait(1000 // scheduler.fps))
+        while True:
+            try:
+                future = self.results.get_nowait()
+                break
+            except queue.Empty:
+                idle()
+        self.pending -= 1
+        return future.result()
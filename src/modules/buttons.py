@@ -1,5 +1,7 @@
 import pygame
 from modules.config import config
+from modules.fonts import get_font, render_text
+from modules.scenes import Scene, dispatcher
 
 def draw_button(screen, x, y, width, height, text, font, is_hovered=False):
     """
@@ -16,7 +18,7 @@ def draw_button(screen, x, y, width, height, text, font, is_hovered=False):
     pygame.draw.rect(screen, button_color, button_rect, border_radius=10)
     pygame.draw.rect(screen, border_color, button_rect, width=2, border_radius=10)
 
-    text_surface = font.render(text, True, config.colors["text"])
+    text_surface = render_text(font, text, config.colors["text"])
     text_rect = text_surface.get_rect(center=button_rect.center)
     screen.blit(text_surface, text_rect)
 
@@ -35,23 +37,14 @@ def handle_button_interaction(mouse_x, mouse_y, buttons):
             return index
     return None
 
-def draw_action_buttons(screen, button_area_rect, player):
+class ActionButtonsScene(Scene):
     """
-    Genera y maneja la lógica de los botones de acción.
+    Botones de acción del turno. Solo se redibujan cuando cambia el botón
+    bajo el mouse; un clic sobre un botón habilitado cierra la escena con
+    su acción.
     """
-    font = pygame.font.Font(config.font_regular, 20)
-
-    # Configuración centralizada para botones
-    button_config = {
-        "width": 120,
-        "height": 40,
-        "positions": [
-            (button_area_rect.x + 70, button_area_rect.y + 30),
-            (button_area_rect.x + 210, button_area_rect.y + 30),
-            (button_area_rect.x + 70, button_area_rect.y + 80),
-            (button_area_rect.x + 210, button_area_rect.y + 80)
-        ],
-    }
+    width = 120
+    height = 40
 
     # Botones de ataque y acciones
     buttons = [
@@ -61,51 +54,50 @@ def draw_action_buttons(screen, button_area_rect, player):
         {"label": "Escudo", "cost": 3, "action": "use_shield"},
     ]
 
-    while True:
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+    def __init__(self, button_area_rect, player):
+        super().__init__()
+        self.player = player
+        self.font = get_font(config.font_regular, 20)
+        self.rects = [
+            pygame.Rect(button_area_rect.x + x, button_area_rect.y + y, self.width, self.height)
+            for x, y in ((70, 30), (210, 30), (70, 80), (210, 80))
+        ]
+        self.hovered = self.button_at(pygame.mouse.get_pos())
 
-        for button, (x, y) in zip(buttons, button_config["positions"]):
-            is_hovered = is_mouse_over_button(
-                mouse_x, mouse_y, x, y, button_config["width"], button_config["height"]
-            )
-            is_disabled = player.stamina < button["cost"]
+    def button_at(self, position):
+        """Índice del botón bajo `position`, o None."""
+        return handle_button_interaction(*position, [tuple(rect) for rect in self.rects])
 
+    def enabled(self, index):
+        return self.player.stamina >= self.buttons[index]["cost"]
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            hovered = self.button_at(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.dirty = True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            index = self.button_at(event.pos)
+            if index is not None and self.enabled(index):
+                self.finish(self.buttons[index]["action"])
+
+    def draw(self, screen):
+        for index, (button, rect) in enumerate(zip(self.buttons, self.rects)):
+            is_disabled = not self.enabled(index)
             color = (
                 config.colors["disabled_button"] if is_disabled else config.colors["button"]
             )
-            if is_hovered and not is_disabled:
+            if index == self.hovered and not is_disabled:
                 color = config.colors["hovered_button"]
 
-            pygame.draw.rect(
-                screen,
-                color,
-                (x, y, button_config["width"], button_config["height"]),
-                border_radius=10,
-            )
-            button_text = font.render(button["label"], True, config.colors["text"])
-            button_text_rect = button_text.get_rect(
-                center=(
-                    x + button_config["width"] // 2,
-                    y + button_config["height"] // 2,
-                )
-            )
-            screen.blit(button_text, button_text_rect)
-
-        pygame.display.flip()
+            pygame.draw.rect(screen, color, rect, border_radius=10)
+            button_text = render_text(self.font, button["label"], config.colors["text"])
+            screen.blit(button_text, button_text.get_rect(center=rect.center))
+        return self.rects
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button, (x, y) in zip(buttons, button_config["positions"]):
-                    if is_mouse_over_button(
-                        mouse_x,
-                        mouse_y,
-                        x,
-                        y,
-                        button_config["width"],
-                        button_config["height"],
-                    ):
-                        if player.stamina >= button["cost"]:
-                            return button["action"]
+def draw_action_buttons(screen, button_area_rect, player):
+    """
+    Muestra los botones de acción y espera a que el jugador elija una.
+    """
+    return dispatcher.run(ActionButtonsScene(button_area_rect, player), screen)
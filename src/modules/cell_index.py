@@ -0,0 +1,52 @@
+import random
+
+class UnattackedCells:
+    """
+    Índice de celdas sin atacar con muestreo uniforme y borrado en O(1):
+    un arreglo compacto de celdas (borrado por intercambio con la última)
+    más un mapa de la posición de cada celda en ese arreglo.
+    """
+    def __init__(self, board_size):
+        self.board_size = board_size
+        self.cells = list(range(board_size * board_size))  # Índices planos fila * n + columna
+        self.positions = list(range(board_size * board_size))  # -1 si la celda ya se quitó
+
+    @classmethod
+    def from_cells(cls, board_size, cells):
+        """Rehace el índice con las celdas restantes (índices planos) en el mismo orden."""
+        index = cls.__new__(cls)
+        index.board_size = board_size
+        index.cells = list(cells)
+        index.positions = [-1] * (board_size * board_size)
+        for position, cell in enumerate(index.cells):
+            index.positions[cell] = position
+        return index
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        row, col = cell
+        return self.positions[row * self.board_size + col] >= 0
+
+    def discard(self, row, col):
+        """Quita una celda del índice si todavía estaba."""
+        index = row * self.board_size + col
+        position = self.positions[index]
+        if position < 0:
+            return
+        last = self.cells.pop()
+        if last != index:
+            self.cells[position] = last
+            self.positions[last] = position
+        self.positions[index] = -1
+
+    def sample(self, rng=random):
+        """Devuelve una celda sin atacar elegida al azar, o None si no quedan."""
+        if not self.cells:
+            return None
+        return divmod(self.cells[rng.randrange(len(self.cells))], self.board_size)
+
+    def __iter__(self):
+        for index in self.cells:
+            yield divmod(index, self.board_size)
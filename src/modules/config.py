@@ -1,4 +1,4 @@
-import pygame
+import os
 
 class Config:
     def __init__(self, board_size=20):
@@ -6,7 +6,6 @@ class Config:
         self.WINDOW_WIDTH, self.WINDOW_HEIGHT = 1180, 660
         self.CELL_SIZE = 25
         self.BORDER_WIDTH = 1
-        self.icon = pygame.image.load("./assets/images/icon.png")
         self.font_bold = "./assets/fonts/Pixelify_Sans/static/PixelifySans-Bold.ttf"
         self.font_regular = "./assets/fonts/Pixelify_Sans/static/PixelifySans-Regular.ttf"
 
@@ -29,9 +28,23 @@ class Config:
         }
 
         # Configuración del tablero
+        self.game_board_size = 12  # Tamaño del tablero de cada partida
+        self.MAX_BOARD_SIZE = 256
+        self.VIEWPORT_SIZE = 300  # Lado en píxeles de la zona visible de cada tablero
+        self.ZOOM_LEVELS = (6, 8, 10, 12, 16, 20, 25)  # Tamaños de celda posibles
+        self.MINIMAP_SIZE = 80
+        self.SAVE_PATH = "./saves/partida.sss"  # Partida guardada al salir con ESC
+        # Carpeta de las tablas de posiciones de barcos en disco; sin ella solo se guardan en memoria
+        self.PLACEMENT_CACHE_DIR = os.environ.get("SEVEN_SEAS_PLACEMENT_CACHE") or None
         self.board_size = board_size
         self.board_x = (self.WINDOW_WIDTH - self.board_size * self.CELL_SIZE) // 2
         self.board_y = (self.WINDOW_HEIGHT - self.board_size * self.CELL_SIZE) // 2
 
+    @property
+    def icon(self):
+        """Icono de la ventana; se carga la primera vez que se pide."""
+        from modules.assets import assets
+        return assets.image("icon")
+
 # Instancia global
 config = Config()
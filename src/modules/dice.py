@@ -1,127 +1,153 @@
 import pygame
 import random
+import numpy as np
 from modules.buttons import draw_button, is_mouse_over_button
 from modules.config import config
+from modules.fonts import get_font, render_text
+from modules.scenes import Scene, dispatcher
 
-def dice_turn(screen, message, button_area_rect):
+class DiceScene(Scene):
+    """
+    Botón para lanzar el dado dentro del área central. Solo anima mientras
+    el dado gira; antes de eso espera los eventos sin redibujar.
+    """
+    roll_duration = 3000  # ms
+
+    def __init__(self, message, button_area_rect, rng=random):
+        super().__init__()
+        self.message = message
+        self.area = button_area_rect
+        self.rng = rng
+        self.font = get_font(config.font_regular, 24)
+        self.button_rect = pygame.Rect(button_area_rect.x + 100, button_area_rect.y + 80, 200, 50)
+        self.is_hovered = self.over_button(pygame.mouse.get_pos())
+        self.start_time = None
+
+    @property
+    def animating(self):
+        return self.start_time is not None
+
+    def over_button(self, position):
+        return is_mouse_over_button(*position, *self.button_rect)
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            is_hovered = self.over_button(event.pos)
+            if is_hovered != self.is_hovered:
+                self.is_hovered = is_hovered
+                self.dirty = True
+        elif (
+            event.type == pygame.MOUSEBUTTONDOWN
+            and event.button == 1
+            and self.over_button(event.pos)
+            and self.start_time is None
+        ):
+            self.start_time = pygame.time.get_ticks()
+
+    def update(self):
+        if pygame.time.get_ticks() - self.start_time >= self.roll_duration:
+            self.finish(self.rng.randint(1, 100))
+        else:
+            self.message = str(random.randint(1, 100))
+
+    def draw(self, screen):
+        _render_dice_turn(screen, self.font, self.area, self.message, self.button_rect, self.is_hovered)
+        return [self.area]
+
+def dice_turn(screen, message, button_area_rect, rng=random):
     """
     Lógica para lanzar el dado con un botón dentro del área central.
+    El resultado sale de `rng`; la animación usa el módulo random para no
+    consumir el generador de la partida (depende de cuántos cuadros dure).
     """
-    font = pygame.font.Font(config.font_regular, 24)
-
-    button_config = {
-        "x": button_area_rect.x + 100,
-        "y": button_area_rect.y + 80,
-        "width": 200,
-        "height": 50,
-    }
-
-    dice_result = None
-    rolling = False
-    start_time = None
-    clock = pygame.time.Clock()
-
-    while dice_result is None:
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        is_hovered = is_mouse_over_button(
-            mouse_x,
-            mouse_y,
-            button_config["x"],
-            button_config["y"],
-            button_config["width"],
-            button_config["height"],
-        )
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-
-            if (
-                event.type == pygame.MOUSEBUTTONDOWN
-                and event.button == 1
-                and is_hovered
-            ):
-                rolling = True
-                start_time = pygame.time.get_ticks()
-
-        dice_result = _render_dice_turn(
-            screen,
-            font,
-            button_area_rect,
-            rolling,
-            start_time,
-            message,
-            button_config,
-            is_hovered,
-        )
-
-        pygame.display.flip()
-        clock.tick(60)
-
-    return dice_result
-
-def _render_dice_turn(
-    screen, font, button_area_rect, rolling, start_time, message, button_config, is_hovered
-):
+    return dispatcher.run(DiceScene(message, button_area_rect, rng), screen)
+
+def _render_dice_turn(screen, font, button_area_rect, message, button_rect, is_hovered):
     """
-    Renderiza la sección del dado, maneja la animación y el mensaje.
+    Renderiza la sección del dado con su mensaje y el botón.
     """
     pygame.draw.rect(
         screen, config.colors["background"], button_area_rect, border_radius=10
     )
 
-    if rolling:
-        elapsed_time = pygame.time.get_ticks() - start_time
-        if elapsed_time < 3000:
-            current_roll = random.randint(1, 100)
-            message = str(current_roll)
-        else:
-            return random.randint(1, 100)
-
-    message_text = font.render(message, True, config.colors["text"])
+    message_text = render_text(font, message, config.colors["text"])
     message_text_rect = message_text.get_rect(
         center=(button_area_rect.centerx, button_area_rect.centery - 40)
     )
     screen.blit(message_text, message_text_rect)
 
-    draw_button(
-        screen,
-        button_config["x"],
-        button_config["y"],
-        button_config["width"],
-        button_config["height"],
-        "Tirar Dado",
-        font,
-        is_hovered=is_hovered,
-    )
-    return None
+    draw_button(screen, *button_rect, "Tirar Dado", font, is_hovered=is_hovered)
+
+# Eventos del dado: rango de resultados y efecto sobre estamina, vida,
+# escudo y turno perdido. El último es el de un resultado fuera de rango.
+DICE_EVENTS = [
+    {"range": range(1, 6), "stamina": 0, "life": 0, "shield": 0, "skip": 1, "message": "Pierde turno."},
+    {"range": range(6, 36), "stamina": 1, "life": 0, "shield": 0, "skip": 0, "message": "Ganas 1 punto de estamina."},
+    {"range": range(36, 46), "stamina": 2, "life": 0, "shield": 0, "skip": 0, "message": "Gana 2 puntos de estamina."},
+    {"range": range(46, 51), "stamina": 3, "life": 0, "shield": 0, "skip": 0, "message": "Gana 3 puntos de estamina."},
+    {"range": range(51, 56), "stamina": 0, "life": 1, "shield": 0, "skip": 0, "message": "Pierde 1 de vida."},
+    {"range": range(56, 96), "stamina": 0, "life": 0, "shield": 0, "skip": 0, "message": "No pasa nada."},
+    {"range": range(96, 101), "stamina": 0, "life": 0, "shield": 1, "skip": 0, "message": "Obtiene un escudo"},
+    {"range": range(0), "stamina": 0, "life": 0, "shield": 0, "skip": 0, "message": "Evento desconocido."},
+]
+UNKNOWN_EVENT = len(DICE_EVENTS) - 1
+
+# Código de evento de cada resultado (el índice es el resultado, 0 no se usa)
+DICE_CODES = np.full(101, UNKNOWN_EVENT, dtype=np.int8)
+for code, event in enumerate(DICE_EVENTS):
+    DICE_CODES[event["range"].start:event["range"].stop] = code
+# Efectos por código de evento, para aplicarlos a lotes de jugadores
+DICE_EFFECTS = {
+    name: np.array([event[name] for event in DICE_EVENTS], dtype=np.int8)
+    for name in ("stamina", "life", "shield", "skip")
+}
+_CODES = DICE_CODES.tolist()
+
+def dice_event(dice_result):
+    """Evento del dado que corresponde a un resultado."""
+    if 1 <= dice_result <= 100:
+        return DICE_EVENTS[_CODES[dice_result]]
+    return DICE_EVENTS[UNKNOWN_EVENT]
+
+def apply_dice_roll(dice_result, player):
+    """Aplica a `player` el efecto de un resultado del dado y devuelve su mensaje."""
+    event = dice_event(dice_result)
+    if event["stamina"]:
+        player.stamina += event["stamina"]
+    if event["life"]:
+        player.life = max(0, player.life - event["life"])
+    if event["shield"]:
+        player.temp_shield = True
+    if event["skip"]:
+        player.turn_skipped = True
+    return event["message"]
 
-def process_dice_roll(dice_result, player):
+def roll_many(n, players, rng=None, index=None):
     """
-    Maneja el resultado del dado, aplica efectos al jugador y devuelve un mensaje para la interfaz.
+    Tira `n` dados con `rng` (numpy.random.Generator) y aplica de una vez sus
+    efectos a un lote de jugadores: un diccionario con arreglos "stamina",
+    "life", "shield" y, si se quiere guardar, "skip". `index` elige las `n`
+    posiciones de cada arreglo (por defecto, todas). Devuelve los resultados
+    y la máscara de turnos perdidos.
     """
-    event = _get_dice_event(dice_result)
-    event["action"](player)
-    print(f"Resultado del dado: {dice_result} -> {event['message']}")
-    return event["message"]
+    rng = rng if rng is not None else np.random.default_rng()
+    index = slice(None) if index is None else index
+    rolls = rng.integers(1, 101, size=n)
+    codes = DICE_CODES[rolls]
+
+    players["stamina"][index] += DICE_EFFECTS["stamina"][codes]
+    life = players["life"]
+    life[index] = np.maximum(0, life[index] - DICE_EFFECTS["life"][codes])
+    players["shield"][index] |= DICE_EFFECTS["shield"][codes].astype(bool)
+    skip = DICE_EFFECTS["skip"][codes].astype(bool)
+    if "skip" in players:
+        players["skip"][index] |= skip
+    return rolls, skip
 
-def _get_dice_event(dice_result):
+def process_dice_roll(dice_result, player):
     """
-    Obtiene el evento del dado basado en el rango del resultado.
+    Maneja el resultado del dado, aplica efectos al jugador y devuelve un mensaje para la interfaz.
     """
-    dice_events = [
-        {"range": range(1, 6), "action": lambda p: setattr(p, "turn_skipped", True), "message": "Pierde turno."},
-        {"range": range(6, 36), "action": lambda p: setattr(p, "stamina", p.stamina + 1), "message": "Ganas 1 punto de estamina."},
-        {"range": range(36, 46), "action": lambda p: setattr(p, "stamina", p.stamina + 2), "message": "Gana 2 puntos de estamina."},
-        {"range": range(46, 51), "action": lambda p: setattr(p, "stamina", p.stamina + 3), "message": "Gana 3 puntos de estamina."},
-        {"range": range(51, 56), "action": lambda p: setattr(p, "life", max(0, p.life - 1)), "message": "Pierde 1 de vida."},
-        {"range": range(56, 96), "action": lambda p: None, "message": "No pasa nada."},
-        {"range": range(96, 101), "action": lambda p: setattr(p, "temp_shield", True), "message": "Obtiene un escudo"},
-    ]
-
-    for event in dice_events:
-        if dice_result in event["range"]:
-            return event
-
-    return {"action": lambda p: None, "message": "Evento desconocido."}
+    message = apply_dice_roll(dice_result, player)
+    print(f"Resultado del dado: {dice_result} -> {message}")
+    return message
@@ -0,0 +1,259 @@
+import random
+from modules.board import Board
+from modules.array_board import ArrayBoard, ArrayAttackBoard
+from modules.player import Player
+from modules.dice import apply_dice_roll
+from modules.attacks_logic import get_attack_state, resolve_area_attack
+
+# Costos de estamina de cada acción (los mismos que muestran los botones y las reglas)
+ATTACK_COSTS = {
+    "normal_attack": 0,
+    "line_attack": 3,
+    "square_attack": 4,
+    "use_shield": 3,
+}
+
+class GameEngine:
+    """
+    Motor de juego sin pantalla: aplica las reglas de dados, ataques y estamina
+    sin dibujar ni esperar, para poder simular partidas en lote.
+    Con `compact=True` los tableros se guardan en arreglos (ArrayBoard).
+    Todas las decisiones al azar salen de `rng`; si se pasa un `log` (MoveLog),
+    cada acción queda registrada para repetir la partida.
+    """
+    def __init__(self, board_size=12, rng=None, place_fleets=True, compact=False, log=None):
+        self.board_size = board_size
+        self.rng = rng if rng is not None else random.Random()
+        self.compact = compact
+        self.log = log
+        self.reset(place_fleets)
+
+    def reset(self, place_fleets=True):
+        """Reinicia la partida con tableros y jugadores nuevos."""
+        self.player_board, self.player = self._create_player("Jugador")
+        self.bot_board, self.bot = self._create_player("Bot")
+        self.players = (self.player, self.bot)
+        if place_fleets:
+            self.player.place_fleet_randomly()
+            self.bot.place_fleet_randomly()
+        if self.log is not None:
+            self.log.clear()
+
+        self.turn = 0  # 0 = jugador, 1 = bot
+        self.phase = "roll"  # "roll", "attack" o "game_over"
+        self.current_round = 1
+        self.winner = None
+        return self
+
+    def _create_player(self, name):
+        if self.compact:
+            board = ArrayBoard(self.board_size)
+            return board, Player(name, board, ArrayAttackBoard(self.board_size), rng=self.rng)
+        board = Board(self.board_size)
+        return board, Player(name, board, rng=self.rng)
+
+    @property
+    def current_player(self):
+        return self.players[self.turn]
+
+    @property
+    def opponent(self):
+        return self.players[1 - self.turn]
+
+    @property
+    def done(self):
+        return self.phase == "game_over"
+
+    def legal_actions(self):
+        """Devuelve los tipos de acción permitidos en la fase actual."""
+        if self.phase == "roll":
+            return ["roll"]
+        if self.phase == "attack":
+            stamina = self.current_player.stamina
+            return [name for name, cost in ATTACK_COSTS.items() if stamina >= cost]
+        return []
+
+    def step(self, action):
+        """
+        Aplica una acción del jugador activo y devuelve un resumen del resultado.
+
+        Acciones aceptadas:
+            ("roll",) o ("roll", resultado_del_dado)
+            ("normal_attack", fila, columna)
+            ("line_attack", fila, columna, orientacion)
+            ("square_attack", fila, columna)
+            ("use_shield",)
+        """
+        kind = action[0]
+        if self.phase == "game_over":
+            raise ValueError("La partida ya terminó.")
+
+        if kind == "roll":
+            if self.phase != "roll":
+                raise ValueError("Ya se tiró el dado en este turno.")
+            result = self._roll(*action[1:])
+            self._record(("roll", result["dice"]))
+            return result
+
+        if kind not in ATTACK_COSTS:
+            raise ValueError(f"Tipo de ataque desconocido: {kind}")
+        if self.phase != "attack":
+            raise ValueError("Primero se debe tirar el dado.")
+        if self.current_player.stamina < ATTACK_COSTS[kind]:
+            raise ValueError(f"Estamina insuficiente para {kind}.")
+
+        if kind == "use_shield":
+            result = self._use_shield()
+        else:
+            result = self._attack(kind, *action[1:])
+        self._record(action)
+        return result
+
+    def _record(self, action):
+        """Añade la acción al registro; las flotas se guardan con la primera."""
+        if self.log is None:
+            return
+        if not self.log.actions:
+            self.log.record_fleets(self.players)
+        self.log.record(action)
+
+    def _roll(self, dice_result=None):
+        """Tira el dado y aplica su efecto al jugador activo."""
+        player = self.current_player
+        if dice_result is None:
+            dice_result = self.rng.randint(1, 100)
+
+        message = apply_dice_roll(dice_result, player)
+
+        turn_over = False
+        if player.turn_skipped:
+            player.turn_skipped = False
+            turn_over = True
+            self._end_turn()
+        else:
+            self.phase = "attack"
+
+        self._check_winner()
+        return self._result("roll", dice=dice_result, message=message, turn_over=turn_over)
+
+    def _use_shield(self):
+        """Activa el escudo; el jugador conserva el turno para atacar."""
+        player = self.current_player
+        player.stamina -= ATTACK_COSTS["use_shield"]
+        player.temp_shield = True
+        player.last_attack_type = "use_shield"
+        return self._result("use_shield")
+
+    def _attack(self, attack_type, row, col, orientation="H"):
+        """Resuelve un ataque sobre el tablero del oponente."""
+        player = self.current_player
+        opponent = self.opponent
+
+        if attack_type == "normal_attack" and get_attack_state(player, row, col) in [1, 2, 3]:
+            # Igual que en la interfaz: se puede elegir otra celda sin perder el turno
+            return self._result(attack_type, results=[(row, col, "already_attacked")])
+
+        player.stamina -= ATTACK_COSTS[attack_type]
+        player.last_attack_type = attack_type
+
+        # Como en la interfaz, el ataque normal también puede repetir una celda con escudo
+        outcome = resolve_area_attack(
+            player, opponent, attack_type, row, col, orientation,
+            only_unknown=attack_type != "normal_attack",
+        )
+        results = outcome["cells"]
+
+        # Solo un impacto permite seguir atacando
+        turn_over = outcome["hits"] == 0
+        if turn_over:
+            self._end_turn()
+
+        self._check_winner()
+        sunk = [ship.name for ship in outcome["sunk"]]
+        return self._result(attack_type, results=results, turn_over=turn_over, sunk=sunk)
+
+    def _end_turn(self):
+        """Otorga la estamina de fin de turno y pasa el turno al rival."""
+        player = self.current_player
+        if player.last_attack_type == "normal_attack":
+            player.stamina += 2
+        else:
+            player.stamina += 1
+
+        if self.turn == 1:
+            self.current_round += 1
+        self.turn = 1 - self.turn
+        self.phase = "roll"
+
+    def _check_winner(self):
+        """Termina la partida si algún jugador se quedó sin vida."""
+        if self.player.life <= 0:
+            self.winner = self.bot
+        elif self.bot.life <= 0:
+            self.winner = self.player
+        if self.winner is not None:
+            self.phase = "game_over"
+
+    def _result(self, action, results=None, dice=None, message=None, turn_over=False, sunk=None):
+        return {
+            "action": action,
+            "dice": dice,
+            "message": message,
+            "results": results or [],
+            "sunk": sunk or [],  # Nombres de los barcos hundidos con esta acción
+            "turn_over": turn_over,
+            "done": self.done,
+        }
+
+def random_policy(engine, rng=None):
+    """
+    Política aleatoria equivalente a la del bot en `bot_attack`.
+    """
+    rng = rng if rng is not None else engine.rng
+    if engine.phase == "roll":
+        return ("roll",)
+
+    player = engine.current_player
+    if player.stamina < 4:
+        attack_type = "normal_attack"
+    else:
+        attack_type = rng.choice(list(ATTACK_COSTS))
+    if player.stamina < ATTACK_COSTS[attack_type]:
+        attack_type = "normal_attack"
+
+    size = engine.board_size
+    if not player.unattacked:
+        # Solo quedan celdas marcadas por un escudo, que pueden esconder barcos
+        return ("normal_attack", *rng.choice(_cells_with_state(player, size, 4)))
+    if attack_type == "normal_attack":
+        return ("normal_attack", *player.unattacked.sample(rng))
+    if attack_type == "line_attack":
+        orientation = rng.choice(["H", "V"])
+        return ("line_attack", *player.unattacked.sample(rng), orientation)
+    if attack_type == "square_attack":
+        row, col = player.unattacked.sample(rng)
+        return ("square_attack", min(row, size - 2), min(col, size - 2))
+    return ("use_shield",)
+
+def _cells_with_state(player, size, state):
+    """Lista las celdas del tablero de ataque que tienen un estado dado."""
+    if not isinstance(player.attack_board, list):
+        rows, cols = (player.attack_board.state == state).nonzero()
+        return list(zip(rows.tolist(), cols.tolist()))
+    return [
+        (row, col)
+        for row in range(size)
+        for col in range(size)
+        if player.attack_board[row][col]["state"] == state
+    ]
+
+def play_match(engine, policies=None, max_steps=100000):
+    """
+    Juega una partida completa sin pantalla y devuelve el ganador (o None).
+    """
+    policies = policies or (random_policy, random_policy)
+    for _ in range(max_steps):
+        if engine.done:
+            break
+        engine.step(policies[engine.turn](engine))
+    return engine.winner
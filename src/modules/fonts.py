@@ -0,0 +1,71 @@
+import pygame
+from collections import OrderedDict
+
+class FontCache:
+    """
+    Registro de fuentes por (ruta, tamaño) y caché LRU de textos renderizados
+    por (fuente, texto, color), con contadores de aciertos y fallos.
+    """
+    def __init__(self, max_text_surfaces=512):
+        self.fonts = {}
+        self.text_surfaces = OrderedDict()
+        self.max_text_surfaces = max_text_surfaces
+        self.stats = {"font_hits": 0, "font_misses": 0, "text_hits": 0, "text_misses": 0}
+        self._quit_registered = False
+
+    def get_font(self, path, size):
+        """Devuelve la fuente pedida, cargándola del disco solo la primera vez."""
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.stats["font_misses"] += 1
+            if not self._quit_registered:
+                # Las fuentes dejan de ser válidas después de pygame.quit()
+                pygame.register_quit(self.clear)
+                self._quit_registered = True
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        else:
+            self.stats["font_hits"] += 1
+        return font
+
+    def render(self, font, text, color):
+        """Devuelve la superficie del texto, reutilizando las ya renderizadas."""
+        key = (font, text, tuple(color))
+        surface = self.text_surfaces.get(key)
+        if surface is None:
+            self.stats["text_misses"] += 1
+            surface = font.render(text, True, color)
+            self.text_surfaces[key] = surface
+            if len(self.text_surfaces) > self.max_text_surfaces:
+                self.text_surfaces.popitem(last=False)
+        else:
+            self.stats["text_hits"] += 1
+            self.text_surfaces.move_to_end(key)
+        return surface
+
+    def hit_rates(self):
+        """Porcentaje de aciertos de las fuentes y de los textos."""
+        rates = {}
+        for kind in ("font", "text"):
+            hits = self.stats[f"{kind}_hits"]
+            total = hits + self.stats[f"{kind}_misses"]
+            rates[kind] = hits / total if total else 0.0
+        return rates
+
+    def clear(self):
+        """Vacía las cachés; se llama sola al ejecutar pygame.quit()."""
+        self.fonts.clear()
+        self.text_surfaces.clear()
+        self._quit_registered = False
+
+# Instancia global
+font_cache = FontCache()
+
+def get_font(path, size):
+    """Atajo para obtener una fuente del registro global."""
+    return font_cache.get_font(path, size)
+
+def render_text(font, text, color):
+    """Atajo para renderizar un texto con la caché global."""
+    return font_cache.render(font, text, color)
@@ -1,6 +1,6 @@
 import pygame
-import time
 from modules.config import config
+from modules.fonts import get_font, render_text
 from modules.utils import (
     handle_navigation_and_selection,
     can_place_ship,
@@ -12,63 +12,80 @@ from modules.utils import (
 from modules.dice import dice_turn, process_dice_roll
 from modules.buttons import draw_action_buttons, is_mouse_over_button
 from modules.ui import ui
+from modules.scheduler import scheduler
+from modules.scenes import Scene, dispatcher
 import modules.attacks_logic as attacks_logic
 
-def place_ships(screen, player_board, player_fleet, player, bot, bot_board):
+class PlacementScene(Scene):
     """
-    Permite al jugador colocar barcos en su tablero.
+    Colocación de la flota del jugador. La pantalla solo se redibuja cuando
+    cambia la celda seleccionada, la orientación o el barco en turno.
     """
-    current_ship_index = 0
-    orientation = "H"
-    selected_row, selected_col = 0, 0
+    def __init__(self, player_board, player_fleet, player, bot, bot_board):
+        super().__init__()
+        self.player_board = player_board
+        self.fleet = player_fleet
+        self.player, self.bot, self.bot_board = player, bot, bot_board
+        self.ship_index = 0
+        self.orientation = "H"
+        self.selected_row, self.selected_col = 0, 0
+        if not self.fleet:
+            self.finish(True)
 
-    while current_ship_index < len(player_fleet):
-        ship = player_fleet[current_ship_index]
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-
-            selected_row, selected_col, orientation, confirm = handle_navigation_and_selection(
-                event,
-                selected_row,
-                selected_col,
-                player_board.board_size,
-                orientation,
-                attack_type=None,
-                board=player_board,
-                screen=screen
-            )
+    def handle_event(self, event):
+        ship = self.fleet[self.ship_index]
+        before = (self.selected_row, self.selected_col, self.orientation)
+        self.selected_row, self.selected_col, self.orientation, confirm = handle_navigation_and_selection(
+            event,
+            self.selected_row,
+            self.selected_col,
+            self.player_board.board_size,
+            self.orientation,
+            attack_type=None,
+            board=self.player_board,
+            screen=ui.screen
+        )
 
-            if confirm:
-                if can_place_ship(player_board.grid, ship.size, selected_row, selected_col, orientation):
-                    place_ship_on_board(player_board, ship, selected_row, selected_col, orientation)
-                    current_ship_index += 1
-                    break
-                else:
-                    display_message(screen, "No se puede colocar el barco aquí.")
+        if confirm:
+            if can_place_ship(self.player_board.grid, ship.size, self.selected_row, self.selected_col, self.orientation):
+                place_ship_on_board(self.player_board, ship, self.selected_row, self.selected_col, self.orientation)
+                self.ship_index += 1
+                if self.ship_index == len(self.fleet):
+                    self.finish(True)
+            else:
+                display_message(ui.screen, "No se puede colocar el barco aquí.")
+            self.dirty = True
+            return
 
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_v:
-                    orientation = toggle_orientation(orientation)
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
-                orientation = toggle_orientation(orientation)
+        if (event.type == pygame.KEYDOWN and event.key == pygame.K_v) or (
+            event.type == pygame.MOUSEBUTTONDOWN and event.button == 3
+        ):
+            self.orientation = toggle_orientation(self.orientation)
+        # El movimiento del mouse dentro de la misma celda no cambia nada
+        if event.type != pygame.MOUSEMOTION or before != (self.selected_row, self.selected_col, self.orientation):
+            self.dirty = True
 
+    def draw(self, screen):
+        ship = self.fleet[self.ship_index]
         screen.fill(config.colors["background"])
-        ui.draw_game_state(screen, player, bot, player_board, bot_board, "placing_player_ships", 0)
+        ui.draw_game_state(screen, self.player, self.bot, self.player_board, self.bot_board, "placing_player_ships", 0)
         draw_central_area(
             screen,
             "placing_player_ships",
-            player=player,
+            player=self.player,
             bot_board=None,
-            selected_row=selected_row,
-            selected_col=selected_col,
-            message=f"{player.name}, coloca tu {ship.name}",
+            selected_row=self.selected_row,
+            selected_col=self.selected_col,
+            message=f"{self.player.name}, coloca tu {ship.name}",
         )
-        draw_preview(screen, player_board, selected_row, selected_col, orientation, size=ship.size)
-        pygame.display.flip()
+        draw_preview(screen, self.player_board, self.selected_row, self.selected_col, self.orientation, size=ship.size)
+        return None
 
-    return True
+def place_ships(screen, player_board, player_fleet, player, bot, bot_board):
+    """
+    Permite al jugador colocar barcos en su tablero.
+    """
+    return dispatcher.run(PlacementScene(player_board, player_fleet, player, bot, bot_board), screen)
 
 def draw_central_area(
     screen,
@@ -97,14 +114,14 @@ def draw_central_area(
     )
 
     if current_turn == "player_turn" and player:
-        dice_result = dice_turn(screen, "Tu turno: tira el dado", button_area_rect)
+        dice_result = dice_turn(screen, "Tu turno: tira el dado", button_area_rect, player.rng)
         message = process_dice_roll(dice_result, player)
         current_turn = "player_turn_attack"
 
     elif current_turn == "player_turn_attack":
         if player.turn_skipped:
             display_message(screen, "Perdiste tu turno.")
-            time.sleep(2)
+            scheduler.wait(2000)
             player.turn_skipped = False
             return "bot_turn"
         else:
@@ -117,8 +134,8 @@ def draw_central_area(
                 )
 
     if message:
-        font = pygame.font.Font(config.font_regular, 24)
-        message_text = font.render(message, True, config.colors["text"])
+        font = get_font(config.font_regular, 24)
+        message_text = render_text(font, message, config.colors["text"])
         message_text_rect = message_text.get_rect(
             center=(button_area_rect.centerx, button_area_rect.centery)
         )
@@ -0,0 +1,381 @@
+import asyncio
+import random
+import statistics
+import struct
+import time
+from modules.array_board import ArrayBoard
+from modules.player import Player
+from modules.engine import ATTACK_COSTS, GameEngine
+from modules.bot_ai import DensityTargeting
+from modules.area_attacks import RESULT_NAMES
+from modules.replay import decode_action, decode_fleet, encode_action, encode_fleet, fleet_layout, place_fleet
+
+# Cada mensaje: código (1 byte) y largo de los datos (2 bytes), seguido de los datos
+_FRAME = struct.Struct("<BH")
+JOIN, START, ACTION, RESULT, ERROR = 1, 2, 3, 4, 5
+
+_JOIN = struct.Struct("<IH")  # partida, tamaño del tablero (y después la flota)
+_START = struct.Struct("<BH")  # índice del jugador, tamaño del tablero
+# Quién actuó, dado (0 si no hubo), fin de turno, turno y fase siguientes, ganador
+# (-1 si no hay), vida y estamina de ambos jugadores, celdas y barcos hundidos
+_RESULT = struct.Struct("<BBBBBbhhhhBB")
+_CELL = struct.Struct("<HHB")  # fila, columna, resultado
+_SUNK = struct.Struct("<BHHB")  # tamaño, fila, columna, orientación
+_PHASES = ("roll", "attack", "game_over")
+LOBBY_POLL = 0.1  # Segundos entre revisiones de la conexión mientras se espera al rival
+
+def _frame(code, payload=b""):
+    return _FRAME.pack(code, len(payload)) + payload
+
+async def read_message(reader):
+    """Lee un mensaje y devuelve (código, datos)."""
+    code, length = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    return code, await reader.readexactly(length)
+
+def encode_result(actor, result, engine, sunk_ships):
+    """Codifica el resultado de una acción para enviarlo a ambos jugadores."""
+    winner = -1 if engine.winner is None else engine.players.index(engine.winner)
+    (first, second) = engine.players
+    chunks = [_RESULT.pack(
+        actor, result["dice"] or 0, result["turn_over"], engine.turn, _PHASES.index(engine.phase), winner,
+        first.life, first.stamina, second.life, second.stamina, len(result["results"]), len(sunk_ships),
+    )]
+    for row, col, cell_result in result["results"]:
+        chunks.append(_CELL.pack(row, col, RESULT_NAMES.index(cell_result)))
+    for ship in sunk_ships:
+        (row, col), last = ship.positions[0], ship.positions[-1]
+        chunks.append(_SUNK.pack(ship.size, row, col, 1 if last[0] != row else 0))
+    return b"".join(chunks)
+
+def decode_result(data):
+    """Decodifica un resultado escrito con `encode_result`."""
+    (actor, dice, turn_over, turn, phase, winner,
+     life_0, stamina_0, life_1, stamina_1, cells, sunk) = _RESULT.unpack_from(data, 0)
+    offset = _RESULT.size
+    results = []
+    for _ in range(cells):
+        row, col, code = _CELL.unpack_from(data, offset)
+        offset += _CELL.size
+        results.append((row, col, RESULT_NAMES[code]))
+    sunk_ships = []
+    for _ in range(sunk):
+        size, row, col, orientation = _SUNK.unpack_from(data, offset)
+        offset += _SUNK.size
+        cells = [(row + i, col) if orientation else (row, col + i) for i in range(size)]
+        sunk_ships.append((size, cells))
+    return {
+        "actor": actor,
+        "dice": dice or None,
+        "turn_over": bool(turn_over),
+        "turn": turn,
+        "phase": _PHASES[phase],
+        "winner": None if winner < 0 else winner,
+        "players": [(life_0, stamina_0), (life_1, stamina_1)],
+        "results": results,
+        "sunk": sunk_ships,
+    }
+
+class Match:
+    """Una partida del servidor: el motor con las reglas y las conexiones de ambos jugadores."""
+    def __init__(self, match_id, board_size, seed=None):
+        self.match_id = match_id
+        self.board_size = board_size
+        self.engine = GameEngine(
+            board_size=board_size, rng=random.Random(seed), place_fleets=False, compact=True
+        )
+        self.writers = []
+        self.ready = asyncio.Event()  # Se activa cuando se unen los dos jugadores
+        self.reported = set()  # Barcos hundidos ya avisados a los clientes
+        self.actions = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.started = None
+        self.finished = None
+        self.abandoned = None  # Índice del jugador que se desconectó, si alguno
+
+    @property
+    def stats(self):
+        duration = (self.finished or time.perf_counter()) - (self.started or time.perf_counter())
+        winner = self.engine.winner
+        return {
+            "match": self.match_id,
+            "winner": None if winner is None else self.engine.players.index(winner),
+            "rounds": self.engine.current_round,
+            "actions": self.actions,
+            "duration": duration,
+            "actions_per_second": self.actions / duration if duration else 0.0,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "abandoned": self.abandoned,
+        }
+
+class GameServer:
+    """
+    Servidor de partidas en red. Cada partida la juegan los dos primeros
+    clientes que se unen con el mismo identificador; el servidor tira los
+    dados y resuelve los ataques con su propio GameEngine, y los clientes
+    solo envían acciones y reciben resultados.
+    """
+    def __init__(self, host="127.0.0.1", port=0, seed=None):
+        self.host = host
+        self.port = port
+        self.seeds = random.Random(seed)
+        self.matches = {}
+        self.finished = []  # Estadísticas de las partidas terminadas
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _send(self, match, writer, code, payload=b""):
+        frame = _frame(code, payload)
+        match.bytes_out += len(frame)
+        writer.write(frame)
+        await writer.drain()
+
+    async def _join(self, reader, writer):
+        """Registra al cliente en su partida; devuelve (partida, índice) cuando ambos están listos."""
+        code, data = await read_message(reader)
+        if code != JOIN:
+            raise ValueError("Se esperaba un mensaje de unión a partida.")
+        match_id, board_size = _JOIN.unpack_from(data, 0)
+        layout, _ = decode_fleet(data, _JOIN.size)
+
+        match = self.matches.get(match_id)
+        if match is None:
+            match = self.matches[match_id] = Match(match_id, board_size, self.seeds.getrandbits(63))
+        if board_size != match.board_size or len(match.writers) >= 2:
+            raise ValueError("La partida está llena o usa otro tamaño de tablero.")
+        index = len(match.writers)
+        match.bytes_in += _FRAME.size + len(data)
+        place_fleet(match.engine.players[index], layout)
+        match.writers.append(writer)
+
+        if len(match.writers) == 2:
+            match.started = time.perf_counter()
+            for player_index, player_writer in enumerate(match.writers):
+                await self._send(match, player_writer, START, _START.pack(player_index, board_size))
+            match.ready.set()
+        await self._wait_for_rival(match, reader)
+        return match, index
+
+    async def _wait_for_rival(self, match, reader):
+        """
+        Espera al segundo jugador revisando que el primero siga conectado (sin
+        leer de su conexión); si se va antes, la partida a medio llenar se
+        descarta para que el siguiente cliente empiece una nueva.
+        """
+        while not match.ready.is_set():
+            if reader.at_eof() or reader.exception() is not None:
+                if self.matches.get(match.match_id) is match:
+                    del self.matches[match.match_id]
+                raise ConnectionError("El jugador se desconectó antes de empezar la partida.")
+            try:
+                await asyncio.wait_for(match.ready.wait(), LOBBY_POLL)
+            except asyncio.TimeoutError:
+                pass
+
+    def _finish(self, match):
+        """Guarda las estadísticas de la partida y libera su identificador."""
+        if match.finished is None:
+            match.finished = time.perf_counter()
+            self.finished.append(match.stats)
+            self.matches.pop(match.match_id, None)
+
+    async def _abandon(self, match, index, reason):
+        """
+        Termina una partida porque el jugador `index` se desconectó o falló:
+        avisa al rival con un ERROR y cierra ambas conexiones.
+        """
+        if match.finished is not None:
+            return
+        match.abandoned = index
+        self._finish(match)
+        for player_index, player_writer in enumerate(match.writers):
+            if player_index != index and not player_writer.is_closing():
+                try:
+                    await self._send(match, player_writer, ERROR, reason.encode("utf-8"))
+                except ConnectionError:
+                    pass
+            player_writer.close()
+
+    async def _play(self, match, index, reader, writer):
+        """Atiende las acciones de un jugador hasta que la partida termine."""
+        engine = match.engine
+        while not engine.done and match.finished is None:
+            code, data = await read_message(reader)
+            match.bytes_in += _FRAME.size + len(data)
+            if code != ACTION:
+                continue
+            action, _ = decode_action(data)
+            if action[0] == "roll":
+                action = ("roll",)  # El servidor tira el dado
+            if engine.turn != index:
+                await self._send(match, writer, ERROR, "No es tu turno.".encode("utf-8"))
+                continue
+            try:
+                result = engine.step(action)
+            except ValueError as error:
+                await self._send(match, writer, ERROR, str(error).encode("utf-8"))
+                continue
+            match.actions += 1
+            sunk = [
+                ship for ship in engine.players[1 - index].fleet
+                if ship.sunk and ship.ship_id not in match.reported
+            ]
+            match.reported.update(ship.ship_id for ship in sunk)
+            payload = encode_result(index, result, engine, sunk)
+            for player_index, player_writer in enumerate(match.writers):
+                try:
+                    await self._send(match, player_writer, RESULT, payload)
+                except ConnectionError:
+                    await self._abandon(match, player_index, "El rival se desconectó.")
+                    return
+        self._finish(match)
+
+    async def _handle(self, reader, writer):
+        match = index = None
+        try:
+            match, index = await self._join(reader, writer)
+            await self._play(match, index, reader, writer)
+        except (ValueError, struct.error) as error:
+            if match is None:
+                writer.write(_frame(ERROR, str(error).encode("utf-8")))
+            else:
+                await self._abandon(match, index, f"El rival envió un mensaje inválido: {error}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            if match is not None:
+                await self._abandon(match, index, "El rival se desconectó.")
+        finally:
+            writer.close()
+
+def choose_action(targeting, stamina, phase, rng):
+    """Elige la acción del cliente con su mapa de densidad, como `density_policy`."""
+    if phase == "roll":
+        return ("roll", 0)
+    attack_type = "normal_attack" if stamina < 4 else rng.choice(list(ATTACK_COSTS))
+    if stamina < ATTACK_COSTS[attack_type]:
+        attack_type = "normal_attack"
+    if attack_type == "normal_attack":
+        return ("normal_attack", *targeting.choose_target(rng))
+    if attack_type == "line_attack":
+        return ("line_attack", *targeting.choose_line(rng))
+    if attack_type == "square_attack":
+        return ("square_attack", *targeting.choose_square(rng))
+    return ("use_shield",)
+
+async def play_client(host, port, match_id, board_size=12, seed=None, timeout=30.0):
+    """
+    Juega una partida en red con el bot de densidad: coloca su flota, la
+    envía al unirse y responde a cada turno propio. Devuelve el ganador y la
+    latencia de cada acción (de enviarla a recibir su resultado) en segundos.
+    Ya empezada la partida, si el servidor no responde en `timeout` segundos
+    se lanza TimeoutError.
+    """
+    rng = random.Random(seed)
+    player = Player("Red", ArrayBoard(board_size), rng=rng)
+    player.place_fleet_randomly()
+    targeting = DensityTargeting(board_size, player.fleet)
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(_frame(JOIN, _JOIN.pack(match_id, board_size) + encode_fleet(fleet_layout(player))))
+        await writer.drain()
+        code, data = await read_message(reader)  # Sin límite: se espera a que se una el rival
+        if code != START:
+            raise ValueError(data.decode("utf-8"))
+        index, _ = _START.unpack(data)
+
+        latencies = []
+        turn, phase, stamina = 0, "roll", player.stamina
+        while True:
+            if turn == index:
+                sent = time.perf_counter()
+                writer.write(_frame(ACTION, encode_action(choose_action(targeting, stamina, phase, rng))))
+                await writer.drain()
+            code, data = await asyncio.wait_for(read_message(reader), timeout)
+            if code == ERROR:
+                raise ValueError(data.decode("utf-8"))
+            result = decode_result(data)
+            if result["actor"] == index:
+                latencies.append(time.perf_counter() - sent)
+                for row, col, cell_result in result["results"]:
+                    targeting.record(row, col, cell_result)
+                for size, cells in result["sunk"]:
+                    targeting.on_ship_sunk(size, cells)
+            turn, phase = result["turn"], result["phase"]
+            stamina = result["players"][index][1]
+            if phase == "game_over":
+                return {"index": index, "winner": result["winner"], "latencies": latencies}
+    finally:
+        writer.close()
+
+def _latency_summary(latencies):
+    if not latencies:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(latencies)
+    return {
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+async def run_loopback(matches=10, board_size=12, seed=None):
+    """
+    Levanta un servidor local y juega `matches` partidas simultáneas entre
+    clientes en el mismo proceso. Devuelve las estadísticas de cada partida
+    (con la latencia vista por los clientes) y las totales.
+    """
+    seeds = random.Random(seed)
+    server = await GameServer(seed=seeds.getrandbits(63)).start()
+    start = time.perf_counter()
+    try:
+        clients = await asyncio.gather(*(
+            play_client(server.host, server.port, match_id, board_size, seeds.getrandbits(63))
+            for match_id in range(matches) for _ in range(2)
+        ))
+    finally:
+        await server.close()
+    elapsed = time.perf_counter() - start
+
+    latencies = {}
+    for match_id in range(matches):
+        latencies[match_id] = clients[2 * match_id]["latencies"] + clients[2 * match_id + 1]["latencies"]
+    report = sorted(server.finished, key=lambda stats: stats["match"])
+    for stats in report:
+        stats["latency"] = _latency_summary(latencies[stats["match"]])
+    actions = sum(stats["actions"] for stats in report)
+    return {
+        "matches": report,
+        "elapsed": elapsed,
+        "actions": actions,
+        "actions_per_second": actions / elapsed if elapsed else 0.0,
+        "latency": _latency_summary([value for values in latencies.values() for value in values]),
+    }
+
+def format_loopback(report, limit=10):
+    """Devuelve el reporte de `run_loopback` en texto."""
+    lines = [f"{'Partida':>8}{'Ganador':>9}{'Rondas':>8}{'Acciones':>10}{'Acc/s':>9}{'Media ms':>10}{'p95 ms':>9}"]
+    for stats in report["matches"][:limit]:
+        latency = stats["latency"]
+        lines.append(
+            f"{stats['match']:>8}{str(stats['winner']):>9}{stats['rounds']:>8}{stats['actions']:>10}"
+            f"{stats['actions_per_second']:>9.0f}{latency['mean_ms']:>10.2f}{latency['p95_ms']:>9.2f}"
+        )
+    if len(report["matches"]) > limit:
+        lines.append(f"... y {len(report['matches']) - limit} partidas más")
+    latency = report["latency"]
+    lines.append("")
+    lines.append(
+        f"{len(report['matches'])} partidas en {report['elapsed']:.2f} s: {report['actions_per_second']:,.0f} acciones/s, "
+        f"latencia media {latency['mean_ms']:.2f} ms (p95 {latency['p95_ms']:.2f} ms)"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,101 @@
+import os
+from collections import Counter
+import numpy as np
+from modules.config import config
+from modules.warships import create_fleet
+
+# Las rutas relativas del caché se toman desde la raíz del proyecto, no desde el directorio actual
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class PlacementTables:
+    """
+    Conteos precalculados, para un tablero vacío, de cuántas posiciones de un
+    barco de cada tamaño cubren cada celda. El mapa de densidad inicial de
+    una flota es la suma de estos conteos por la cantidad de barcos.
+    """
+    def __init__(self, board_size, counts):
+        self.board_size = board_size
+        self.counts = counts  # tamaño -> arreglo (n, n) int32
+
+    def density(self, remaining):
+        """Mapa de densidad de un tablero vacío para la flota `remaining` (tamaño -> cantidad)."""
+        density = np.zeros((self.board_size, self.board_size), dtype=np.int64)
+        for size, count in remaining.items():
+            if count:
+                density += count * self.counts[size]
+        return density
+
+def fleet_key(fleet):
+    """Clave de una flota por sus tamaños, por ejemplo "6x1-4x1-3x2-2x3-1x4"."""
+    sizes = Counter(ship.size for ship in fleet)
+    return "-".join(f"{size}x{sizes[size]}" for size in sorted(sizes, reverse=True))
+
+def placement_counts(board_size, size):
+    """
+    Posiciones de un barco de tamaño `size` que cubren cada celda de un
+    tablero vacío, en ambas orientaciones (una sola si mide 1 celda).
+    """
+    n = board_size
+    if size > n:
+        return np.zeros((n, n), dtype=np.int32)
+    # Inicios de la ventana de tamaño `size` que contienen cada índice de una línea
+    index = np.arange(n)
+    line = np.minimum(index, n - size) - np.maximum(0, index - size + 1) + 1
+    counts = line[None, :] * np.ones((n, 1), dtype=np.int32)
+    if size > 1:
+        counts = counts + line[:, None]
+    return counts.astype(np.int32)
+
+def _cache_path(board_size, key, cache_dir):
+    return os.path.join(PROJECT_ROOT, os.path.expanduser(cache_dir), f"{board_size}_{key}.npy")
+
+def _read_cache(path, board_size, sizes):
+    try:
+        table = np.load(path)
+    except (OSError, ValueError):
+        return None
+    if table.shape != (len(sizes), board_size, board_size) or table.dtype != np.int32:
+        return None  # Archivo de otra versión o dañado: se vuelve a calcular
+    return table
+
+def _write_cache(path, table):
+    """Guarda la tabla; se escribe aparte y se reemplaza, para no dejar archivos a medias."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Nombre propio de cada proceso, para que los procesos de un pool no se pisen
+        temp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(temp_path, table)
+        os.replace(temp_path, path)
+    except OSError:
+        pass  # Sin permiso de escritura la tabla solo queda en memoria
+
+_tables = {}  # (tamaño del tablero, clave de la flota, carpeta del caché) -> PlacementTables
+
+def load_placement_tables(board_size, fleet=None, cache_dir=None):
+    """
+    Tablas de conteos para `board_size` y la flota indicada (por defecto, la
+    de create_fleet). Se calculan una vez por proceso y se guardan en memoria
+    con la clave (tamaño del tablero, flota). Con `cache_dir`, o con
+    `config.PLACEMENT_CACHE_DIR` (variable SEVEN_SEAS_PLACEMENT_CACHE), se
+    leen y se guardan también en disco para compartirlas entre procesos.
+    """
+    fleet = fleet if fleet is not None else create_fleet()
+    key = fleet_key(fleet)
+    cache_dir = cache_dir if cache_dir is not None else config.PLACEMENT_CACHE_DIR
+    tables = _tables.get((board_size, key, cache_dir))
+    if tables is not None:
+        return tables
+
+    sizes = sorted({ship.size for ship in fleet}, reverse=True)
+    path = _cache_path(board_size, key, cache_dir) if cache_dir else None
+    table = _read_cache(path, board_size, sizes) if path else None
+    if table is None:
+        table = np.stack([placement_counts(board_size, size) for size in sizes]) if sizes else (
+            np.zeros((0, board_size, board_size), dtype=np.int32)
+        )
+        if path:
+            _write_cache(path, table)
+
+    tables = PlacementTables(board_size, dict(zip(sizes, table)))
+    _tables[(board_size, key, cache_dir)] = tables
+    return tables
@@ -1,35 +1,78 @@
 import random
+import numpy as np
 from modules.warships import create_fleet
+from modules.cell_index import UnattackedCells
+from modules.area_attacks import RESULT_HIT, RESULT_SHIELDED
 
 class Player:
-    def __init__(self, name, board):
+    def __init__(self, name, board, attack_board=None, rng=None):
         """
         Inicializa un jugador con su nombre, tablero, flota, vida y habilidades.
+        `attack_board` permite usar un tablero de ataque compacto (ArrayAttackBoard).
+        `rng` es el generador de sus decisiones al azar (por defecto, el módulo random).
         """
         self.name = name
+        self.rng = rng if rng is not None else random
         self.board = board
         self.fleet = create_fleet()
         self.life = sum(ship.size for ship in self.fleet)
+        self.ships_afloat = len(self.fleet)
+        self.sunk_events = []  # Barcos hundidos que aún no se han avisado al atacante
         self.stamina = 5
-        self.placed_ships = []
+        self.placed_ships = set()  # Celdas ocupadas, para comprobar en O(1)
         self.turn_skipped = False
         self.temp_shield = False
-        self.attack_board = [
-            [{"color": None, "state": 0, "ship": None} for _ in range(board.board_size)]
-            for _ in range(board.board_size)
-        ]
-        self.last_attack_type = None    
+        if attack_board is None:
+            attack_board = [
+                [{"color": None, "state": 0, "ship": None} for _ in range(board.board_size)]
+                for _ in range(board.board_size)
+            ]
+        self.attack_board = attack_board
+        self.unattacked = UnattackedCells(board.board_size)  # Celdas del rival sin atacar
+        self.last_attack_type = None
+        self.targeting = None  # Estrategia de puntería del bot (por ejemplo, DensityTargeting)
 
-    def place_fleet_randomly(self):
-        """Coloca toda la flota aleatoriamente en el tablero."""
+    def place_fleet_randomly(self, attempts=20, rng=None):
+        """
+        Coloca toda la flota aleatoriamente en el tablero.
+        Primero prueba posiciones al azar; si fallan, elige entre las posiciones válidas.
+        """
+        rng = rng if rng is not None else self.rng
         orientations = ["H", "V"]
         for ship in self.fleet:
             placed = False
-            while not placed:
-                orientation = random.choice(orientations)
-                start_row = random.randint(0, self.board.board_size - 1)
-                start_col = random.randint(0, self.board.board_size - 1)
-                placed = self.place_ship(ship, start_row, start_col, orientation)
+            for _ in range(attempts):
+                orientation = rng.choice(orientations)
+                start_row = rng.randint(0, self.board.board_size - 1)
+                start_col = rng.randint(0, self.board.board_size - 1)
+                if self.place_ship(ship, start_row, start_col, orientation):
+                    placed = True
+                    break
+            if not placed:
+                slots = list(self.valid_placements(ship.size))
+                if not slots:
+                    raise ValueError(f"No hay espacio para colocar {ship.name}.")
+                self.place_ship(ship, *rng.choice(slots))
+
+    def valid_placements(self, size):
+        """
+        Genera todas las posiciones (fila, columna, orientación) donde cabe un barco.
+        """
+        board_size = self.board.board_size
+        for row in range(board_size):
+            free = 0
+            for col in range(board_size):
+                free = 0 if (row, col) in self.placed_ships else free + 1
+                if free >= size:
+                    yield row, col - size + 1, "H"
+        if size == 1:
+            return  # Un barco de una celda es igual en ambas orientaciones
+        for col in range(board_size):
+            free = 0
+            for row in range(board_size):
+                free = 0 if (row, col) in self.placed_ships else free + 1
+                if free >= size:
+                    yield row - size + 1, col, "V"
 
     def place_ship(self, ship, start_row, start_col, orientation):
         """
@@ -40,8 +83,8 @@ class Player:
 
         ship.place((start_row, start_col), orientation, self.board.board_size)
         for pos in ship.positions:
-            self.placed_ships.append(pos)
-            self.board.update_cell(pos[0], pos[1], state=1, ship=ship.name)
+            self.placed_ships.add(pos)
+            self.board.update_cell(pos[0], pos[1], state=1, ship=ship.name, ship_id=ship.ship_id)
         return True
 
     def can_place_ship(self, ship, start_row, start_col, orientation):
@@ -61,18 +104,52 @@ class Player:
         """
         Recibe un ataque en una posición específica.
         """
-        cell = self.board.grid[row][col]
-        if cell["state"] == 1 or self.temp_shield:
-            if self.temp_shield:
-                self.temp_shield = False
-                return "shielded"
-            cell["state"] = 3
+        if self.temp_shield:
+            self.temp_shield = False
+            return "shielded"
+        result = self.board.receive_attack(row, col)
+        if result == "hit":
             self.life -= 1
-            return "hit"
-        elif cell["state"] == 0:
-            cell["state"] = 2
-            return "miss"
-        return "already_attacked"
+            self._ship_hit(self.board.ship_id_at(row, col))
+        return result
+
+    def receive_area_attack(self, rows, cols):
+        """
+        Recibe un ataque sobre varias celdas a la vez y devuelve el código de
+        resultado de cada una. Como en `receive_attack`, el escudo bloquea
+        solo la primera celda y se gasta.
+        """
+        if self.temp_shield and len(rows):
+            self.temp_shield = False
+            codes = np.concatenate((
+                np.array([RESULT_SHIELDED], dtype=np.int8),
+                self.board.receive_cells(rows[1:], cols[1:]),
+            ))
+        else:
+            codes = self.board.receive_cells(rows, cols)
+        hits = codes == RESULT_HIT
+        self.life -= int(np.count_nonzero(hits))
+        for row, col in zip(rows[hits].tolist(), cols[hits].tolist()):
+            self._ship_hit(self.board.ship_id_at(row, col))
+        return codes
+
+    def _ship_hit(self, ship_id):
+        """Descuenta un impacto al barco `ship_id` y registra si se hundió."""
+        if not ship_id:
+            return
+        ship = self.fleet[ship_id - 1]
+        if ship.register_hit():
+            self.ships_afloat -= 1
+            self.sunk_events.append(ship)
+
+    def pop_sunk(self):
+        """Devuelve y olvida los barcos hundidos desde la última llamada."""
+        sunk, self.sunk_events = self.sunk_events, []
+        return sunk
+
+    def fleet_status(self):
+        """Lista de (nombre, tamaño, impactos restantes) de cada barco de la flota."""
+        return [(ship.name, ship.size, ship.remaining) for ship in self.fleet]
 
     def attack(self, opponent_board, row, col):
         """
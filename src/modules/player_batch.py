@@ -0,0 +1,101 @@
+import numpy as np
+from modules.warships import create_fleet
+
+# Códigos del último ataque, en el mismo orden que los botones (-1: ninguno)
+ATTACK_TYPES = ("normal_attack", "line_attack", "square_attack", "use_shield")
+NO_ATTACK = -1
+UNPLACED = -1
+
+# Nombres de Player que acepta roll_many como claves del lote
+_ALIASES = {"shield": "temp_shield", "skip": "turn_skipped"}
+
+class PlayerBatch:
+    """
+    Estado de los dos jugadores de `n_games` partidas simultáneas como
+    arreglos contiguos: cada arreglo se indexa [jugador, partida] (y barco,
+    en los de la flota). Sirve para simuladores y bucles de entrenamiento
+    que actualizan todas las partidas a la vez; `load` copia en el lote el
+    estado de objetos Player.
+    """
+    def __init__(self, n_games, names=("Jugador", "Bot"), stamina=5):
+        fleet = create_fleet()
+        self.n_games = n_games
+        self.names = tuple(names)
+        self.ship_names = tuple(ship.name for ship in fleet)
+        self.ship_sizes = np.array([ship.size for ship in fleet], dtype=np.int16)
+        shape = (2, n_games)
+
+        self.life = np.full(shape, self.ship_sizes.sum(), dtype=np.int32)
+        self.stamina = np.full(shape, stamina, dtype=np.int32)
+        self.temp_shield = np.zeros(shape, dtype=bool)
+        self.turn_skipped = np.zeros(shape, dtype=bool)
+        self.last_attack = np.full(shape, NO_ATTACK, dtype=np.int8)
+
+        # Flota: impactos y posición (fila, columna y orientación de la proa) de cada barco
+        ships = (*shape, len(fleet))
+        self.ship_hits = np.zeros(ships, dtype=np.int16)
+        self.ship_row = np.zeros(ships, dtype=np.int16)
+        self.ship_col = np.zeros(ships, dtype=np.int16)
+        self.ship_orientation = np.full(ships, UNPLACED, dtype=np.int8)
+
+    def __getitem__(self, key):
+        return getattr(self, _ALIASES.get(key, key))
+
+    def __contains__(self, key):
+        return hasattr(self, _ALIASES.get(key, key))
+
+    @property
+    def ships_afloat(self):
+        """Barcos a flote de cada jugador en cada partida."""
+        return np.count_nonzero(self.ship_hits < self.ship_sizes, axis=-1)
+
+    def hit_ships(self, player, games, ships):
+        """
+        Registra un impacto en el barco `ships` del jugador `player` en cada
+        partida de `games` y le descuenta la vida solo por los impactos que
+        entran: un barco hundido no se puede volver a alcanzar, igual que en
+        Player.receive_attack. Devuelve la máscara de los barcos que se
+        hundieron con ese impacto.
+        """
+        games, ships = np.asarray(games), np.asarray(ships)
+        hits = self.ship_hits[player]
+        sizes = self.ship_sizes[ships]
+        touched = np.unique(games)
+        before_total = hits[touched].sum(axis=-1)
+        before = hits[games, ships]
+        np.add.at(hits, (games, ships), 1)
+        np.minimum(hits, self.ship_sizes, out=hits)
+        self.life[player, touched] -= hits[touched].sum(axis=-1) - before_total
+        return (before < sizes) & (hits[games, ships] >= sizes)
+
+    def end_turn(self, player, games):
+        """Estamina de fin de turno: +2 tras un ataque normal, +1 en otro caso."""
+        self.stamina[player, games] += np.where(self.last_attack[player, games] == 0, 2, 1)
+
+    def load(self, game, players):
+        """Copia el estado de dos objetos Player en la partida `game`."""
+        for index, player in enumerate(players):
+            self.life[index, game] = player.life
+            self.stamina[index, game] = player.stamina
+            self.temp_shield[index, game] = player.temp_shield
+            self.turn_skipped[index, game] = player.turn_skipped
+            self.last_attack[index, game] = (
+                NO_ATTACK if player.last_attack_type is None else ATTACK_TYPES.index(player.last_attack_type)
+            )
+            for ship_index, ship in enumerate(player.fleet):
+                self.ship_hits[index, game, ship_index] = ship.hits
+                if ship.positions:
+                    (row, col), last = ship.positions[0], ship.positions[-1]
+                    self.ship_row[index, game, ship_index] = row
+                    self.ship_col[index, game, ship_index] = col
+                    self.ship_orientation[index, game, ship_index] = int(last[0] != row)
+                else:
+                    self.ship_orientation[index, game, ship_index] = UNPLACED
+
+    @classmethod
+    def from_players(cls, games):
+        """Crea un lote a partir de una lista de pares (jugador, rival) de Player."""
+        batch = cls(len(games), names=tuple(player.name for player in games[0]) if games else ("Jugador", "Bot"))
+        for game, players in enumerate(games):
+            batch.load(game, players)
+        return batch
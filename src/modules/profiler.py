@@ -0,0 +1,190 @@
+import csv
+import functools
+import json
+import os
+import time
+from collections import deque
+import pygame
+from modules.config import config
+from modules.fonts import font_cache
+
+class _NullSection:
+    """Sección vacía para cuando el perfilador está apagado."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class _Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+class Profiler:
+    """
+    Medición opcional del tiempo de cada cuadro por secciones. Apagado no
+    cuesta nada: `timed` devuelve la función original y `section` un contexto
+    vacío. Encendido guarda los milisegundos de cada sección por cuadro,
+    dibuja un panel con FPS, secciones y aciertos de caché, y puede volcar
+    los datos a CSV o JSON.
+    """
+    def __init__(self, enabled=False, output=None, window=60, max_frames=100000):
+        self.enabled = enabled
+        self.output = output
+        self.window = window  # Cuadros que se promedian en el panel
+        self.frames = deque(maxlen=max_frames)  # (milisegundos del cuadro, {sección: ms})
+        self.current = {}
+        self.calls = {}
+        self.last_frame = None
+        self._overlay = None
+        self._overlay_updated = 0
+        self._font = None
+        self._quit_registered = False
+
+    def _register_quit(self):
+        if not self._quit_registered:
+            pygame.register_quit(self._on_quit)
+            self._quit_registered = True
+
+    def _on_quit(self):
+        """Al cerrar pygame se guardan los datos y se suelta la fuente, que deja de ser válida."""
+        self.dump()
+        self._font = None
+        self._overlay = None
+        self._quit_registered = False
+
+    def timed(self, name=None):
+        """Decorador que mide cada llamada a la función como una sección."""
+        def decorate(func):
+            if not self.enabled:
+                return func
+            section = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.add(section, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def section(self, name):
+        """Contexto que mide un bloque de código como una sección."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds * 1000
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def end_frame(self):
+        """Cierra el cuadro actual; se llama una vez por cuadro desde `ui.update_display`."""
+        if not self.enabled:
+            return
+        self._register_quit()
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.frames.append(((now - self.last_frame) * 1000, self.current))
+        self.last_frame = now
+        self.current = {}
+
+    def summary(self, last=None):
+        """Promedio y máximo en ms de cada sección en los últimos `last` cuadros."""
+        frames = list(self.frames)[-last:] if last else list(self.frames)
+        sections = {}
+        for _, times in frames:
+            for name, ms in times.items():
+                total, peak = sections.get(name, (0.0, 0.0))
+                sections[name] = (total + ms, max(peak, ms))
+        count = max(1, len(frames))
+        frame_ms = sum(ms for ms, _ in frames) / count
+        return {
+            "frames": len(frames),
+            "frame_ms": frame_ms,
+            "fps": 1000 / frame_ms if frame_ms else 0.0,
+            "sections": {
+                name: {"mean_ms": total / count, "max_ms": peak}
+                for name, (total, peak) in sorted(sections.items(), key=lambda item: -item[1][0])
+            },
+            "cache_hit_rates": font_cache.hit_rates(),
+        }
+
+    def draw_overlay(self, screen, position=(10, 10), max_sections=8):
+        """
+        Dibuja el panel de rendimiento y devuelve su rectángulo. Usa su propia
+        fuente, sin las cachés compartidas, para no alterar sus estadísticas,
+        y el texto solo se actualiza cuatro veces por segundo.
+        """
+        if self._font is None:
+            self._register_quit()
+            self._font = pygame.font.Font(config.font_regular, 14)
+        font = self._font
+        now = pygame.time.get_ticks()
+        if self._overlay is None or now - self._overlay_updated >= 250:
+            stats = self.summary(self.window)
+            lines = [f"FPS {stats['fps']:.0f}  cuadro {stats['frame_ms']:.1f} ms"]
+            for name, section in list(stats["sections"].items())[:max_sections]:
+                lines.append(f"{name}: {section['mean_ms']:.2f} ms (máx {section['max_ms']:.1f})")
+            rates = stats["cache_hit_rates"]
+            lines.append(f"Caché fuentes {rates['font']:.0%}  textos {rates['text']:.0%}")
+
+            texts = [font.render(line, True, (255, 255, 255)) for line in lines]
+            width = max(text.get_width() for text in texts) + 12
+            height = sum(text.get_height() for text in texts) + 12
+            self._overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 170))
+            y = 6
+            for text in texts:
+                self._overlay.blit(text, (6, y))
+                y += text.get_height()
+            self._overlay_updated = now
+        return screen.blit(self._overlay, position)
+
+    def dump(self, path=None):
+        """Guarda los cuadros medidos en CSV (si la ruta termina en .csv) o JSON."""
+        path = path or self.output
+        if not path or not self.frames:
+            return
+        names = sorted({name for _, times in self.frames for name in times})
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["frame", "frame_ms", *names])
+                for index, (frame_ms, times) in enumerate(self.frames):
+                    writer.writerow([index, f"{frame_ms:.3f}", *(f"{times.get(name, 0.0):.3f}" for name in names)])
+        else:
+            data = {
+                "summary": self.summary(),
+                "calls": self.calls,
+                "frames": [{"frame_ms": frame_ms, "sections": times} for frame_ms, times in self.frames],
+            }
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=1)
+
+def _from_environment():
+    """
+    SEVEN_SEAS_PROFILE activa el perfilador: con "1" solo muestra el panel;
+    con una ruta (.csv o .json) además guarda los datos al cerrar el juego.
+    """
+    value = os.environ.get("SEVEN_SEAS_PROFILE", "")
+    if not value or value == "0":
+        return Profiler()
+    output = None if value.lower() in ("1", "true", "yes") else value
+    return Profiler(enabled=True, output=output)
+
+# Instancia global
+profiler = _from_environment()
@@ -0,0 +1,191 @@
+import argparse
+import struct
+
+LOG_MAGIC = b"SSSL"
+LOG_VERSION = 1
+MAX_SEED = 2 ** 64  # La semilla se guarda como entero sin signo de 64 bits
+
+# Cabecera: firma, versión, tamaño del tablero, semilla y si la semilla es conocida
+_HEADER = struct.Struct("<4sBHQB")
+_SHIP = struct.Struct("<HHB")  # fila, columna, orientación (0 = H, 1 = V)
+_COUNT = struct.Struct("<B")
+
+# Código de cada acción y el formato de sus datos
+_ACTION_CODES = {
+    "roll": 0,
+    "normal_attack": 1,
+    "line_attack": 2,
+    "square_attack": 3,
+    "use_shield": 4,
+}
+_ACTION_NAMES = {code: name for name, code in _ACTION_CODES.items()}
+_PAYLOADS = {
+    "roll": struct.Struct("<B"),  # resultado del dado
+    "normal_attack": struct.Struct("<HH"),  # fila, columna
+    "line_attack": struct.Struct("<HHB"),  # fila, columna, orientación
+    "square_attack": struct.Struct("<HH"),  # fila, columna
+    "use_shield": struct.Struct("<"),
+}
+_ORIENTATIONS = ("H", "V")
+
+def check_seed(seed):
+    """Comprueba que la semilla cabe en la cabecera del registro (0 <= semilla < 2**64)."""
+    if seed is not None and not 0 <= seed < MAX_SEED:
+        raise ValueError(f"La semilla debe estar entre 0 y {MAX_SEED - 1}: {seed}")
+    return seed
+
+def seed_argument(text):
+    """Tipo de argparse para las opciones --seed."""
+    try:
+        return check_seed(int(text))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+def encode_action(action):
+    """Codifica una acción de `GameEngine.step` (las tiradas, con su resultado)."""
+    kind, *args = action
+    if kind == "line_attack":
+        args = [args[0], args[1], _ORIENTATIONS.index(args[2] if len(args) > 2 else "H")]
+    return _COUNT.pack(_ACTION_CODES[kind]) + _PAYLOADS[kind].pack(*args)
+
+def decode_action(data, offset=0):
+    """Decodifica una acción escrita con `encode_action`; devuelve (acción, desplazamiento final)."""
+    (code,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    kind = _ACTION_NAMES.get(code)
+    if kind is None:
+        raise ValueError(f"Código de acción desconocido: {code}")
+    args = list(_PAYLOADS[kind].unpack_from(data, offset))
+    offset += _PAYLOADS[kind].size
+    if kind == "line_attack":
+        args[2] = _ORIENTATIONS[args[2]]
+    return (kind, *args), offset
+
+def fleet_layout(player):
+    """Posición inicial (fila, columna, orientación) de cada barco del jugador."""
+    layout = []
+    for ship in player.fleet:
+        if not ship.positions:
+            raise ValueError(f"{ship.name} todavía no está colocado.")
+        (row, col), last = ship.positions[0], ship.positions[-1]
+        layout.append((row, col, "V" if last[0] != row else "H"))
+    return layout
+
+def encode_fleet(layout):
+    """Codifica la colocación de una flota: cantidad de barcos y (fila, columna, orientación) de cada uno."""
+    chunks = [_COUNT.pack(len(layout))]
+    for row, col, orientation in layout:
+        chunks.append(_SHIP.pack(row, col, _ORIENTATIONS.index(orientation)))
+    return b"".join(chunks)
+
+def decode_fleet(data, offset=0):
+    """Decodifica una flota escrita con `encode_fleet`; devuelve (colocación, desplazamiento final)."""
+    (ships,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    layout = []
+    for _ in range(ships):
+        row, col, orientation = _SHIP.unpack_from(data, offset)
+        offset += _SHIP.size
+        layout.append((row, col, _ORIENTATIONS[orientation]))
+    return layout, offset
+
+class MoveLog:
+    """
+    Registro compacto de una partida: la colocación de las flotas y cada
+    acción con el dado ya resuelto, en el formato de `GameEngine.step`.
+    Basta para repetir la partida sin volver a usar el generador aleatorio.
+
+    Solo GameEngine graba partidas (con su parámetro `log`): las partidas
+    con ventana de main.py no pasan por el motor y no se registran; para
+    repetirlas basta con su semilla (--seed).
+    """
+    def __init__(self, board_size, seed=None):
+        self.board_size = board_size
+        self.seed = check_seed(seed)
+        self.fleets = []  # Una lista de (fila, columna, orientación) por jugador
+        self.actions = []
+
+    def __len__(self):
+        return len(self.actions)
+
+    def clear(self):
+        self.fleets = []
+        self.actions = []
+
+    def record_fleets(self, players):
+        self.fleets = [fleet_layout(player) for player in players]
+
+    def record(self, action):
+        """Añade una acción; las tiradas deben llevar su resultado."""
+        kind = action[0]
+        if kind not in _ACTION_CODES:
+            raise ValueError(f"Acción desconocida: {kind}")
+        if kind == "roll" and len(action) < 2:
+            raise ValueError("La tirada del registro necesita su resultado.")
+        if kind == "line_attack" and len(action) < 4:
+            action = (*action, "H")
+        self.actions.append(tuple(action))
+
+    def to_bytes(self):
+        """Serializa el registro en binario."""
+        chunks = [_HEADER.pack(
+            LOG_MAGIC, LOG_VERSION, self.board_size, self.seed or 0, self.seed is not None
+        )]
+        chunks.append(_COUNT.pack(len(self.fleets)))
+        chunks.extend(encode_fleet(fleet) for fleet in self.fleets)
+
+        chunks.extend(encode_action(action) for action in self.actions)
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reconstruye un registro serializado con `to_bytes`."""
+        magic, version, board_size, seed, has_seed = _HEADER.unpack_from(data, 0)
+        if magic != LOG_MAGIC:
+            raise ValueError("El archivo no es un registro de partida.")
+        if version != LOG_VERSION:
+            raise ValueError(f"Versión de registro no soportada: {version}")
+        log = cls(board_size, seed if has_seed else None)
+        offset = _HEADER.size
+
+        (players,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(players):
+            fleet, offset = decode_fleet(data, offset)
+            log.fleets.append(fleet)
+
+        while offset < len(data):
+            action, offset = decode_action(data, offset)
+            log.actions.append(action)
+        return log
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+def place_fleet(player, layout):
+    """Coloca la flota del jugador según `layout`, comprobando que cada posición sea válida."""
+    if len(layout) != len(player.fleet):
+        raise ValueError("La colocación no tiene un barco por cada barco de la flota.")
+    for ship, (row, col, orientation) in zip(player.fleet, layout):
+        if not player.place_ship(ship, row, col, orientation):
+            raise ValueError(f"{ship.name} está en una posición inválida.")
+
+def replay(log, compact=True):
+    """
+    Repite una partida registrada sin pantalla, tan rápido como se pueda,
+    y devuelve el motor en su estado final.
+    """
+    from modules.engine import GameEngine
+
+    engine = GameEngine(board_size=log.board_size, place_fleets=False, compact=compact)
+    for player, fleet in zip(engine.players, log.fleets):
+        place_fleet(player, fleet)
+    for action in log.actions:
+        engine.step(action)
+    return engine
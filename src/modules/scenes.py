@@ -0,0 +1,105 @@
+import pygame
+from modules.ui import ui
+from modules.scheduler import scheduler
+
+class Scene:
+    """
+    Pantalla o widget interactivo que recibe los eventos del despachador.
+    Solo se vuelve a dibujar cuando marca `dirty` o mientras `animating`
+    es verdadero; sin nada que animar, el despachador duerme esperando
+    eventos. `finish` la cierra y fija el valor que devuelve `run`.
+    """
+    animating = False
+
+    def __init__(self):
+        self.done = False
+        self.result = None
+        self.dirty = True
+
+    def handle_event(self, event):
+        """Atiende un evento de la ventana."""
+
+    def update(self):
+        """Avanza la animación; se llama en cada cuadro mientras `animating`."""
+
+    def draw(self, screen):
+        """
+        Dibuja la escena y devuelve los rectángulos que cambiaron (None = toda
+        la pantalla). El primer cuadro siempre se muestra completo.
+        """
+
+    def finish(self, result=None):
+        self.done = True
+        self.result = result
+
+class SceneDispatcher:
+    """
+    Único bucle de eventos del juego: una pila de escenas en la que solo la
+    de arriba recibe los eventos. Mientras una escena anima se dibuja a
+    `fps` cuadros por segundo; si no, se bloquea en `pygame.event.wait`
+    hasta el siguiente evento o temporizador, sin gastar CPU.
+    """
+    def __init__(self, fps=60, idle_timeout=1000):
+        self.fps = fps
+        self.idle_timeout = idle_timeout  # Espera máxima sin eventos, en ms
+        self.stack = []
+        self.clock = pygame.time.Clock()
+
+    @property
+    def active(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        self.stack.append(scene)
+        scene.dirty = True
+
+    def pop(self):
+        scene = self.stack.pop()
+        if self.stack:
+            self.active.dirty = True  # La escena de abajo vuelve a quedar a la vista
+        return scene
+
+    def _timeout(self):
+        """Milisegundos hasta el próximo temporizador del planificador, o la espera máxima (nunca 0)."""
+        return scheduler.timeout(self.idle_timeout)
+
+    def _events(self, scene):
+        if scene.animating:
+            self.clock.tick(self.fps)
+            return pygame.event.get()
+        event = pygame.event.wait(self._timeout())
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event, *pygame.event.get()]
+
+    def run(self, scene, screen=None):
+        """Apila la escena, le despacha eventos hasta que termine y devuelve su resultado."""
+        self.push(scene)
+        screen = screen or ui.screen or pygame.display.get_surface()
+        first_frame = True
+        try:
+            while not scene.done:
+                if scene.animating:
+                    scene.update()
+                if scene.done:
+                    break
+                if scene.dirty or scene.animating:
+                    rects = scene.draw(screen)
+                    # El primer cuadro muestra toda la pantalla que dejó la escena anterior
+                    ui.present(None if first_frame else rects)
+                    scene.dirty = first_frame = False
+
+                for event in self._events(scene):
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        exit()
+                    self.active.handle_event(event)
+                    if scene.done:
+                        break
+                scheduler.run_pending()
+        finally:
+            self.pop()
+        return scene.result
+
+# Instancia global
+dispatcher = SceneDispatcher()
@@ -0,0 +1,94 @@
+import heapq
+import itertools
+from collections import deque
+import pygame
+from modules.profiler import profiler
+
+# Entrada del usuario que se descarta al terminar una pausa
+INPUT_EVENTS = (
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+)
+
+class Scheduler:
+    """
+    Planificador por cuadros: temporizadores y una cola de mensajes con
+    duración que se atienden sin dejar de procesar los eventos de la ventana.
+    """
+    def __init__(self, fps=60):
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.timers = []  # Montículo de (momento_ms, orden, callback)
+        self.messages = deque()  # Cola de (mensaje, duración_ms, función_de_dibujo)
+        self._order = itertools.count()
+
+    def call_later(self, delay, callback):
+        """Ejecuta `callback` dentro de `delay` milisegundos."""
+        heapq.heappush(self.timers, (pygame.time.get_ticks() + delay, next(self._order), callback))
+
+    def run_pending(self):
+        """Ejecuta los temporizadores que ya vencieron."""
+        now = pygame.time.get_ticks()
+        while self.timers and self.timers[0][0] <= now:
+            _, _, callback = heapq.heappop(self.timers)
+            callback()
+
+    def timeout(self, limit):
+        """
+        Milisegundos que se puede dormir en `pygame.event.wait` sin pasarse
+        del próximo temporizador ni de `limit`. Nunca es 0: en pygame,
+        `wait(0)` espera sin límite hasta el siguiente evento.
+        """
+        if self.timers:
+            limit = min(limit, self.timers[0][0] - pygame.time.get_ticks())
+        return max(1, limit)
+
+    @profiler.timed("scheduler.pump")
+    def pump(self):
+        """
+        Mantiene viva la ventana. Solo atiende QUIT; el resto de eventos queda
+        en la cola para el bucle que los necesite.
+        """
+        pygame.event.pump()
+        if pygame.event.peek(pygame.QUIT):
+            pygame.quit()
+            exit()
+
+    def wait(self, duration):
+        """
+        Pausa de `duration` milisegundos: duerme hasta el siguiente
+        temporizador o el final de la pausa sin dejar de atender QUIT. Los
+        clics y teclas recibidos durante la pausa se descartan, para que la
+        escena siguiente no los tome como una confirmación; el resto de
+        eventos vuelve a la cola.
+        """
+        until = pygame.time.get_ticks() + duration
+        kept = []
+        while True:
+            self.run_pending()
+            now = pygame.time.get_ticks()
+            if now >= until:
+                break
+            event = pygame.event.wait(self.timeout(until - now))
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                exit()
+            if event.type != pygame.NOEVENT and event.type not in INPUT_EVENTS:
+                kept.append(event)
+        pygame.event.clear(INPUT_EVENTS)
+        for event in kept:
+            pygame.event.post(event)
+
+    def queue_message(self, message, duration, draw):
+        """Agrega un mensaje que se mostrará con `draw(message)` durante `duration` ms."""
+        self.messages.append((message, duration, draw))
+
+    def play_messages(self):
+        """Muestra en orden los mensajes pendientes, respetando su duración."""
+        while self.messages:
+            message, duration, draw = self.messages.popleft()
+            draw(message)
+            self.wait(duration)
+
+# Instancia global
+scheduler = Scheduler()
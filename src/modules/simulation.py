@@ -0,0 +1,192 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from modules.dice import DICE_CODES, DICE_EFFECTS, roll_many
+from modules.engine import ATTACK_COSTS
+from modules.player_batch import PlayerBatch
+
+# Habilidades del bot en el mismo orden que `bot_attack`
+ABILITIES = ["normal_attack", "line_attack", "square_attack", "use_shield"]
+ABILITY_COSTS = np.array([ATTACK_COSTS[name] for name in ABILITIES])
+ABILITY_CELLS = np.array([1, 3, 4, 0])
+
+def build_dice_table():
+    """
+    Efectos del dado como arreglos indexados por el resultado (1 a 100),
+    tomados de la tabla de `dice`.
+    """
+    return {name: effect[DICE_CODES] for name, effect in DICE_EFFECTS.items()}
+
+def simulate_batch(n_games, board_size=12, max_rounds=500, seed=None):
+    """
+    Simula `n_games` partidas bot contra bot en paralelo con arreglos de NumPy.
+
+    Cada fila de los arreglos es una partida; el índice 0/1 es el jugador.
+    El disparo sobre celdas sin atacar se modela con una distribución
+    hipergeométrica, equivalente a elegir celdas al azar como hace el bot.
+    """
+    rng = np.random.default_rng(seed)
+    area = board_size * board_size
+
+    players = PlayerBatch(n_games)
+    life, stamina, shield = players.life, players.stamina, players.temp_shield
+    ships = players.life.copy()  # Celdas de barco a flote
+    unattacked = np.full((2, n_games), area, dtype=np.int32)  # Celdas propias sin atacar
+    shielded_cells = np.zeros((2, n_games), dtype=np.int32)  # Celdas marcadas por un escudo
+    hidden = np.zeros((2, n_games), dtype=np.int32)  # Barcos ocultos bajo esas celdas
+
+    active = np.ones(n_games, dtype=bool)
+    winners = np.full(n_games, -1, dtype=np.int8)
+    lengths = np.full(n_games, max_rounds, dtype=np.int32)
+    stamina_sum = np.zeros((max_rounds, 2), dtype=np.int64)
+    active_count = np.zeros(max_rounds, dtype=np.int64)
+    ability_counts = np.zeros(len(ABILITIES), dtype=np.int64)
+
+    for current_round in range(max_rounds):
+        if not active.any():
+            break
+        stamina_sum[current_round] = stamina[:, active].sum(axis=1)
+        active_count[current_round] = active.sum()
+
+        for p in (0, 1):
+            q = 1 - p
+            games = np.flatnonzero(active)
+            if games.size == 0:
+                break
+
+            # Tirada del dado
+            _, skipped = roll_many(games.size, players, rng, index=(p, games))
+            players.turn_skipped[p, games] = False  # El turno perdido se consume en esta tirada
+            attacking = games[~skipped & (life[p, games] > 0)]
+
+            # Ataques encadenados mientras haya impactos
+            while attacking.size:
+                ability = np.where(
+                    stamina[p, attacking] < 4, 0, rng.integers(0, len(ABILITIES), size=attacking.size)
+                )
+                ability[stamina[p, attacking] < ABILITY_COSTS[ability]] = 0
+                ability_counts += np.bincount(ability, minlength=len(ABILITIES))
+                stamina[p, attacking] -= ABILITY_COSTS[ability]
+                players.last_attack[p, attacking] = ability
+
+                shielding = ability == 3
+                shield[p, attacking[shielding]] = True
+
+                firing = attacking[~shielding]
+                cells = ABILITY_CELLS[ability[~shielding]]
+                # Las líneas y cuadrados se centran en una celda sin atacar; el resto
+                # de sus celdas puede caer sobre celdas ya atacadas
+                area_attack = cells > 1
+                fresh = unattacked[q, firing[area_attack]] / area
+                cells[area_attack] = 1 + rng.binomial(cells[area_attack] - 1, fresh)
+                # El escudo del rival bloquea la primera celda; esa celda queda marcada
+                # como escudo y un barco en ella solo se alcanza al final con ataques normales
+                blocked = shield[q, firing]
+                shield[q, firing] = False
+                blocked_games = firing[blocked & (unattacked[q, firing] > 0)]
+                hidden_ship = rng.random(blocked_games.size) < ships[q, blocked_games] / unattacked[q, blocked_games]
+                ships[q, blocked_games] -= hidden_ship
+                hidden[q, blocked_games] += hidden_ship
+                unattacked[q, blocked_games] -= 1
+                shielded_cells[q, blocked_games] += 1
+                cells = np.minimum(cells - blocked, unattacked[q, firing])
+
+                hits = rng.hypergeometric(
+                    ships[q, firing], unattacked[q, firing] - ships[q, firing], cells
+                )
+                ships[q, firing] -= hits
+                unattacked[q, firing] -= cells
+
+                # Sin celdas nuevas, el ataque normal vuelve sobre las celdas con escudo
+                fallback = (ability[~shielding] == 0) & ~blocked & (cells == 0) & (shielded_cells[q, firing] > 0)
+                fallback_games = firing[fallback]
+                found = rng.random(fallback_games.size) < hidden[q, fallback_games] / shielded_cells[q, fallback_games]
+                hidden[q, fallback_games] -= found
+                shielded_cells[q, fallback_games] -= 1
+                hits[fallback] += found
+                life[q, firing] -= hits
+
+                keep = firing[(hits > 0) & (life[q, firing] > 0)]
+                attacking = np.concatenate([attacking[shielding], keep])
+
+            # Estamina de fin de turno
+            players.end_turn(p, games)
+
+            finished = games[(life[q, games] <= 0) | (life[p, games] <= 0)]
+            winners[finished] = np.where(life[q, finished] <= 0, p, q)
+            lengths[finished] = current_round + 1
+            active[finished] = False
+
+    return {
+        "winners": winners,
+        "lengths": lengths,
+        "stamina_sum": stamina_sum,
+        "active_count": active_count,
+        "ability_counts": ability_counts,
+    }
+
+def _simulate_chunk(args):
+    n_games, board_size, max_rounds, seed = args
+    return simulate_batch(n_games, board_size, max_rounds, seed)
+
+def run_simulation(n_games, board_size=12, max_rounds=500, seed=None, workers=None, chunk_size=50000):
+    """
+    Reparte la simulación en bloques y, si hay más de un proceso, los ejecuta
+    en un pool de procesos. Devuelve un reporte con las distribuciones.
+    """
+    n_chunks = max(1, -(-n_games // chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    sizes = [chunk_size] * (n_chunks - 1) + [n_games - chunk_size * (n_chunks - 1)]
+    tasks = [(size, board_size, max_rounds, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n_chunks == 1:
+        results = [_simulate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, n_chunks)) as pool:
+            results = list(pool.map(_simulate_chunk, tasks))
+
+    return build_report(results)
+
+def build_report(results):
+    """Combina los resultados de varios bloques en un único reporte."""
+    winners = np.concatenate([result["winners"] for result in results])
+    lengths = np.concatenate([result["lengths"] for result in results])
+    stamina_sum = sum(result["stamina_sum"] for result in results)
+    active_count = sum(result["active_count"] for result in results)
+    ability_counts = sum(result["ability_counts"] for result in results)
+
+    played = active_count > 0
+    stamina_curve = stamina_sum[played] / active_count[played, None]
+    games = winners.size
+    return {
+        "games": games,
+        "win_rates": {
+            "player_1": np.count_nonzero(winners == 0) / games,
+            "player_2": np.count_nonzero(winners == 1) / games,
+            "unfinished": np.count_nonzero(winners == -1) / games,
+        },
+        "lengths": lengths,
+        "length_percentiles": dict(zip((5, 25, 50, 75, 95), np.percentile(lengths, [5, 25, 50, 75, 95]))),
+        "stamina_curve": stamina_curve,
+        "ability_usage": dict(zip(ABILITIES, ability_counts / max(1, ability_counts.sum()))),
+    }
+
+def format_report(report):
+    """Devuelve un resumen legible del reporte."""
+    lines = [f"Partidas simuladas: {report['games']}"]
+    lines.append("Tasa de victoria: " + ", ".join(
+        f"{name} {rate:.1%}" for name, rate in report["win_rates"].items()
+    ))
+    lines.append("Duración (rondas): " + ", ".join(
+        f"p{pct} {value:.0f}" for pct, value in report["length_percentiles"].items()
+    ))
+    lines.append("Uso de habilidades: " + ", ".join(
+        f"{name} {rate:.1%}" for name, rate in report["ability_usage"].items()
+    ))
+    curve = report["stamina_curve"]
+    for current_round in range(0, len(curve), max(1, len(curve) // 10)):
+        lines.append(
+            f"  Ronda {current_round + 1}: estamina media {curve[current_round][0]:.1f} / {curve[current_round][1]:.1f}"
+        )
+    return "\n".join(lines)
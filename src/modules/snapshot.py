@@ -0,0 +1,266 @@
+import os
+import random
+import struct
+import numpy as np
+from modules.config import config
+from modules.board import Board
+from modules.array_board import ArrayBoard, ArrayAttackBoard
+from modules.player import Player
+from modules.cell_index import UnattackedCells
+
+SNAPSHOT_MAGIC = b"SSSN"
+SNAPSHOT_VERSION = 1
+
+# Cabecera: firma, versión, tamaño del tablero, tableros compactos, turno,
+# ronda, fase, ganador (-1 si no hay) y si se guardó el estado del generador
+_HEADER = struct.Struct("<4sBHBBIBbB")
+_RNG = struct.Struct("<B625IBd")  # versión, estado de Mersenne Twister y gauss_next
+# Vida, estamina, escudo, turno perdido, último ataque, si tiene puntería y largo del nombre
+_PLAYER = struct.Struct("<hhBBBBB")
+_SHIP = struct.Struct("<HHBB")  # fila, columna, orientación e impactos
+_COUNT = struct.Struct("<B")
+_CELLS = struct.Struct("<I")
+
+_PHASES = ("roll", "attack", "game_over")
+_ATTACK_TYPES = ("normal_attack", "line_attack", "square_attack", "use_shield")
+_ORIENTATIONS = ("H", "V")
+_NONE = 255  # Último ataque u orientación sin valor (barco sin colocar)
+
+# Color de cada estado del tablero de ataque en listas, como en update_attack_board
+_ATTACK_COLORS = {1: "water", 2: "hit", 4: "shielded"}
+
+def _orientation(ship):
+    (row, _), last = ship.positions[0], ship.positions[-1]
+    return 1 if last[0] != row else 0
+
+def _board_planes(player):
+    """Planos int8 (estado, barco) del tablero y estado del tablero de ataque."""
+    board = player.board
+    if hasattr(board, "grid"):
+        state = np.array([[cell["state"] for cell in row] for row in board.grid], dtype=np.int8)
+        ships = np.array([[cell["ship_id"] for cell in row] for row in board.grid], dtype=np.int8)
+    else:
+        state, ships = board.state, board.ships
+    if isinstance(player.attack_board, list):
+        attack = np.array([[cell["state"] for cell in row] for row in player.attack_board], dtype=np.int8)
+    else:
+        attack = player.attack_board.state
+    return state, ships, attack
+
+def _pack_rng(rng):
+    version, internal, gauss_next = rng.getstate()
+    return _RNG.pack(version, *internal, gauss_next is not None, gauss_next or 0.0)
+
+def to_bytes(players, turn=0, current_round=1, phase="roll", winner=None, rng=None):
+    """
+    Serializa el estado de una partida: por cada jugador sus datos y su flota
+    y, al final, los tableros como planos int8 contiguos de tamaño n x n.
+    `winner` es el índice del ganador; `rng` (random.Random) se guarda para
+    que la partida siga igual al restaurarla.
+    """
+    board_size = players[0].board.board_size
+    compact = not hasattr(players[0].board, "grid")
+    chunks = [_HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, board_size, compact, turn, current_round,
+        _PHASES.index(phase), -1 if winner is None else winner, rng is not None,
+    )]
+    if rng is not None:
+        chunks.append(_pack_rng(rng))
+
+    chunks.append(_COUNT.pack(len(players)))
+    for player in players:
+        name = player.name.encode("utf-8")
+        last_attack = _ATTACK_TYPES.index(player.last_attack_type) if player.last_attack_type else _NONE
+        chunks.append(_PLAYER.pack(
+            player.life, player.stamina, player.temp_shield, player.turn_skipped,
+            last_attack, player.targeting is not None, len(name),
+        ))
+        chunks.append(name)
+        chunks.append(_COUNT.pack(len(player.fleet)))
+        for ship in player.fleet:
+            if ship.positions:
+                row, col = ship.positions[0]
+                chunks.append(_SHIP.pack(row, col, _orientation(ship), ship.hits))
+            else:
+                chunks.append(_SHIP.pack(0, 0, _NONE, ship.hits))
+
+    for player in players:
+        chunks.extend(np.ascontiguousarray(plane, dtype=np.int8).tobytes() for plane in _board_planes(player))
+    # Orden del índice de celdas sin atacar, del que depende el muestreo al azar
+    for player in players:
+        chunks.append(_CELLS.pack(len(player.unattacked)))
+        chunks.append(np.array(player.unattacked.cells, dtype=np.uint32).tobytes())
+    return b"".join(chunks)
+
+def save_game(path, players, **state):
+    """Guarda la partida en `path`; se escribe aparte y se reemplaza, para no dejar archivos a medias."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(to_bytes(players, **state))
+    os.replace(temp_path, path)
+
+def _restore_player(meta, fleet_layout, planes, unattacked, board_size, compact, rng):
+    life, stamina, temp_shield, turn_skipped, last_attack, _, name = meta
+    state, ships, attack = planes
+    if compact:
+        board = ArrayBoard(board_size)
+        player = Player(name, board, ArrayAttackBoard(board_size), rng=rng)
+    else:
+        board = Board(board_size)
+        player = Player(name, board, rng=rng)
+
+    for ship, (row, col, orientation, hits) in zip(player.fleet, fleet_layout):
+        if orientation != _NONE:
+            ship.place((row, col), _ORIENTATIONS[orientation], board_size)
+            player.placed_ships.update(ship.positions)
+        ship.hits = hits
+    names = {ship.ship_id: ship.name for ship in player.fleet}
+
+    if compact:
+        board.state, board.ships = state, ships
+        board.ship_names.update(names)
+        player.attack_board.state = attack
+    else:
+        for row, (states, ids) in enumerate(zip(state.tolist(), ships.tolist())):
+            board.grid[row] = [
+                {"state": cell, "ship": names.get(ship_id), "ship_id": ship_id}
+                for cell, ship_id in zip(states, ids)
+            ]
+        player.attack_board = [
+            [{"color": config.colors[_ATTACK_COLORS[cell]] if cell in _ATTACK_COLORS else None, "state": cell, "ship": None}
+             for cell in row]
+            for row in attack.tolist()
+        ]
+
+    player.unattacked = UnattackedCells.from_cells(board_size, unattacked.tolist())
+    player.life, player.stamina = life, stamina
+    player.temp_shield, player.turn_skipped = bool(temp_shield), bool(turn_skipped)
+    player.last_attack_type = None if last_attack == _NONE else _ATTACK_TYPES[last_attack]
+    player.ships_afloat = sum(not ship.sunk for ship in player.fleet)
+    return player
+
+def _restore_targeting(player, opponent):
+    """Rehace la puntería del bot con lo que ya sabe del tablero rival."""
+    from modules.bot_ai import DensityTargeting
+    from modules.attacks_logic import get_attack_state
+
+    n = player.board.board_size
+    player.targeting = DensityTargeting(n, opponent.fleet)
+    results = {1: "miss", 2: "hit"}
+    for row in range(n):
+        for col in range(n):
+            state = get_attack_state(player, row, col)
+            if state in results:
+                player.targeting.record(row, col, results[state])
+    for ship in opponent.fleet:
+        if ship.sunk:
+            player.targeting.on_ship_sunk(ship.size, ship.positions)
+
+def from_buffer(buffer, compact=None, copy=True):
+    """
+    Reconstruye una partida guardada con `to_bytes` a partir de un búfer
+    (bytes o un arreglo uint8). Con `copy=False` los tableros compactos usan
+    el búfer directamente, sin copiarlo. Devuelve un diccionario con los
+    jugadores, el turno, la ronda, la fase, el ganador y el generador.
+    """
+    data = memoryview(buffer).cast("B")
+    magic, version, board_size, stored_compact, turn, current_round, phase, winner, has_rng = (
+        _HEADER.unpack_from(data, 0)
+    )
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("El archivo no es una partida guardada.")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Versión de partida guardada no soportada: {version}")
+    offset = _HEADER.size
+    compact = bool(stored_compact) if compact is None else compact
+
+    rng = random.Random()
+    if has_rng:
+        values = _RNG.unpack_from(data, offset)
+        offset += _RNG.size
+        rng.setstate((values[0], tuple(values[1:626]), values[627] if values[626] else None))
+
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    metas, fleets = [], []
+    for _ in range(count):
+        meta = list(_PLAYER.unpack_from(data, offset))
+        offset += _PLAYER.size
+        length = meta[-1]
+        meta[-1] = bytes(data[offset:offset + length]).decode("utf-8")
+        offset += length
+        (ships,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        fleets.append([_SHIP.unpack_from(data, offset + i * _SHIP.size) for i in range(ships)])
+        offset += ships * _SHIP.size
+        metas.append(meta)
+
+    cells = board_size * board_size
+    planes = np.frombuffer(buffer, dtype=np.int8, count=count * 3 * cells, offset=offset)
+    planes = planes.reshape(count, 3, board_size, board_size)
+    if copy:
+        planes = planes.copy()
+    offset += planes.nbytes
+
+    unattacked = []
+    for _ in range(count):
+        (cells,) = _CELLS.unpack_from(data, offset)
+        offset += _CELLS.size
+        unattacked.append(np.frombuffer(buffer, dtype=np.uint32, count=cells, offset=offset))
+        offset += cells * 4
+
+    players = tuple(
+        _restore_player(meta, fleet, planes[index], unattacked[index], board_size, compact, rng)
+        for index, (meta, fleet) in enumerate(zip(metas, fleets))
+    )
+    for index, meta in enumerate(metas):
+        if meta[5]:
+            _restore_targeting(players[index], players[1 - index])
+    return {
+        "players": players,
+        "board_size": board_size,
+        "turn": turn,
+        "current_round": current_round,
+        "phase": _PHASES[phase],
+        "winner": None if winner < 0 else winner,
+        "rng": rng,
+    }
+
+def load_game(path, compact=None, mmap=False):
+    """
+    Carga una partida guardada. Con `mmap=True` el archivo se proyecta en
+    memoria (copia al escribir) y los tableros compactos se leen de él a
+    medida que se usan, sin cargarlo entero: útil con tableros grandes.
+    """
+    if mmap:
+        return from_buffer(np.memmap(path, dtype=np.uint8, mode="c"), compact, copy=False)
+    with open(path, "rb") as file:
+        return from_buffer(file.read(), compact)
+
+def save_engine(engine, path):
+    """Guarda el estado de un GameEngine, incluido su generador aleatorio."""
+    winner = None if engine.winner is None else engine.players.index(engine.winner)
+    save_game(
+        path, engine.players, turn=engine.turn, current_round=engine.current_round,
+        phase=engine.phase, winner=winner, rng=engine.rng,
+    )
+
+def load_engine(path, mmap=False):
+    """Restaura un GameEngine guardado con `save_engine` para seguir la partida."""
+    from modules.engine import GameEngine
+
+    state = load_game(path, mmap=mmap)
+    board_size = state["board_size"]
+    compact = not hasattr(state["players"][0].board, "grid")
+    engine = GameEngine(board_size=board_size, rng=state["rng"], place_fleets=False, compact=compact)
+    engine.players = state["players"]
+    engine.player, engine.bot = engine.players
+    engine.player_board, engine.bot_board = engine.player.board, engine.bot.board
+    engine.turn = state["turn"]
+    engine.current_round = state["current_round"]
+    engine.phase = state["phase"]
+    engine.winner = None if state["winner"] is None else engine.players[state["winner"]]
+    return engine
@@ -0,0 +1,180 @@
+import importlib
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from modules.engine import GameEngine, play_match
+
+# Estrategias disponibles: nombre -> ruta "módulo:función" de la política para
+# GameEngine. Se pasan como rutas para que cada proceso las importe por su
+# cuenta, también cuando los procesos arrancan de cero (spawn).
+STRATEGIES = {
+    "random": "modules.engine:random_policy",
+    "bot_attack": "modules.bot_ai:bot_attack_policy",
+    "density": "modules.bot_ai:density_policy",
+}
+
+ELO_START = 1500
+ELO_K = 16
+
+def strategy_path(policy):
+    """Ruta "módulo:función" de una política; tiene que poder importarse desde otro proceso."""
+    if isinstance(policy, str):
+        return policy
+    path = f"{policy.__module__}:{policy.__qualname__}"
+    if "<" in policy.__qualname__ or resolve_strategy(path) is not policy:
+        raise ValueError(f"La estrategia {policy!r} no se puede importar desde otro proceso.")
+    return path
+
+def resolve_strategy(path):
+    """Importa la política de una ruta "módulo:función"."""
+    module_name, _, name = path.partition(":")
+    policy = importlib.import_module(module_name)
+    for attribute in name.split("."):
+        policy = getattr(policy, attribute)
+    return policy
+
+def register_strategy(name, policy):
+    """
+    Añade una estrategia al torneo: una función definida a nivel de módulo o
+    su ruta "módulo:función", para que los procesos puedan importarla.
+    """
+    STRATEGIES[name] = strategy_path(policy)
+
+def play_game(first, second, board_size, seed, max_steps=100000):
+    """
+    Juega una partida entre dos políticas (funciones o rutas "módulo:función");
+    `first` mueve primero. Devuelve (ganador, rondas) con ganador 0, 1 o None
+    si no terminó.
+    """
+    policies = tuple(resolve_strategy(policy) if isinstance(policy, str) else policy for policy in (first, second))
+    engine = GameEngine(board_size=board_size, rng=random.Random(seed), compact=True)
+    winner = play_match(engine, policies, max_steps)
+    if winner is None:
+        return None, engine.current_round
+    return engine.players.index(winner), engine.current_round
+
+def _play_chunk(task):
+    """
+    Juega una lista de partidas (first, second, board_size, seed) en un proceso.
+    Las rutas de las estrategias viajan con la tarea, no en el STRATEGIES del proceso.
+    """
+    paths, games = task
+    return [(first, second, *play_game(paths[first], paths[second], board_size, seed))
+            for first, second, board_size, seed in games]
+
+def schedule_games(strategies, games_per_pair, board_size=12, seed=None):
+    """
+    Todos contra todos: cada pareja juega `games_per_pair` partidas alternando
+    quién empieza. Cada partida tiene su propia semilla.
+    """
+    seeds = random.Random(seed)
+    schedule = []
+    for a, b in combinations(strategies, 2):
+        for game in range(games_per_pair):
+            first, second = (a, b) if game % 2 == 0 else (b, a)
+            schedule.append((first, second, board_size, seeds.getrandbits(63)))
+    return schedule
+
+def run_tournament(strategies, games_per_pair, board_size=12, seed=None, workers=None, chunk_size=50):
+    """
+    Reparte las partidas entre un pool de procesos y devuelve el reporte del torneo.
+    """
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Estrategias desconocidas: {', '.join(unknown)}")
+    if len(strategies) < 2:
+        raise ValueError("El torneo necesita al menos dos estrategias.")
+
+    paths = {name: STRATEGIES[name] for name in strategies}
+    schedule = schedule_games(strategies, games_per_pair, board_size, seed)
+    chunks = [(paths, schedule[i:i + chunk_size]) for i in range(0, len(schedule), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1 or len(chunks) <= 1:
+        results = [result for chunk in chunks for result in _play_chunk(chunk)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = [result for chunk in pool.map(_play_chunk, chunks) for result in chunk]
+    elapsed = time.perf_counter() - start
+
+    report = build_report(strategies, results)
+    report["elapsed"] = elapsed
+    report["workers"] = min(workers, max(1, len(chunks)))
+    report["games_per_second"] = len(results) / elapsed if elapsed else float("inf")
+    report["games_per_second_per_core"] = report["games_per_second"] / report["workers"]
+    return report
+
+def expected_score(rating, opponent_rating):
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+def build_report(strategies, results):
+    """
+    Calcula victorias, derrotas, empates y Elo por estrategia, y la tasa de
+    victoria de cada pareja. El Elo se actualiza en el orden del calendario.
+    """
+    table = {name: {"games": 0, "wins": 0, "losses": 0, "draws": 0, "elo": ELO_START} for name in strategies}
+    pairs = {}
+    rounds = []
+    for first, second, winner, game_rounds in results:
+        rounds.append(game_rounds)
+        score = 0.5 if winner is None else 1.0 - winner  # Puntuación de `first`
+        for name, won in ((first, score), (second, 1 - score)):
+            table[name]["games"] += 1
+            if won == 1:
+                table[name]["wins"] += 1
+            elif won == 0:
+                table[name]["losses"] += 1
+            else:
+                table[name]["draws"] += 1
+
+        expected = expected_score(table[first]["elo"], table[second]["elo"])
+        table[first]["elo"] += ELO_K * (score - expected)
+        table[second]["elo"] -= ELO_K * (score - expected)
+
+        for name, opponent, won in ((first, second, score), (second, first, 1 - score)):
+            pair = pairs.setdefault((name, opponent), [0, 0.0])
+            pair[0] += 1
+            pair[1] += won
+
+    for stats in table.values():
+        stats["win_rate"] = stats["wins"] / stats["games"] if stats["games"] else 0.0
+    return {
+        "games": len(results),
+        "table": table,
+        "pairs": {key: won / played for key, (played, won) in pairs.items()},
+        "mean_rounds": sum(rounds) / len(rounds) if rounds else 0.0,
+    }
+
+def format_report(report):
+    """Devuelve las tablas del torneo en texto."""
+    lines = [f"{'Estrategia':<12}{'Elo':>7}{'Partidas':>10}{'Victorias':>11}{'Derrotas':>10}{'Empates':>9}{'% victoria':>12}"]
+    ranking = sorted(report["table"].items(), key=lambda item: item[1]["elo"], reverse=True)
+    for name, stats in ranking:
+        lines.append(
+            f"{name:<12}{stats['elo']:>7.0f}{stats['games']:>10}{stats['wins']:>11}"
+            f"{stats['losses']:>10}{stats['draws']:>9}{stats['win_rate']:>12.1%}"
+        )
+
+    names = [name for name, _ in ranking]
+    lines.append("")
+    lines.append("Tasa de victoria (fila contra columna):")
+    lines.append(" " * 12 + "".join(f"{name:>12}" for name in names))
+    for name in names:
+        cells = [
+            "-" if name == opponent else f"{report['pairs'].get((name, opponent), 0.0):.1%}"
+            for opponent in names
+        ]
+        lines.append(f"{name:<12}" + "".join(f"{cell:>12}" for cell in cells))
+
+    lines.append("")
+    lines.append(f"Partidas: {report['games']}, duración media {report['mean_rounds']:.1f} rondas")
+    if "elapsed" in report:
+        lines.append(
+            f"Tiempo: {report['elapsed']:.2f} s con {report['workers']} proceso(s): "
+            f"{report['games_per_second']:,.0f} partidas/s, "
+            f"{report['games_per_second_per_core']:,.0f} partidas/s por núcleo"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,159 @@
+import random
+import time
+import numpy as np
+from modules.engine import ATTACK_COSTS, GameEngine, random_policy
+
+# Tipos de acción del agente, en el orden de los botones
+ACTION_TYPES = ("normal_attack", "line_attack", "square_attack", "use_shield")
+ACTION_COSTS = np.array([ATTACK_COSTS[name] for name in ACTION_TYPES])
+ORIENTATIONS = ("H", "V")
+
+# Columnas de `stats` en la observación
+STATS = ("life", "stamina", "opponent_life", "opponent_stamina")
+
+class VectorGameEnv:
+    """
+    Entorno vectorizado al estilo Gym sobre `n_envs` partidas de GameEngine.
+
+    El agente juega como "Jugador" y el rival con `opponent_policy`; los
+    dados se tiran solos, así que el agente solo decide en la fase de
+    ataque. Cada acción es una fila (tipo, fila, columna, orientación) con
+    el tipo según ACTION_TYPES y la orientación 0 = H, 1 = V.
+
+    La observación es un diccionario con "board" (n, tamaño, tamaño) int8,
+    el tablero de ataque del agente, y "stats" (n, 4) int32 con vida y
+    estamina propias y del rival. Los tableros de ataque de las partidas
+    escriben directamente en "board", así que la observación no se copia:
+    es el mismo búfer en cada paso. Las partidas terminadas se reinician
+    solas; `infos` trae el ganador y la duración de las que acabaron.
+    """
+    def __init__(self, n_envs, board_size=10, opponent_policy=random_policy, seed=None,
+                 max_steps=1000, win_reward=10.0, invalid_penalty=-1.0):
+        self.n_envs = n_envs
+        self.board_size = board_size
+        self.opponent_policy = opponent_policy
+        self.max_steps = max_steps  # Pasos del agente antes de truncar una partida
+        self.win_reward = win_reward
+        self.invalid_penalty = invalid_penalty
+
+        self.boards = np.zeros((n_envs, board_size, board_size), dtype=np.int8)
+        self.stats = np.zeros((n_envs, len(STATS)), dtype=np.int32)
+        self.observation = {"board": self.boards, "stats": self.stats}
+        self.rewards = np.zeros(n_envs, dtype=np.float32)
+        self.terminated = np.zeros(n_envs, dtype=bool)
+        self.truncated = np.zeros(n_envs, dtype=bool)
+        self.steps = np.zeros(n_envs, dtype=np.int64)
+
+        self.engines = [
+            GameEngine(board_size=board_size, place_fleets=False, compact=True)
+            for _ in range(n_envs)
+        ]
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Da a cada partida su propio generador, derivado de `seed`."""
+        seeds = np.random.SeedSequence(seed).generate_state(self.n_envs)
+        for engine, engine_seed in zip(self.engines, seeds.tolist()):
+            engine.rng = random.Random(engine_seed)
+
+    def reset(self, seed=None):
+        """Reinicia todas las partidas y devuelve (observación, infos)."""
+        if seed is not None:
+            self.seed(seed)
+        for index in range(self.n_envs):
+            self._reset_env(index)
+        return self.observation, {}
+
+    def _reset_env(self, index):
+        engine = self.engines[index]
+        engine.reset()
+        # El tablero de ataque del agente vive dentro del búfer de observación
+        board = self.boards[index]
+        board.fill(0)
+        engine.player.attack_board.state = board
+        self.steps[index] = 0
+        self._advance(engine)
+        self._write_stats(index)
+
+    def _advance(self, engine):
+        """Juega tiradas y turnos del rival hasta que le toque atacar al agente."""
+        while not engine.done and not (engine.turn == 0 and engine.phase == "attack"):
+            if engine.turn == 0:
+                engine.step(("roll",))
+            else:
+                engine.step(self.opponent_policy(engine))
+
+    def _write_stats(self, index):
+        player, bot = self.engines[index].players
+        self.stats[index] = (player.life, player.stamina, bot.life, bot.stamina)
+
+    def action_mask(self):
+        """Máscara (n, 4) de los tipos de acción que cada agente puede pagar."""
+        return self.stats[:, 1, None] >= ACTION_COSTS
+
+    def step(self, actions):
+        """
+        Aplica una acción por partida. Devuelve (observación, recompensas,
+        terminadas, truncadas, infos). La recompensa es el daño hecho menos
+        el recibido hasta el siguiente turno del agente, más `win_reward` al
+        ganar (o menos, al perder). Una acción que no se puede pagar se juega
+        como ataque normal y, como repetir una celda, suma `invalid_penalty`.
+        """
+        actions = np.asarray(actions)
+        self.rewards.fill(0)
+        self.terminated.fill(False)
+        self.truncated.fill(False)
+        infos = {}
+
+        for index, (kind, row, col, orientation) in enumerate(actions.tolist()):
+            engine = self.engines[index]
+            player, bot = engine.players
+            life, bot_life = player.life, bot.life
+
+            attack_type = ACTION_TYPES[kind]
+            if player.stamina < ATTACK_COSTS[attack_type]:
+                attack_type = "normal_attack"
+                self.rewards[index] += self.invalid_penalty
+            if attack_type == "use_shield":
+                result = engine.step(("use_shield",))
+            else:
+                result = engine.step((attack_type, row, col, ORIENTATIONS[orientation]))
+                if result["results"] and result["results"][0][2] == "already_attacked":
+                    self.rewards[index] += self.invalid_penalty
+            self._advance(engine)
+
+            self.rewards[index] += (bot_life - bot.life) - (life - player.life)
+            self.steps[index] += 1
+            if engine.done:
+                self.terminated[index] = True
+                self.rewards[index] += self.win_reward if engine.winner is player else -self.win_reward
+            elif self.steps[index] >= self.max_steps:
+                self.truncated[index] = True
+
+            if self.terminated[index] or self.truncated[index]:
+                infos.setdefault("winner", {})[index] = None if engine.winner is None else engine.players.index(engine.winner)
+                infos.setdefault("rounds", {})[index] = engine.current_round
+                self._reset_env(index)
+            else:
+                self._write_stats(index)
+
+        return self.observation, self.rewards, self.terminated, self.truncated, infos
+
+def random_actions(env, rng):
+    """Acciones al azar (solo entre las que cada agente puede pagar), para pruebas y benchmarks."""
+    n = env.n_envs
+    # El ataque normal siempre se puede pagar, así que el máximo cae en una acción válida
+    kinds = (rng.random((n, len(ACTION_TYPES))) * env.action_mask()).argmax(axis=1)
+    cells = rng.integers(0, env.board_size, size=(n, 2))
+    orientations = rng.integers(0, 2, size=n)
+    return np.column_stack([kinds, cells, orientations])
+
+def measure_throughput(n_envs=64, steps=200, board_size=10, seed=None):
+    """Pasos del entorno por segundo con acciones al azar."""
+    env = VectorGameEnv(n_envs, board_size=board_size, seed=seed)
+    env.reset()
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for _ in range(steps):
+        env.step(random_actions(env, rng))
+    return n_envs * steps / (time.perf_counter() - start)
@@ -1,51 +1,81 @@
 import pygame
 from modules.config import config
+from modules.fonts import get_font, render_text
+from modules.board_renderer import BoardRenderer, MINIMAP_GAP
+from modules.scheduler import scheduler
+from modules.assets import assets
+from modules.profiler import profiler
 
 class UI:
     def __init__(self):
         self.screen = None
         self.clock = pygame.time.Clock()
         self.fondo = None  # Aquí se almacenará la imagen de fondo
+        self.attack_renderers = {}  # id(tablero de ataque) -> (BoardRenderer, tablero)
 
     def init_screen(self, backgraound_image="battle"):
         """Inicializa la pantalla de Pygame según la configuración en config."""
-        self.screen = pygame.display.set_mode(
-            (config.WINDOW_WIDTH, config.WINDOW_HEIGHT)
-        )
+        size = (config.WINDOW_WIDTH, config.WINDOW_HEIGHT)
+        surface = pygame.display.get_surface()
+        if surface is None or surface.get_size() != size:
+            self.screen = pygame.display.set_mode(size)
+            # Con la pantalla abierta ya se pueden convertir los fondos de una vez
+            assets.preload(["menu", "battle"], size)
+        else:
+            self.screen = surface
         pygame.display.set_caption("The Seven Seas Showdown")
+        self.attack_renderers.clear()
         
-        # Cargar la imagen de fondo
+        # Imagen de fondo ya escalada al tamaño de la ventana
+        self.fondo = assets.image(backgraound_image, size)
         if backgraound_image == "menu":
-            self.fondo = pygame.image.load("./assets/images/menu_1.png")
-            font_title = pygame.font.Font(config.font_bold, 54)
+            font_title = get_font(config.font_bold, 54)
             title = "The Seven Seas Showdown"
-            title_text = font_title.render(title, True, config.colors["text"])
+            title_text = render_text(font_title, title, config.colors["text"])
             title_rect = title_text.get_rect(center=(config.WINDOW_WIDTH // 2, 40))
             self.screen.blit(title_text, title_rect)
-    
-        elif backgraound_image == "battle":
-            self.fondo = pygame.image.load("./assets/images/battle_1.png")
-        # Asegurarse de que la imagen se ajusta al tamaño de la ventana
-        self.fondo = pygame.transform.scale(self.fondo, (config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
 
+    @profiler.timed("ui.fill_background")
     def fill_background(self):
         """Dibuja la imagen de fondo en la pantalla."""
         self.screen.blit(self.fondo, (0, 0))
 
-    def update_display(self):
-        """Actualiza la pantalla y controla el framerate."""
-        pygame.display.flip()
+    def present(self, rects=None):
+        """
+        Muestra el cuadro: toda la pantalla o solo los rectángulos indicados.
+        Con el perfilador activo dibuja encima su panel y cierra el cuadro.
+        """
+        with profiler.section("ui.present"):
+            if profiler.enabled:
+                overlay = profiler.draw_overlay(pygame.display.get_surface())
+                if rects is not None:
+                    rects = [*rects, overlay]
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+        profiler.end_frame()
+
+    def update_display(self, rects=None):
+        """
+        Actualiza la pantalla y controla el framerate.
+        Si se indican rectángulos, solo se actualizan esas zonas.
+        """
+        self.present(rects)
+        scheduler.run_pending()
         self.clock.tick(30)  # Puedes ajustar el framerate según tus necesidades
 
+    @profiler.timed("ui.draw_game_state")
     def draw_game_state(self, screen, player, bot, player_board, bot_board, current_turn, current_round):
         """
         Dibuja el estado actual del juego con la información de los jugadores y tableros.
+        Devuelve los rectángulos de pantalla que ocupa (título, paneles y tableros).
         """
         # Llamamos a fill_background para dibujar la imagen de fondo
         self.fill_background()
 
-        font_title = pygame.font.Font(config.font_bold, 54)
-        font_info = pygame.font.Font(config.font_regular, 32)
+        font_title = get_font(config.font_bold, 54)
+        font_info = get_font(config.font_regular, 32)
 
         # Título del estado del juego
         title = {
@@ -57,26 +87,33 @@ class UI:
             "player_turn_attack": f"{player.name}, selecciona un ataque",
             "attack_selection": f"{player.name}, atacando a {bot.name}",
         }[current_turn]
-        title_text = font_title.render(title, True, config.colors["text"])
+        title_text = render_text(font_title, title, config.colors["text"])
         title_rect = title_text.get_rect(center=(config.WINDOW_WIDTH // 2, 40))
         screen.blit(title_text, title_rect)
+        # Toda la franja del título, para borrar uno anterior más largo
+        rects = [pygame.Rect(0, 0, config.WINDOW_WIDTH, 80)]
 
         # Paneles de información
-        self.draw_panel(screen, 20, 80, 300, 140, {"Jugador": player.name, "Vida": player.life, "Estamina": player.stamina}, font_info)
-        self.draw_panel(screen, config.WINDOW_WIDTH - 320, 80, 300, 140, {"Bot": bot.name, "Vida": bot.life, "Estamina": bot.stamina}, font_info)
+        self.draw_panel(screen, 20, 80, 300, 140, {"Jugador": player.name, "Vida": player.life, "Estamina": player.stamina, "Flota": f"{player.ships_afloat}/{len(player.fleet)}"}, font_info)
+        self.draw_panel(screen, config.WINDOW_WIDTH - 320, 80, 300, 140, {"Bot": bot.name, "Vida": bot.life, "Estamina": bot.stamina, "Flota": f"{bot.ships_afloat}/{len(bot.fleet)}"}, font_info)
+        rects += [pygame.Rect(20, 80, 300, 140), pygame.Rect(config.WINDOW_WIDTH - 320, 80, 300, 140)]
 
         # Dibujar el tablero del jugador
         if player_board:
             player_board.start_x = 50  # Posición a la izquierda
             player_board.start_y = 260
             player_board.draw(screen)
+            rects.append(self.board_rect(player_board, labels_side="left"))
 
         # Dibujar el tablero de ataque del jugador (su vista del tablero del bot)
         if bot_board:
             bot_board.start_x = config.WINDOW_WIDTH - bot_board.pixel_size - 50  # Posición a la derecha
             bot_board.start_y = 260
             self.draw_attack_board(screen, bot_board, player.attack_board)
+            rects.append(self.attack_board_rect(bot_board))
+        return rects
 
+    @profiler.timed("ui.draw_panel")
     def draw_panel(self, screen, x, y, width, height, info, font):
         """
         Dibuja un panel de información en la pantalla.
@@ -90,52 +127,68 @@ class UI:
         padding = 10
         line_height = 30
         for i, (key, value) in enumerate(info.items()):
-            text = font.render(f"{key}: {value}", True, config.colors["text"])
+            text = render_text(font, f"{key}: {value}", config.colors["text"])
             screen.blit(text, (x + padding, y + padding + i * line_height))
         
+    @profiler.timed("ui.draw_attack_board")
     def draw_attack_board(self, screen, board, attack_board, player="player"):
         """
         Dibuja el tablero de ataque del jugador (su vista del tablero del bot).
+        Usa una superficie en caché y devuelve los rectángulos que cambiaron.
+        """
+        renderer, owner = self.attack_renderers.get(id(attack_board), (None, None))
+        if owner is not attack_board:
+            font = get_font(config.font_regular, 12)
+            renderer = BoardRenderer(board.board_size, board.cell_size, font, labels_side="right")
+            self.attack_renderers[id(attack_board)] = (renderer, attack_board)
+
+        return renderer.draw(
+            screen,
+            board.start_x,
+            board.start_y,
+            lambda row, col: self.get_attack_cell_color(attack_board[row][col]["state"]),
+            board.viewport,
+        )
+
+    def attack_board_rect(self, board):
+        """Rectángulo de pantalla que ocupa el tablero de ataque con sus etiquetas y minimapa."""
+        return self.board_rect(board, labels_side="right")
+
+    def board_rect(self, board, labels_side):
+        """Rectángulo de pantalla de un tablero con sus etiquetas (a la izquierda o a la derecha) y minimapa."""
+        size = config.CELL_SIZE + board.pixel_size
+        x = board.start_x - (config.CELL_SIZE if labels_side == "left" else 0)
+        rect = pygame.Rect(x, board.start_y - config.CELL_SIZE, size, size)
+        if board.viewport.scrollable:
+            minimap_y = board.start_y + board.pixel_size + MINIMAP_GAP
+            rect = rect.union(pygame.Rect(board.start_x, minimap_y, config.MINIMAP_SIZE, config.MINIMAP_SIZE))
+        return rect
+
+    def get_attack_cell_color(self, state):
+        """Obtiene el color de una celda del tablero de ataque según su estado."""
+        if state == 1:
+            return config.colors["water"]
+        elif state == 2:
+            return config.colors["hit"]
+        elif state == 4:
+            return config.colors["shielded"]
+        return config.colors["cell"]
+
+    def restore_attack_rects(self, screen, attack_board, rects):
+        """
+        Vuelve a copiar en pantalla, desde la superficie en caché, las zonas
+        indicadas del tablero de ataque (por ejemplo, donde estaba la
+        previsualización), sin redibujar el resto.
         """
-        # Dibujar números de columnas (1 a N) en la parte superior
-        font = pygame.font.Font(config.font_regular, 12)
-        for col in range(board.board_size):
-            number_text = font.render(str(col + 1), True, config.colors["text"])
-            text_rect = number_text.get_rect(
-                center=(board.start_x + col * board.cell_size + board.cell_size // 2, board.start_y - board.cell_size // 2)
-            )
-            screen.blit(number_text, text_rect)
-
-        # Dibujar letras de filas (A, B, C, ...) en el lado derecho
-        for row in range(board.board_size):
-            letter_text = font.render(chr(65 + row), True, config.colors["text"])
-            text_rect = letter_text.get_rect(
-                center=(board.start_x + board.board_size * board.cell_size + board.cell_size // 2,
-                        board.start_y + row * board.cell_size + board.cell_size // 2)
-            )
-            screen.blit(letter_text, text_rect)
-
-        # Dibujar las celdas del tablero de ataque
-        for row in range(board.board_size):
-            for col in range(board.board_size):
-                x = board.start_x + col * board.cell_size
-                y = board.start_y + row * board.cell_size
-
-                attack_cell = attack_board[row][col]
-                state = attack_cell["state"]
-
-                if state == 0:
-                    color = config.colors["cell"]
-                elif state == 1:
-                    color = config.colors["water"]
-                elif state == 2:
-                    color = config.colors["hit"]
-                elif state == 4:
-                    color = config.colors["shielded"]
-                else:
-                    color = config.colors["cell"]
-
-                pygame.draw.rect(screen, color, (x, y, board.cell_size, board.cell_size))
-                pygame.draw.rect(screen, config.colors["border"], (x, y, board.cell_size, board.cell_size), 1)
+        renderer, owner = self.attack_renderers.get(id(attack_board), (None, None))
+        if owner is not attack_board:
+            return []
+        return renderer.restore(screen, rects)
+
+    def mark_attack_cell_dirty(self, attack_board, row, col):
+        """Marca una celda del tablero de ataque para repintarla."""
+        renderer, owner = self.attack_renderers.get(id(attack_board), (None, None))
+        if owner is attack_board:
+            renderer.mark_dirty(row, col)
 
 ui = UI()
@@ -1,24 +1,20 @@
 import pygame
 from modules.config import config
+from modules.fonts import get_font, render_text
 from modules.ui import ui
+from modules.scheduler import scheduler
+from modules.profiler import profiler
+from modules.area_attacks import attack_shape, covered_cells
 
 def draw_empty_board(screen, board):
     """
-    Dibuja un tablero vacío (sin barcos visibles).
+    Dibuja un tablero vacío (sin barcos visibles); solo las celdas a la vista.
     """
-    for row in range(board.board_size):
-        for col in range(board.board_size):
-            x = board.start_x + col * board.cell_size
-            y = board.start_y + row * board.cell_size
-            pygame.draw.rect(
-                screen, config.colors["cell"], (x, y, board.cell_size, board.cell_size)
-            )
-            pygame.draw.rect(
-                screen,
-                config.colors["border"],
-                (x, y, board.cell_size, board.cell_size),
-                1,
-            )
+    for row in board.viewport.rows():
+        for col in board.viewport.cols():
+            rect = board.cell_rect(row, col)
+            pygame.draw.rect(screen, config.colors["cell"], rect)
+            pygame.draw.rect(screen, config.colors["border"], rect, 1)
 
 def handle_mouse_selection(event, start_x, start_y, cell_size, board_size):
     """
@@ -48,6 +44,13 @@ def is_within_bounds(row, col, board_size):
     """
     return 0 <= row < board_size and 0 <= col < board_size
 
+def get_attack_cells(attack_type, row, col, orientation, board_size):
+    """
+    Calcula las celdas dentro del tablero que cubre un ataque.
+    """
+    rows, cols = covered_cells(attack_shape(attack_type, orientation), row, col, board_size)
+    return list(zip(rows.tolist(), cols.tolist()))
+
 def place_ship_on_board(board, ship, start_row, start_col, orientation):
     """
     Coloca un barco en el tablero.
@@ -55,13 +58,17 @@ def place_ship_on_board(board, ship, start_row, start_col, orientation):
     for i in range(ship.size):
         row = start_row + (i if orientation == "V" else 0)
         col = start_col + (i if orientation == "H" else 0)
-        board.update_cell(row, col, state=1, ship=ship.name)
+        board.update_cell(row, col, state=1, ship=ship.name, ship_id=ship.ship_id)
 
+@profiler.timed("utils.handle_navigation")
 def handle_navigation_and_selection(event, selected_row, selected_col, board_size, orientation, attack_type, board, screen):
     """
     Maneja la navegación y selección con teclado y mouse en el tablero.
+    La rueda del ratón y las teclas + y - desplazan o acercan la vista.
     """
     confirm = False
+    if board.viewport.handle_event(event):
+        return selected_row, selected_col, orientation, confirm
 
     if event.type == pygame.KEYDOWN:
         if event.key == pygame.K_UP:
@@ -76,13 +83,14 @@ def handle_navigation_and_selection(event, selected_row, selected_col, board_siz
             orientation = toggle_orientation(orientation)
         elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
             confirm = True
+        # La vista sigue a la celda seleccionada
+        board.viewport.ensure_visible(selected_row, selected_col)
 
     elif event.type in [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN]:
         # Actualizar selección basada en la posición del mouse
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        row = (mouse_y - board.start_y) // board.cell_size
-        col = (mouse_x - board.start_x) // board.cell_size
-        if is_within_bounds(row, col, board_size):
+        mouse_x, mouse_y = event.pos
+        row, col = board.cell_at(mouse_x, mouse_y)
+        if row is not None and is_within_bounds(row, col, board_size):
             selected_row, selected_col = row, col
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 confirm = True
@@ -113,7 +121,16 @@ def toggle_orientation(orientation):
 
 def display_message(screen, message, delay=1000):
     """
-    Muestra un mensaje en el área central de la pantalla.
+    Muestra un mensaje en el área central de la pantalla durante `delay` ms
+    sin bloquear la ventana.
+    """
+    scheduler.queue_message(message, delay, lambda text: draw_message(screen, text))
+    scheduler.play_messages()
+
+@profiler.timed("utils.draw_message")
+def draw_message(screen, message):
+    """
+    Dibuja un mensaje en el área central de la pantalla.
     """
     button_area_width = 400
     button_area_height = 150
@@ -126,18 +143,19 @@ def display_message(screen, message, delay=1000):
         screen, config.colors["background"], button_area_rect, border_radius=10
     )
 
-    font = pygame.font.Font(config.font_regular, 24)
-    message_text = font.render(message, True, config.colors["text"])
+    font = get_font(config.font_regular, 24)
+    message_text = render_text(font, message, config.colors["text"])
     message_text_rect = message_text.get_rect(
         center=(button_area_rect.centerx, button_area_rect.centery)
     )
     screen.blit(message_text, message_text_rect)
     ui.update_display()
-    pygame.time.delay(delay)
-    
+
+@profiler.timed("utils.draw_preview")
 def draw_preview(screen, board, selected_row, selected_col, orientation, preview_type="ship", attack_board=None, size=None):
     """
-    Dibuja una vista previa de la acción seleccionada.
+    Dibuja una vista previa de la acción seleccionada y devuelve los
+    rectángulos de las celdas que pintó.
     """
     if preview_type == 'ship':
         valid = can_place_ship(board.grid, size, selected_row, selected_col, orientation)
@@ -148,7 +166,6 @@ def draw_preview(screen, board, selected_row, selected_col, orientation, preview
         size = 1
         valid = True
 
-    positions = []
     if preview_type == "ship":
         # Cálculo de posiciones para colocación de barcos
         positions = [
@@ -158,48 +175,19 @@ def draw_preview(screen, board, selected_row, selected_col, orientation, preview
             )
             for i in range(size)
         ]
-    elif preview_type in ["normal_attack", "radar"]:
-        # Solo la celda seleccionada
-        positions = [(selected_row, selected_col)]
-    elif preview_type == "square_attack":
-        # Cuadrado de 2x2 celdas
-        positions = [
-            (selected_row + i, selected_col + j)
-            for i in range(2)
-            for j in range(2)
-        ]
-    elif preview_type == "line_attack":
-        # Línea de 3 celdas centrada en la celda seleccionada
-        positions = []
-        offsets = [-1, 0, 1]
-        if orientation == "H":
-            for offset in offsets:
-                col = selected_col + offset
-                if is_within_bounds(selected_row, col, board.board_size):
-                    positions.append((selected_row, col))
-        else:
-            for offset in offsets:
-                row = selected_row + offset
-                if is_within_bounds(row, selected_col, board.board_size):
-                    positions.append((row, selected_col))
     else:
-        positions = []
+        # Las celdas de un ataque salen de su forma en area_attacks, igual que al resolverlo
+        positions = get_attack_cells(preview_type, selected_row, selected_col, orientation, board.board_size)
 
+    rects = []
     for row, col in positions:
         if is_within_bounds(row, col, board.board_size):
-            x = board.start_x + col * board.cell_size
-            y = board.start_y + row * board.cell_size
-
-            # Omitir celdas ya atacadas
-            if attack_board and attack_board[row][col]["state"] != 0:
+            rect = board.cell_rect(row, col)
+            # Omitir celdas fuera de la vista o ya atacadas
+            if rect is None or (attack_board and attack_board[row][col]["state"] != 0):
                 continue
 
-            pygame.draw.rect(
-                screen, color, (x, y, board.cell_size, board.cell_size)
-            )
-            pygame.draw.rect(
-                screen,
-                config.colors["selected_border"],
-                (x, y, board.cell_size, board.cell_size),
-                2,
-            )
\ No newline at end of file
+            pygame.draw.rect(screen, color, rect)
+            pygame.draw.rect(screen, config.colors["selected_border"], rect, 2)
+            rects.append(rect)
+    return rects
\ No newline at end of file
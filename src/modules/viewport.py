@@ -0,0 +1,130 @@
+import pygame
+from modules.config import config
+
+def row_label(row):
+    """Letras de una fila al estilo de las hojas de cálculo: A..Z, AA..AZ, BA..."""
+    label = ""
+    row += 1
+    while row > 0:
+        row, remainder = divmod(row - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+class Viewport:
+    """
+    Ventana visible de un tablero: qué filas y columnas se ven y a qué tamaño
+    de celda. Los tableros que caben en `max_pixels` se ven enteros, como antes;
+    los más grandes se pueden desplazar y acercar o alejar.
+    """
+    def __init__(self, board_size, cell_size=None, max_pixels=None):
+        self.board_size = board_size
+        self.max_pixels = max_pixels or config.VIEWPORT_SIZE
+        self.cell_size = cell_size or self.fitting_cell_size()
+        self.top = 0
+        self.left = 0
+        self.version = 0  # Cambia con cada desplazamiento o zoom
+
+    def fitting_cell_size(self):
+        """Mayor nivel de zoom con el que se ve el tablero entero (o el menor, si no cabe)."""
+        for cell_size in sorted(config.ZOOM_LEVELS, reverse=True):
+            if cell_size <= config.CELL_SIZE and cell_size * self.board_size <= self.max_pixels:
+                return cell_size
+        return min(config.ZOOM_LEVELS)
+
+    @property
+    def visible(self):
+        """Número de filas (y de columnas) que se ven a la vez."""
+        return min(self.board_size, max(1, self.max_pixels // self.cell_size))
+
+    @property
+    def pixel_size(self):
+        return self.visible * self.cell_size
+
+    @property
+    def scrollable(self):
+        return self.visible < self.board_size
+
+    def _changed(self):
+        self.version += 1
+
+    def scroll_to(self, top, left):
+        """Coloca la esquina superior izquierda, sin salirse del tablero."""
+        limit = self.board_size - self.visible
+        top, left = max(0, min(top, limit)), max(0, min(left, limit))
+        if (top, left) != (self.top, self.left):
+            self.top, self.left = top, left
+            self._changed()
+
+    def scroll(self, rows, cols):
+        self.scroll_to(self.top + rows, self.left + cols)
+
+    def zoom(self, step, anchor=None):
+        """
+        Cambia el tamaño de celda al nivel de zoom siguiente (`step` > 0 acerca)
+        manteniendo la celda `anchor` (o el centro) en el mismo lugar.
+        """
+        levels = config.ZOOM_LEVELS
+        current = min(range(len(levels)), key=lambda i: abs(levels[i] - self.cell_size))
+        cell_size = levels[max(0, min(current + step, len(levels) - 1))]
+        if cell_size == self.cell_size:
+            return
+        if anchor is None:
+            anchor = (self.top + self.visible // 2, self.left + self.visible // 2)
+        offset = (anchor[0] - self.top, anchor[1] - self.left)
+        ratio = self.cell_size / cell_size
+        self.cell_size = cell_size
+        self._changed()
+        self.scroll_to(anchor[0] - int(offset[0] * ratio), anchor[1] - int(offset[1] * ratio))
+
+    def ensure_visible(self, row, col):
+        """Desplaza lo mínimo necesario para que se vea la celda (row, col)."""
+        top, left = self.top, self.left
+        if row < top:
+            top = row
+        elif row >= top + self.visible:
+            top = row - self.visible + 1
+        if col < left:
+            left = col
+        elif col >= left + self.visible:
+            left = col - self.visible + 1
+        self.scroll_to(top, left)
+
+    def is_visible(self, row, col):
+        return self.top <= row < self.top + self.visible and self.left <= col < self.left + self.visible
+
+    def rows(self):
+        return range(self.top, self.top + self.visible)
+
+    def cols(self):
+        return range(self.left, self.left + self.visible)
+
+    def cell_offset(self, row, col):
+        """Posición en píxeles de una celda visible respecto a la primera celda visible."""
+        return (col - self.left) * self.cell_size, (row - self.top) * self.cell_size
+
+    def cell_at(self, x, y):
+        """Celda bajo el punto (x, y) relativo a la primera celda visible, o (None, None)."""
+        if not (0 <= x < self.pixel_size and 0 <= y < self.pixel_size):
+            return None, None
+        return self.top + y // self.cell_size, self.left + x // self.cell_size
+
+    def handle_event(self, event):
+        """
+        Rueda del ratón: desplaza filas (con Shift, columnas; con Ctrl, zoom).
+        Teclas + y -: zoom. Devuelve True si el evento cambió la vista.
+        """
+        version = self.version
+        if event.type == pygame.MOUSEWHEEL:
+            mods = pygame.key.get_mods()
+            if mods & pygame.KMOD_CTRL:
+                self.zoom(1 if event.y > 0 else -1)
+            elif mods & pygame.KMOD_SHIFT:
+                self.scroll(0, -event.y * 3)
+            else:
+                self.scroll(-event.y * 3, -event.x * 3)
+        elif event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                self.zoom(1)
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.zoom(-1)
+        return self.version != version
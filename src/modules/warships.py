@@ -1,11 +1,30 @@
 class Ship:
-    def __init__(self, name, size):
+    def __init__(self, name, size, ship_id=0):
         """
-        Inicializa un barco con un nombre y tamaño.
+        Inicializa un barco con un nombre y tamaño. `ship_id` lo identifica en
+        las celdas del tablero, ya que varios barcos comparten nombre.
         """
         self.name = name
         self.size = size
+        self.ship_id = ship_id
         self.positions = []
+        self.hits = 0
+
+    @property
+    def remaining(self):
+        """Impactos que le faltan para hundirse."""
+        return self.size - self.hits
+
+    @property
+    def sunk(self):
+        return self.hits >= self.size
+
+    def register_hit(self):
+        """Cuenta un impacto y devuelve True si con él se hunde el barco."""
+        if self.sunk:
+            return False
+        self.hits += 1
+        return self.sunk
 
     def place(self, start_pos, orientation, board_size):
         """
@@ -35,7 +54,7 @@ def create_fleet():
     fleet = []
     for name, (size, quantity) in ship_definitions.items():
         for _ in range(quantity):
-            fleet.append(Ship(name, size))
+            fleet.append(Ship(name, size, ship_id=len(fleet) + 1))
     return fleet
 
 # Crear una flota global predeterminada
@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+from modules.network import GameServer, format_loopback, play_client, run_loopback
+from modules.replay import seed_argument
+
+async def serve(host, port, seed):
+    server = await GameServer(host, port, seed).start()
+    print(f"Servidor escuchando en {server.host}:{server.port}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        for stats in server.finished:
+            print(stats)
+
+def main():
+    """Partidas en red: servidor, cliente bot o prueba local con muchas partidas."""
+    parser = argparse.ArgumentParser(description="Partidas en red de The Seven Seas Showdown.")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    server = subparsers.add_parser("server", help="Aloja partidas.")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=7777)
+    server.add_argument("--seed", type=seed_argument, default=None, help="Semilla de los dados del servidor.")
+
+    client = subparsers.add_parser("client", help="Juega una partida con el bot de densidad.")
+    client.add_argument("--host", default="127.0.0.1")
+    client.add_argument("--port", type=int, default=7777)
+    client.add_argument("--match", type=int, default=0, help="Identificador de la partida.")
+    client.add_argument("--board-size", type=int, default=12)
+    client.add_argument("--seed", type=seed_argument, default=None)
+
+    loopback = subparsers.add_parser("loopback", help="Servidor local con muchas partidas simultáneas.")
+    loopback.add_argument("--matches", type=int, default=100)
+    loopback.add_argument("--board-size", type=int, default=12)
+    loopback.add_argument("--seed", type=seed_argument, default=None)
+    args = parser.parse_args()
+
+    if args.mode == "server":
+        try:
+            asyncio.run(serve(args.host, args.port, args.seed))
+        except KeyboardInterrupt:
+            pass
+    elif args.mode == "client":
+        result = asyncio.run(play_client(args.host, args.port, args.match, args.board_size, args.seed))
+        outcome = "Ganaste" if result["winner"] == result["index"] else "Perdiste"
+        latencies = result["latencies"]
+        print(f"{outcome}. Latencia media: {sum(latencies) / max(1, len(latencies)) * 1000:.2f} ms")
+    else:
+        report = asyncio.run(run_loopback(args.matches, args.board_size, args.seed))
+        print(format_loopback(report))
+
+if __name__ == "__main__":
+    main()
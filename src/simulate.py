@@ -0,0 +1,29 @@
+import argparse
+import time
+from modules.simulation import run_simulation, format_report
+from modules.replay import seed_argument
+
+def main():
+    """Ejecuta la simulación Monte Carlo de balance desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación de balance de dados y estamina.")
+    parser.add_argument("--games", type=int, default=100000, help="Número de partidas a simular.")
+    parser.add_argument("--board-size", type=int, default=12, help="Tamaño del tablero.")
+    parser.add_argument("--max-rounds", type=int, default=500, help="Rondas máximas por partida.")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos a usar (por defecto, todos los núcleos).")
+    parser.add_argument("--seed", type=seed_argument, default=None, help="Semilla para reproducir la simulación.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = run_simulation(
+        args.games,
+        board_size=args.board_size,
+        max_rounds=args.max_rounds,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+    print(format_report(report))
+    print(f"Tiempo: {elapsed:.2f} s ({args.games / elapsed:,.0f} partidas/s)")
+
+if __name__ == "__main__":
+    main()
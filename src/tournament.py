@@ -0,0 +1,35 @@
+import argparse
+import os
+from modules.config import config
+from modules.tournament import STRATEGIES, run_tournament, format_report
+from modules.replay import seed_argument
+
+def main():
+    """Ejecuta un torneo bot contra bot desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Torneo entre estrategias del bot.")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES),
+                        help="Estrategias que participan.")
+    parser.add_argument("--games", type=int, default=1000, help="Partidas por pareja de estrategias.")
+    parser.add_argument("--board-size", type=int, default=12, help="Tamaño del tablero.")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos a usar (por defecto, todos los núcleos).")
+    parser.add_argument("--chunk-size", type=int, default=50, help="Partidas por tarea enviada a cada proceso.")
+    parser.add_argument("--seed", type=seed_argument, default=None, help="Semilla para reproducir el torneo.")
+    parser.add_argument("--placement-cache", default=None,
+                        help="Carpeta donde compartir las tablas de posiciones del bot de densidad entre procesos.")
+    args = parser.parse_args()
+    if args.placement_cache:
+        # Los procesos de trabajo leen la carpeta de la variable de entorno al importar la configuración
+        os.environ["SEVEN_SEAS_PLACEMENT_CACHE"] = config.PLACEMENT_CACHE_DIR = args.placement_cache
+
+    report = run_tournament(
+        args.strategies,
+        args.games,
+        board_size=args.board_size,
+        seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    print(format_report(report))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import unittest
+import pygame
+from tests.test_base import TestBase
+from src.modules.area_attacks import attack_shape, covered_cells, stencil
+from src.modules.array_board import ArrayBoard, ArrayAttackBoard
+from src.modules.board import Board
+from src.modules.player import Player
+from src.modules.attacks_logic import resolve_area_attack
+from src.modules.bot_ai import DensityTargeting
+from src.modules.utils import draw_preview, get_attack_cells
+
+class TestAttackShapes(TestBase):
+    def test_shapes_match_previous_cells(self):
+        self.assertEqual(get_attack_cells("line_attack", 0, 5, "H", 10), [(0, 4), (0, 5), (0, 6)])
+        self.assertEqual(get_attack_cells("line_attack", 0, 5, "V", 10), [(0, 5), (1, 5)])
+        self.assertEqual(get_attack_cells("square_attack", 9, 3, "H", 10), [(9, 3), (9, 4)])
+        self.assertEqual(get_attack_cells("normal_attack", 2, 2, None, 10), [(2, 2)])
+
+    def test_preview_uses_attack_shapes(self):
+        screen = pygame.display.set_mode((400, 400))
+        board = Board(10)
+        for attack_type, orientation in (("line_attack", "V"), ("square_attack", None), ("cross_attack", None)):
+            rects = draw_preview(screen, board, 4, 9, orientation, preview_type=attack_type)
+            cells = get_attack_cells(attack_type, 4, 9, orientation, 10)
+            self.assertEqual(rects, [board.cell_rect(row, col) for row, col in cells])
+
+    def test_cross_and_custom_stencil(self):
+        rows, cols = covered_cells(attack_shape("cross_attack"), 0, 0, 10)
+        self.assertEqual(sorted(zip(rows.tolist(), cols.tolist())), [(0, 0), (0, 1), (1, 0)])
+        diagonal = stencil([[1, 0], [0, 1]], anchor=(0, 0))
+        rows, cols = covered_cells(diagonal, 3, 3, 10)
+        self.assertEqual(list(zip(rows.tolist(), cols.tolist())), [(3, 3), (4, 4)])
+
+    def test_unknown_attack_type(self):
+        with self.assertRaises(ValueError):
+            attack_shape("nuclear_attack")
+
+class TestResolveAreaAttack(TestBase):
+    def make_players(self, compact):
+        if compact:
+            attacker = Player("A", ArrayBoard(6), attack_board=ArrayAttackBoard(6))
+            defender = Player("B", ArrayBoard(6), attack_board=ArrayAttackBoard(6))
+        else:
+            attacker, defender = Player("A", Board(6)), Player("B", Board(6))
+        defender.place_ship(defender.fleet[2], 2, 1, "H")  # Crucero de 3 celdas
+        return attacker, defender
+
+    def test_board_types_agree(self):
+        for compact in (False, True):
+            attacker, defender = self.make_players(compact)
+            life = defender.life
+            outcome = resolve_area_attack(attacker, defender, "square_attack", 1, 1)
+            self.assertEqual((outcome["hits"], outcome["misses"], outcome["shielded"]), (2, 2, 0))
+            self.assertEqual(defender.life, life - 2)
+            self.assertEqual(outcome["cells"], [(1, 1, "miss"), (1, 2, "miss"), (2, 1, "hit"), (2, 2, "hit")])
+
+            # Las celdas ya conocidas no se vuelven a atacar
+            outcome = resolve_area_attack(attacker, defender, "line_attack", 2, 2, "H")
+            self.assertEqual([cell[:2] for cell in outcome["cells"]], [(2, 3)])
+
+    def test_sunk_ship_reaches_targeting(self):
+        for compact in (False, True):
+            attacker, defender = self.make_players(compact)
+            attacker.targeting = DensityTargeting(6, defender.fleet)
+            resolve_area_attack(attacker, defender, "line_attack", 2, 2, "H")
+            self.assertEqual(attacker.targeting.remaining[3], 1)
+            self.assertFalse(attacker.targeting.open_hits)
+
+    def test_shield_blocks_first_cell_only(self):
+        attacker, defender = self.make_players(True)
+        defender.temp_shield = True
+        outcome = resolve_area_attack(attacker, defender, "line_attack", 2, 2, "H")
+        self.assertEqual([result for _, _, result in outcome["cells"]], ["shielded", "hit", "hit"])
+        self.assertFalse(defender.temp_shield)
+        self.assertEqual(attacker.attack_board.get_state(2, 1), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from tests.test_base import TestBase
+from src.modules.array_board import ArrayBoard, ArrayAttackBoard
+from src.modules.board import Board
+from src.modules.player import Player
+
+class TestArrayBoard(TestBase):
+    def setUp(self):
+        self.board_size = 10
+        self.board = ArrayBoard(self.board_size)
+
+    def test_initialization(self):
+        self.assertEqual(self.board.state.shape, (self.board_size, self.board_size))
+        self.assertEqual(self.board.state.dtype.name, "int8")
+        self.assertEqual(len(self.board.unattacked_cells()), self.board_size ** 2)
+
+    def test_update_cell(self):
+        self.board.update_cell(5, 5, state=1, ship="Battleship")
+        cell = self.board.get_cell(5, 5)
+        self.assertEqual(cell["state"], 1)
+        self.assertEqual(cell["ship"], "Battleship")
+
+    def test_receive_attack(self):
+        self.board.update_cell(0, 0, state=1, ship="Submarino")
+        self.assertEqual(self.board.receive_attack(0, 0), "hit")
+        self.assertEqual(self.board.receive_attack(1, 1), "miss")
+        self.assertEqual(self.board.receive_attack(1, 1), "already_attacked")
+        self.assertEqual(self.board.remaining_ship_count(), 0)
+        self.assertEqual(len(self.board.unattacked_cells()), self.board_size ** 2 - 2)
+
+    def test_player_with_array_board(self):
+        player = Player("Jugador", self.board, ArrayAttackBoard(self.board_size))
+        player.place_ship(player.fleet[0], 0, 0, "H")
+        self.assertEqual(len(self.board.remaining_ship_cells()), player.fleet[0].size)
+        self.assertEqual(player.receive_attack(0, 0), "hit")
+        self.assertEqual(player.life, sum(s.size for s in player.fleet) - 1)
+
+    def test_from_board(self):
+        board = Board(self.board_size)
+        board.update_cell(2, 3, state=1, ship="Crucero")
+        array_board = ArrayBoard.from_board(board)
+        self.assertEqual(array_board.to_grid(), board.grid)
+
+class TestArrayAttackBoard(TestBase):
+    def test_record(self):
+        attack_board = ArrayAttackBoard(10)
+        attack_board.record(0, 0, "hit")
+        attack_board.record(0, 1, "miss")
+        attack_board.record(0, 2, "already_attacked")
+        self.assertEqual(attack_board.get_state(0, 0), 2)
+        self.assertEqual(attack_board.get_state(0, 1), 1)
+        self.assertEqual(attack_board.get_state(0, 2), 0)
+        self.assertEqual(len(attack_board.unattacked_cells()), 98)
+        self.assertEqual(attack_board.hit_cells().tolist(), [[0, 0]])
+
+if __name__ == '__main__':
+    unittest.main()
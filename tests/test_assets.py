@@ -0,0 +1,54 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest import mock
+import pygame
+from tests.test_base import TestBase
+from src.modules.assets import IMAGES, AssetManager, build_asset_pack
+
+class TestAssetManager(TestBase):
+    def setUp(self):
+        pygame.display.set_mode((10, 10))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pack_path = os.path.join(self.tmp.name, "pack.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_images_are_scaled_and_cached(self):
+        assets = AssetManager(self.pack_path)
+        image = assets.image("menu", (40, 20))
+        self.assertEqual(image.get_size(), (40, 20))
+        self.assertIs(assets.image("menu", (40, 20)), image)
+        self.assertEqual(len(assets.sources), 1)
+
+    def test_pack_matches_scaled_source(self):
+        build_asset_pack([("battle", (30, 15), False)], self.pack_path)
+        packed = AssetManager(self.pack_path)
+        image = packed.image("battle", (30, 15))
+        self.assertFalse(packed.sources)  # No hizo falta leer el PNG
+        expected = AssetManager("/no/existe").image("battle", (30, 15))
+        self.assertEqual(image.get_at((7, 7)), expected.get_at((7, 7)))
+
+    def test_pack_is_keyed_on_source_content(self):
+        source = os.path.join(self.tmp.name, "battle.png")
+        shutil.copy(IMAGES["battle"], source)
+        with mock.patch.dict(IMAGES, {"battle": source}):
+            build_asset_pack([("battle", (30, 15), False)], self.pack_path)
+            os.utime(source, (0, 0))  # Como tras un clon: otra fecha, mismo contenido
+            packed = AssetManager(self.pack_path)
+            packed.image("battle", (30, 15))
+            self.assertFalse(packed.sources)
+
+            with open(source, "ab") as file:
+                file.write(b"\0")
+            stale = AssetManager(self.pack_path)
+            stale.image("battle", (30, 15))
+            self.assertTrue(stale.sources)  # El original cambió: se decodifica el PNG
+
+    def test_missing_music_does_not_crash(self):
+        self.assertFalse(AssetManager(self.pack_path).play_music("menu"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+from tests.test_base import TestBase
+from benchmarks.run_benchmarks import run_case, compare_results
+
+class TestBenchmarks(TestBase):
+    def test_run_case_reports_per_operation_time(self):
+        stats = run_case("receive_attack", 6, rounds=3, min_time=0, seed=0)
+        self.assertEqual(stats["rounds"], 3)
+        self.assertLessEqual(stats["min"], stats["median"])
+
+    def test_compare_flags_regressions(self):
+        baseline = {"a[12]": {"median": 1.0}, "b[12]": {"median": 1.0}}
+        current = {"a[12]": {"median": 1.1}, "b[12]": {"median": 2.0}, "c[12]": {"median": 1.0}}
+        rows = compare_results(current, baseline, threshold=0.25)
+        self.assertEqual([(row[0], row[4]) for row in rows], [("a[12]", False), ("b[12]", True)])
+
+if __name__ == '__main__':
+    unittest.main()
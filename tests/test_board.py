@@ -1,4 +1,5 @@
 import unittest
+import pygame
 from tests.test_base import TestBase
 from src.modules.board import Board
 
@@ -22,5 +23,20 @@ class TestBoard(TestBase):
         self.assertEqual(cell["state"], 1)
         self.assertEqual(cell["ship"], "Battleship")
 
+    def test_draw_repaints_only_dirty_cells(self):
+        screen = pygame.Surface((800, 600))
+        first = self.board.draw(screen)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(self.board.draw(screen), [])
+
+        self.board.update_cell(2, 3, state=1, ship="Submarino")
+        changed = self.board.draw(screen)
+        self.assertEqual(len(changed), 1)
+        self.assertEqual(changed[0].size, (self.board.cell_size, self.board.cell_size))
+        self.assertEqual(
+            screen.get_at(changed[0].move(2, 2).topleft)[:3],
+            self.board.get_cell_color(self.board.grid[2][3]),
+        )
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import random
+import numpy as np
+from tests.test_base import TestBase
+from src.modules.bot_ai import DensityTargeting, density_policy, MISS
+from src.modules.engine import GameEngine, play_match, random_policy
+from src.modules.warships import Ship
+
+class TestDensityTargeting(TestBase):
+    def setUp(self):
+        self.fleet = [Ship("Crucero", 3), Ship("Submarino", 2)]
+        self.targeting = DensityTargeting(6, self.fleet)
+
+    def rebuilt_density(self):
+        fresh = DensityTargeting(6, self.fleet)
+        fresh.known = self.targeting.known.copy()
+        fresh.remaining = self.targeting.remaining.copy()
+        fresh.density[:] = 0
+        for size, count in fresh.remaining.items():
+            fresh._add_placements(size, count)
+        return fresh.density
+
+    def test_initial_density(self):
+        # Un barco de 3 en una fila de 6 tiene 4 posiciones; la celda 0 aparece en 1
+        self.assertEqual(self.targeting.density[0, 0], 2 + 2)
+        self.assertEqual(self.targeting.density[2, 2], 6 + 4)
+
+    def test_incremental_update_matches_rebuild(self):
+        for row, col, result in [(2, 2, "miss"), (0, 1, "hit"), (4, 5, "miss"), (3, 3, "hit")]:
+            self.targeting.record(row, col, result)
+        np.testing.assert_array_equal(self.targeting.density, self.rebuilt_density())
+
+    def test_target_mode_attacks_next_to_hit(self):
+        self.targeting.record(3, 3, "hit")
+        row, col = self.targeting.choose_target(random.Random(0))
+        self.assertEqual(abs(row - 3) + abs(col - 3), 1)
+
+    def test_on_ship_sunk(self):
+        self.targeting.record(0, 0, "hit")
+        self.targeting.record(0, 1, "hit")
+        self.targeting.on_ship_sunk(2, [(0, 0), (0, 1)])
+        self.assertFalse(self.targeting.open_hits)
+        self.assertEqual(self.targeting.remaining[2], 0)
+        np.testing.assert_array_equal(self.targeting.density, self.rebuilt_density())
+
+    def test_choose_line_and_square_avoid_known_cells(self):
+        for col in range(6):
+            self.targeting.record(0, col, "miss")
+        row, col, orientation = self.targeting.choose_line(random.Random(1))
+        self.assertTrue(row > 0 or orientation == "V")
+        row, col = self.targeting.choose_square(random.Random(1))
+        self.assertGreater(row, 0)
+
+class TestDensityPolicy(TestBase):
+    def test_beats_random_policy(self):
+        random.seed(0)
+        wins = 0
+        for seed in range(10):
+            engine = GameEngine(board_size=10, rng=random.Random(seed))
+            winner = play_match(engine, (density_policy, random_policy))
+            wins += winner is engine.player
+        self.assertGreaterEqual(wins, 7)
+
+    def test_falls_back_to_shielded_cells(self):
+        engine = GameEngine(board_size=6, rng=random.Random(0), compact=True)
+        engine.phase = "attack"
+        player = engine.current_player
+        player.stamina = 0
+        player.targeting = DensityTargeting(6, player.fleet)
+        player.targeting.known[:] = MISS  # Ya no queda ninguna celda desconocida
+        player.attack_board.state[2, 3] = 4
+        self.assertEqual(density_policy(engine), ("normal_attack", 2, 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import random
+import time
+import unittest
+from tests.test_base import TestBase
+from src.modules.bot_planner import BotPlanner
+from src.modules.board import Board
+from src.modules.player import Player
+from src.modules.bot_ai import DensityTargeting
+from src.modules.attacks_logic import decide_bot_move
+
+class TestBotPlanner(TestBase):
+    def setUp(self):
+        self.bot = Player("Bot", Board(10), rng=random.Random(4))
+
+    def test_take_runs_idle_while_thinking(self):
+        def slow_decide(bot, value):
+            time.sleep(0.05)
+            return value
+        planner = BotPlanner(self.bot, slow_decide, 42)
+        planner.start()
+        idle_calls = []
+        self.assertEqual(planner.take(idle=lambda: idle_calls.append(time.sleep(0.005))), 42)
+        self.assertTrue(idle_calls)
+        self.assertEqual(planner.pending, 0)
+
+    def test_errors_reach_the_caller(self):
+        def broken(bot):
+            raise ValueError("sin jugada")
+        planner = BotPlanner(self.bot, broken)
+        with self.assertRaises(ValueError):
+            planner.take(idle=lambda: time.sleep(0.001))
+
+    def test_background_move_matches_direct_move(self):
+        self.bot.stamina = 10
+        self.bot.targeting = DensityTargeting(10, self.bot.fleet)
+        planner = BotPlanner(self.bot, decide_bot_move, 10)
+        planned = [planner.take(idle=lambda: time.sleep(0.001)) for _ in range(5)]
+
+        self.bot.rng = random.Random(4)
+        self.assertEqual(planned, [decide_bot_move(self.bot, 10) for _ in range(5)])
+
+if __name__ == "__main__":
+    unittest.main()
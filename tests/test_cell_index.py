@@ -0,0 +1,47 @@
+import unittest
+import random
+from tests.test_base import TestBase
+from src.modules.cell_index import UnattackedCells
+from src.modules.board import Board
+from src.modules.player import Player
+from src.modules.attacks_logic import update_attack_board
+
+class TestUnattackedCells(TestBase):
+    def setUp(self):
+        self.index = UnattackedCells(4)
+
+    def test_discard(self):
+        self.index.discard(0, 0)
+        self.index.discard(3, 3)
+        self.index.discard(0, 0)
+        self.assertEqual(len(self.index), 14)
+        self.assertNotIn((0, 0), self.index)
+        self.assertIn((1, 2), self.index)
+        self.assertEqual(sorted(self.index), sorted(
+            (row, col) for row in range(4) for col in range(4) if (row, col) not in [(0, 0), (3, 3)]
+        ))
+
+    def test_sample_only_returns_remaining_cells(self):
+        rng = random.Random(0)
+        for row in range(4):
+            for col in range(3):
+                self.index.discard(row, col)
+        samples = {self.index.sample(rng) for _ in range(50)}
+        self.assertEqual(samples, {(row, 3) for row in range(4)})
+
+    def test_sample_empty(self):
+        for row in range(4):
+            for col in range(4):
+                self.index.discard(row, col)
+        self.assertIsNone(self.index.sample())
+        self.assertFalse(self.index)
+
+    def test_update_attack_board_keeps_index(self):
+        player = Player("Bot", Board(4))
+        update_attack_board(player, 1, 1, "miss")
+        update_attack_board(player, 2, 2, "shielded")
+        self.assertEqual(len(player.unattacked), 14)
+        self.assertNotIn((2, 2), player.unattacked)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from tests.test_base import TestBase
+from src.modules.board import Board
+from src.modules.player import Player
+from src.modules.dice import DICE_CODES, DICE_EFFECTS, apply_dice_roll, roll_many
+
+class TestDice(TestBase):
+    def test_single_roll_matches_table(self):
+        for dice_result in (3, 20, 40, 48, 52, 70, 99):
+            player = Player("Jugador", Board(10))
+            stamina, life = player.stamina, player.life
+            apply_dice_roll(dice_result, player)
+            code = DICE_CODES[dice_result]
+            self.assertEqual(player.stamina - stamina, DICE_EFFECTS["stamina"][code])
+            self.assertEqual(life - player.life, DICE_EFFECTS["life"][code])
+            self.assertEqual(player.temp_shield, bool(DICE_EFFECTS["shield"][code]))
+            self.assertEqual(player.turn_skipped, bool(DICE_EFFECTS["skip"][code]))
+        self.assertEqual(apply_dice_roll(0, Player("Jugador", Board(10))), "Evento desconocido.")
+
+    def test_roll_many_matches_single_rolls(self):
+        n = 500
+        batch = {
+            "stamina": np.full((2, n), 5), "life": np.ones((2, n), dtype=int),
+            "shield": np.zeros((2, n), dtype=bool), "skip": np.zeros((2, n), dtype=bool),
+        }
+        rolls, skipped = roll_many(n, batch, np.random.default_rng(2), index=(1, slice(None)))
+        self.assertEqual(batch["stamina"][0].tolist(), [5] * n)
+
+        for column in (0, 1, n - 1):
+            player = Player("Jugador", Board(10))
+            player.stamina, player.life = 5, 1
+            apply_dice_roll(int(rolls[column]), player)
+            self.assertEqual(
+                (batch["stamina"][1, column], batch["life"][1, column], batch["shield"][1, column], skipped[column]),
+                (player.stamina, player.life, player.temp_shield, player.turn_skipped),
+            )
+        np.testing.assert_array_equal(batch["skip"][1], skipped)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import random
+from tests.test_base import TestBase
+from src.modules.engine import GameEngine, play_match
+
+class TestEngine(TestBase):
+    def setUp(self):
+        self.engine = GameEngine(board_size=10, rng=random.Random(1), place_fleets=False)
+        ship = self.engine.bot.fleet[0]
+        self.engine.bot.place_ship(ship, 0, 0, "H")
+
+    def test_roll_applies_dice_event(self):
+        result = self.engine.step(("roll", 40))
+        self.assertEqual(self.engine.player.stamina, 7)
+        self.assertEqual(self.engine.phase, "attack")
+        self.assertFalse(result["turn_over"])
+
+    def test_roll_lost_turn(self):
+        result = self.engine.step(("roll", 3))
+        self.assertTrue(result["turn_over"])
+        self.assertEqual(self.engine.current_player, self.engine.bot)
+        self.assertFalse(self.engine.player.turn_skipped)
+
+    def test_hit_keeps_turn(self):
+        self.engine.step(("roll", 60))
+        result = self.engine.step(("normal_attack", 0, 0))
+        self.assertEqual(result["results"], [(0, 0, "hit")])
+        self.assertEqual(self.engine.current_player, self.engine.player)
+        self.assertEqual(self.engine.phase, "attack")
+
+    def test_miss_ends_turn_and_grants_stamina(self):
+        self.engine.step(("roll", 60))
+        result = self.engine.step(("normal_attack", 5, 5))
+        self.assertTrue(result["turn_over"])
+        self.assertEqual(self.engine.player.stamina, 7)
+        self.assertEqual(self.engine.current_player, self.engine.bot)
+
+    def test_insufficient_stamina(self):
+        self.engine.step(("roll", 60))
+        self.engine.player.stamina = 2
+        with self.assertRaises(ValueError):
+            self.engine.step(("square_attack", 0, 0))
+
+    def test_play_match_has_winner(self):
+        engine = GameEngine(board_size=10, rng=random.Random(7))
+        winner = play_match(engine)
+        self.assertIsNotNone(winner)
+        self.assertTrue(engine.done)
+        self.assertLessEqual(min(p.life for p in engine.players), 0)
+
+    def test_play_match_compact_boards(self):
+        engine = GameEngine(board_size=10, rng=random.Random(7), compact=True)
+        winner = play_match(engine)
+        self.assertIsNotNone(winner)
+        loser = engine.bot if winner is engine.player else engine.player
+        self.assertLessEqual(loser.life, 0)
+        self.assertEqual(engine.player_board.state.dtype.name, "int8")
+
+if __name__ == '__main__':
+    unittest.main()
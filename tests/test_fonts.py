@@ -0,0 +1,35 @@
+import unittest
+from tests.test_base import TestBase
+from src.modules.fonts import FontCache
+from src.modules.config import config
+
+class TestFonts(TestBase):
+    def setUp(self):
+        self.cache = FontCache(max_text_surfaces=2)
+
+    def test_font_is_loaded_once(self):
+        first = self.cache.get_font(config.font_regular, 24)
+        second = self.cache.get_font(config.font_regular, 24)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats["font_misses"], 1)
+        self.assertEqual(self.cache.stats["font_hits"], 1)
+
+    def test_text_surfaces_are_reused(self):
+        font = self.cache.get_font(config.font_regular, 24)
+        first = self.cache.render(font, "Hola", config.colors["text"])
+        second = self.cache.render(font, "Hola", config.colors["text"])
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hit_rates()["text"], 0.5)
+
+    def test_lru_eviction(self):
+        font = self.cache.get_font(config.font_regular, 24)
+        first = self.cache.render(font, "A", config.colors["text"])
+        self.cache.render(font, "B", config.colors["text"])
+        self.cache.render(font, "A", config.colors["text"])
+        self.cache.render(font, "C", config.colors["text"])
+        self.assertEqual(len(self.cache.text_surfaces), 2)
+        self.assertIs(self.cache.render(font, "A", config.colors["text"]), first)
+        self.assertEqual(self.cache.stats["text_misses"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
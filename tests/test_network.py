@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from tests.test_base import TestBase
+from src.modules.array_board import ArrayBoard
+from src.modules.player import Player
+from src.modules.replay import encode_fleet, fleet_layout
+from src.modules.network import _FRAME, _JOIN, JOIN, START, GameServer, play_client, read_message, run_loopback
+
+class TestNetwork(TestBase):
+    def test_loopback_matches_finish(self):
+        report = asyncio.run(run_loopback(matches=4, board_size=10, seed=3))
+        self.assertEqual([stats["match"] for stats in report["matches"]], [0, 1, 2, 3])
+        for stats in report["matches"]:
+            self.assertIn(stats["winner"], (0, 1))
+            self.assertGreater(stats["actions"], 0)
+            self.assertGreater(stats["latency"]["mean_ms"], 0)
+        self.assertEqual(report["actions"], sum(stats["actions"] for stats in report["matches"]))
+
+    def test_clients_agree_and_match_is_released(self):
+        async def scenario():
+            server = await GameServer(seed=0).start()
+            try:
+                games = [play_client(server.host, server.port, 7, 10, seed) for seed in range(2)]
+                first, second = await asyncio.gather(*games)
+                self.assertEqual(first["winner"], second["winner"])
+                # La partida terminada se libera y su identificador se puede reutilizar
+                self.assertNotIn(7, server.matches)
+            finally:
+                await server.close()
+        asyncio.run(scenario())
+
+    def test_dropped_client_ends_the_match(self):
+        async def quitter(server):
+            player = Player("Red", ArrayBoard(10))
+            player.place_fleet_randomly()
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            payload = _JOIN.pack(3, 10) + encode_fleet(fleet_layout(player))
+            writer.write(_FRAME.pack(JOIN, len(payload)) + payload)
+            code, _ = await read_message(reader)
+            self.assertEqual(code, START)
+            writer.close()
+
+        async def scenario():
+            server = await GameServer(seed=1).start()
+            try:
+                client = asyncio.ensure_future(play_client(server.host, server.port, 3, 10, seed=0, timeout=5))
+                await quitter(server)
+                with self.assertRaises(ValueError):
+                    await client
+                self.assertNotIn(3, server.matches)
+                self.assertEqual(len(server.finished), 1)
+                self.assertIsNotNone(server.finished[0]["abandoned"])
+            finally:
+                await server.close()
+        asyncio.run(scenario())
+
+    def test_client_leaving_the_lobby_frees_the_match(self):
+        async def scenario():
+            server = await GameServer(seed=2).start()
+            try:
+                player = Player("Red", ArrayBoard(10))
+                player.place_fleet_randomly()
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                payload = _JOIN.pack(5, 10) + encode_fleet(fleet_layout(player))
+                writer.write(_FRAME.pack(JOIN, len(payload)) + payload)
+                await writer.drain()
+                await asyncio.sleep(0.05)
+                self.assertIn(5, server.matches)
+                writer.close()
+                for _ in range(50):
+                    if 5 not in server.matches:
+                        break
+                    await asyncio.sleep(0.02)
+                self.assertNotIn(5, server.matches)
+
+                games = [play_client(server.host, server.port, 5, 10, seed, timeout=5) for seed in range(2)]
+                first, second = await asyncio.gather(*games)
+                self.assertEqual(first["winner"], second["winner"])
+                self.assertIsNone(server.finished[0]["abandoned"])
+            finally:
+                await server.close()
+        asyncio.run(scenario())
+
+if __name__ == "__main__":
+    unittest.main()
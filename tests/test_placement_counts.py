@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from tests.test_base import TestBase
+from src.modules import placement_counts
+from src.modules.placement_counts import fleet_key, load_placement_tables, placement_counts as counts_for
+from src.modules.warships import Ship, create_fleet
+
+class TestPlacementCounts(TestBase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        placement_counts._tables.clear()
+
+    def tearDown(self):
+        placement_counts._tables.clear()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_counts_by_brute_force(self):
+        n = 6
+        for size in (1, 3, 7):
+            expected = np.zeros((n, n), dtype=np.int32)
+            orientations = ((0, 1),) if size == 1 else ((0, 1), (1, 0))
+            for d_row, d_col in orientations:
+                for row in range(n):
+                    for col in range(n):
+                        cells = [(row + i * d_row, col + i * d_col) for i in range(size)]
+                        if all(r < n and c < n for r, c in cells):
+                            for r, c in cells:
+                                expected[r, c] += 1
+            np.testing.assert_array_equal(counts_for(n, size), expected)
+
+    def test_tables_are_cached_on_disk(self):
+        fleet = create_fleet()
+        self.assertEqual(fleet_key(fleet), "6x1-4x1-3x2-2x3-1x4")
+        tables = load_placement_tables(9, fleet, cache_dir=self.directory.name)
+        path = os.path.join(self.directory.name, "9_6x1-4x1-3x2-2x3-1x4.npy")
+        self.assertTrue(os.path.exists(path))
+
+        placement_counts._tables.clear()
+        np.save(path, np.asarray(np.load(path)) * 2)  # Solo la copia en disco cambia
+        cached = load_placement_tables(9, fleet, cache_dir=self.directory.name)
+        np.testing.assert_array_equal(cached.counts[6], tables.counts[6] * 2)
+
+    def test_default_tables_stay_in_memory(self):
+        directory = os.path.join(placement_counts.PROJECT_ROOT, "cache")
+        before = os.path.exists(directory) and sorted(os.listdir(directory))
+        tables = load_placement_tables(7)
+        self.assertIs(load_placement_tables(7), tables)
+        self.assertEqual(os.path.exists(directory) and sorted(os.listdir(directory)), before)
+
+    def test_cache_dir_is_part_of_the_memory_key(self):
+        load_placement_tables(9)
+        load_placement_tables(9, cache_dir=self.directory.name)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "9_6x1-4x1-3x2-2x3-1x4.npy")))
+
+    def test_configured_cache_dir(self):
+        self.addCleanup(setattr, placement_counts.config, "PLACEMENT_CACHE_DIR", placement_counts.config.PLACEMENT_CACHE_DIR)
+        placement_counts.config.PLACEMENT_CACHE_DIR = self.directory.name
+        load_placement_tables(8)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "8_6x1-4x1-3x2-2x3-1x4.npy")))
+
+    def test_damaged_cache_is_rebuilt(self):
+        fleet = [Ship("Lancha", 2), Ship("Lancha", 2)]
+        path = os.path.join(self.directory.name, "5_2x2.npy")
+        with open(path, "wb") as file:
+            file.write(b"basura")
+        tables = load_placement_tables(5, fleet, cache_dir=self.directory.name)
+        np.testing.assert_array_equal(tables.density({2: 2}), 2 * counts_for(5, 2))
+        self.assertEqual(np.load(path).shape, (1, 5, 5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from tests.test_base import TestBase
 from src.modules.player import Player
 from src.modules.board import Board
+from src.modules.warships import Ship
 
 class TestPlayer(TestBase):
     def setUp(self):
@@ -21,6 +22,23 @@ class TestPlayer(TestBase):
         self.assertTrue(placed)
         self.assertIn((0, 0), self.player.placed_ships)
 
+    def test_valid_placements(self):
+        self.assertEqual(len(list(self.player.valid_placements(3))), 2 * 10 * 8)
+        self.player.place_ship(self.player.fleet[0], 0, 0, "H")
+        for row, col, orientation in self.player.valid_placements(2):
+            self.assertTrue(self.player.can_place_ship(Ship("Submarino", 2), row, col, orientation))
+
+    def test_place_fleet_randomly_dense_board(self):
+        # 28 celdas de flota en un tablero de 6x6
+        player = Player("Bot", Board(6))
+        player.place_fleet_randomly(attempts=1)
+        self.assertEqual(len(player.placed_ships), sum(ship.size for ship in player.fleet))
+
+    def test_place_fleet_randomly_without_space(self):
+        player = Player("Bot", Board(4))
+        with self.assertRaises(ValueError):
+            player.place_fleet_randomly()
+
     def test_receive_attack_miss(self):
         result = self.player.receive_attack(0, 0)
         self.assertEqual(result, "miss")
@@ -34,6 +52,20 @@ class TestPlayer(TestBase):
         self.assertEqual(result, "hit")
         self.assertEqual(self.player.life, sum(s.size for s in self.player.fleet) - 1)
 
+    def test_sunk_ships_with_same_name(self):
+        first, second = self.player.fleet[-2:]  # Dos destructores de una celda
+        self.player.place_ship(first, 0, 0, "H")
+        self.player.place_ship(second, 0, 2, "H")
+        self.assertEqual(self.board.ship_id_at(0, 2), second.ship_id)
+
+        self.player.receive_attack(0, 2)
+        self.assertEqual(self.player.pop_sunk(), [second])
+        self.assertEqual(self.player.pop_sunk(), [])
+        self.assertFalse(first.sunk)
+        self.assertEqual(self.player.ships_afloat, len(self.player.fleet) - 1)
+        self.assertIn(("Destructor", 1, 0), self.player.fleet_status())
+        self.assertIn(("Destructor", 1, 1), self.player.fleet_status())
+
     def test_receive_attack_shielded(self):
         self.player.temp_shield = True
         result = self.player.receive_attack(0, 0)
@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+from tests.test_base import TestBase
+from src.modules.board import Board
+from src.modules.player import Player
+from src.modules.player_batch import PlayerBatch
+from src.modules.dice import roll_many
+
+class TestPlayerBatch(TestBase):
+    def test_load_copies_players(self):
+        player, bot = Player("Jugador", Board(10)), Player("Bot", Board(10))
+        bot.place_ship(bot.fleet[2], 4, 1, "V")
+        bot.fleet[2].hits = 3
+        bot.stamina, bot.last_attack_type = 8, "square_attack"
+        batch = PlayerBatch.from_players([(player, bot), (player, player)])
+
+        self.assertEqual(batch.names, ("Jugador", "Bot"))
+        self.assertEqual(batch.stamina[1].tolist(), [8, 5])
+        self.assertEqual(batch.last_attack[1, 0], 2)
+        self.assertEqual(batch.ships_afloat[1].tolist(), [len(bot.fleet) - 1, len(bot.fleet)])
+        self.assertEqual(
+            (batch.ship_row[1, 0, 2], batch.ship_col[1, 0, 2], batch.ship_orientation[1, 0, 2]), (4, 1, 1)
+        )
+
+    def test_hits_and_turn_end_are_batched(self):
+        batch = PlayerBatch(3)
+        life = batch.life[1].copy()
+        sunk = batch.hit_ships(1, [0, 1, 2], [10, 10, 0])  # Un destructor de una celda y el portaaviones
+        self.assertEqual(sunk.tolist(), [True, True, False])
+        self.assertEqual((life - batch.life[1]).tolist(), [1, 1, 1])
+        self.assertEqual(batch.ships_afloat[1].tolist(), [10, 10, 11])
+
+        # Un barco hundido ya no recibe impactos ni quita vida
+        life = batch.life[1].copy()
+        sunk = batch.hit_ships(1, [0, 0], [10, 9])
+        self.assertEqual(sunk.tolist(), [False, True])
+        self.assertEqual((life - batch.life[1]).tolist(), [1, 0, 0])
+
+        batch.last_attack[0] = [0, 1, -1]
+        batch.end_turn(0, np.arange(3))
+        self.assertEqual(batch.stamina[0].tolist(), [7, 6, 6])
+
+    def test_roll_many_updates_the_batch(self):
+        batch = PlayerBatch(200)
+        _, skipped = roll_many(200, batch, np.random.default_rng(1), index=(0, slice(None)))
+        np.testing.assert_array_equal(batch.turn_skipped[0], skipped)
+        self.assertTrue((batch.stamina[0] >= 5).all())
+        self.assertEqual(batch.stamina[1].tolist(), [5] * 200)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import csv
+import json
+import tempfile
+import pygame
+from tests.test_base import TestBase
+from src.modules.profiler import Profiler
+
+def work():
+    return sum(range(1000))
+
+class TestProfiler(TestBase):
+    def test_disabled_profiler_leaves_functions_untouched(self):
+        profiler = Profiler()
+        self.assertIs(profiler.timed("trabajo")(work), work)
+        with profiler.section("nada"):
+            pass
+        profiler.end_frame()
+        self.assertFalse(profiler.frames)
+
+    def test_sections_are_grouped_by_frame(self):
+        profiler = Profiler(enabled=True)
+        timed_work = profiler.timed("trabajo")(work)
+        profiler.end_frame()
+        for _ in range(3):
+            timed_work()
+            timed_work()
+            with profiler.section("bloque"):
+                work()
+            profiler.end_frame()
+        summary = profiler.summary()
+        self.assertEqual(summary["frames"], 3)
+        self.assertEqual(profiler.calls["trabajo"], 6)
+        self.assertEqual(set(summary["sections"]), {"trabajo", "bloque"})
+        self.assertIn("text", summary["cache_hit_rates"])
+
+    def test_dump_and_overlay(self):
+        profiler = Profiler(enabled=True)
+        profiler.end_frame()
+        with profiler.section("dibujo"):
+            work()
+        profiler.end_frame()
+
+        with tempfile.TemporaryDirectory() as folder:
+            csv_path = os.path.join(folder, "perfil.csv")
+            profiler.dump(csv_path)
+            with open(csv_path, encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+            self.assertEqual(rows[0], ["frame", "frame_ms", "dibujo"])
+            self.assertEqual(len(rows), 2)
+
+            json_path = os.path.join(folder, "perfil.json")
+            profiler.dump(json_path)
+            with open(json_path, encoding="utf-8") as file:
+                self.assertEqual(len(json.load(file)["frames"]), 1)
+
+        rect = profiler.draw_overlay(pygame.Surface((400, 300)))
+        self.assertGreater(rect.width, 0)
+
+if __name__ == '__main__':
+    unittest.main()
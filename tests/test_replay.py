@@ -0,0 +1,49 @@
+import unittest
+import random
+from tests.test_base import TestBase
+from src.modules.engine import GameEngine, play_match, random_policy
+from src.modules.bot_ai import density_policy
+from src.modules.replay import MoveLog, replay
+
+class TestReplay(TestBase):
+    def play(self, seed):
+        log = MoveLog(10, seed)
+        engine = GameEngine(board_size=10, rng=random.Random(seed), log=log)
+        play_match(engine, (density_policy, random_policy))
+        return engine, log
+
+    def test_same_seed_same_game(self):
+        _, first = self.play(3)
+        _, second = self.play(3)
+        self.assertEqual(first.to_bytes(), second.to_bytes())
+
+    def test_binary_round_trip(self):
+        _, log = self.play(5)
+        loaded = MoveLog.from_bytes(log.to_bytes())
+        self.assertEqual(loaded.seed, 5)
+        self.assertEqual(loaded.fleets, log.fleets)
+        self.assertEqual(loaded.actions, log.actions)
+
+    def test_replay_reproduces_final_state(self):
+        engine, log = self.play(7)
+        for compact in (False, True):
+            replayed = replay(MoveLog.from_bytes(log.to_bytes()), compact=compact)
+            self.assertEqual(replayed.winner.name, engine.winner.name)
+            self.assertEqual(replayed.current_round, engine.current_round)
+            self.assertEqual(
+                [(p.life, p.stamina) for p in replayed.players],
+                [(p.life, p.stamina) for p in engine.players],
+            )
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            MoveLog.from_bytes(b"PNG!" + bytes(20))
+
+    def test_seed_must_fit_the_header(self):
+        self.assertEqual(MoveLog.from_bytes(MoveLog(10, 2**64 - 1).to_bytes()).seed, 2**64 - 1)
+        for seed in (-1, 2**64):
+            with self.assertRaises(ValueError):
+                MoveLog(10, seed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+import pygame
+from tests.test_base import TestBase
+from src.modules.scenes import Scene, SceneDispatcher
+from src.modules.buttons import ActionButtonsScene
+from src.modules.dice import DiceScene
+from src.modules.board import Board
+from src.modules.player import Player
+from src.modules.config import config
+from src.modules import attacks_logic, scenes
+
+class CountingScene(Scene):
+    """Escena que se cierra con ENTER y cuenta cuántas veces se dibujó."""
+    def __init__(self):
+        super().__init__()
+        self.draws = 0
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.finish("listo")
+
+    def draw(self, screen):
+        self.draws += 1
+        return []
+
+class TestSceneDispatcher(TestBase):
+    def setUp(self):
+        self.screen = pygame.display.set_mode((800, 600))
+        pygame.event.clear()
+        self.dispatcher = SceneDispatcher(idle_timeout=10)
+
+    def test_idle_scene_draws_once(self):
+        scene = CountingScene()
+        for _ in range(5):
+            pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(0, 0), buttons=(0, 0, 0)))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r", scancode=0))
+        self.assertEqual(self.dispatcher.run(scene, self.screen), "listo")
+        self.assertEqual(scene.draws, 1)
+        self.assertEqual(scene.events.count(pygame.MOUSEMOTION), 5)
+        self.assertEqual(self.dispatcher.stack, [])
+
+    def test_due_timer_does_not_block_on_empty_queue(self):
+        scene = CountingScene()
+        scheduler = scenes.scheduler  # El planificador que usa el despachador
+        dispatcher = SceneDispatcher(idle_timeout=5000)
+        scheduler.call_later(-1, lambda: scene.finish("a tiempo"))
+        start = pygame.time.get_ticks()
+        self.assertEqual(dispatcher.run(scene, self.screen), "a tiempo")
+        self.assertLess(pygame.time.get_ticks() - start, 1000)
+
+    def test_click_on_affordable_button(self):
+        player = Player("Jugador", Board(10))
+        player.stamina = 3
+        area = pygame.Rect(200, 200, 400, 150)
+        click = lambda pos: pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        click((area.x + 70 + 5, area.y + 80 + 5))  # Ataque cuadrado: cuesta 4, no alcanza
+        click((area.x + 210 + 5, area.y + 30 + 5))  # Ataque lineal
+        self.assertEqual(self.dispatcher.run(ActionButtonsScene(area, player), self.screen), "line_attack")
+
+    def test_dice_roll_uses_game_rng(self):
+        area = pygame.Rect(200, 200, 400, 150)
+        scene = DiceScene("Tira", area, random.Random(9))
+        scene.roll_duration = 0
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(area.x + 150, area.y + 100), button=1))
+        self.assertEqual(self.dispatcher.run(scene, self.screen), random.Random(9).randint(1, 100))
+
+    def test_attack_selection_redraws_only_the_preview(self):
+        ui = attacks_logic.ui  # La misma instancia que usa la escena
+        ui.init_screen()
+        player, bot = Player("Jugador", Board(10)), Player("Bot", Board(10))
+        scene = attacks_logic.AttackSelectionScene(bot.board, player, bot, "normal_attack", 1)
+        first = scene.draw(ui.screen)
+        self.assertIn(ui.attack_board_rect(bot.board), first)
+
+        old, new = bot.board.cell_rect(0, 0), bot.board.cell_rect(0, 1)
+        scene.selected_col = 1
+        self.assertEqual(scene.draw(ui.screen), [old, new])
+        self.assertEqual(ui.screen.get_at(old.center)[:3], config.colors["cell"])
+        self.assertEqual(ui.screen.get_at(new.center)[:3], config.colors["preview_attack"])
+
+if __name__ == "__main__":
+    unittest.main()
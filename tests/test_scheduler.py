@@ -0,0 +1,64 @@
+import unittest
+import pygame
+from tests.test_base import TestBase
+from src.modules.scheduler import Scheduler
+
+class TestScheduler(TestBase):
+    def setUp(self):
+        pygame.display.set_mode((10, 10))
+        self.scheduler = Scheduler(fps=200)
+
+    def test_call_later_runs_in_order(self):
+        calls = []
+        self.scheduler.call_later(20, lambda: calls.append("segundo"))
+        self.scheduler.call_later(0, lambda: calls.append("primero"))
+        self.scheduler.run_pending()
+        self.assertEqual(calls, ["primero"])
+        self.scheduler.wait(40)
+        self.assertEqual(calls, ["primero", "segundo"])
+
+    def test_wait_discards_input_and_keeps_other_events(self):
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 1), button=1))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        start = pygame.time.get_ticks()
+        self.scheduler.wait(30)
+        self.assertGreaterEqual(pygame.time.get_ticks() - start, 30)
+        self.assertFalse(pygame.event.peek(pygame.KEYDOWN))
+        self.assertFalse(pygame.event.peek(pygame.MOUSEBUTTONDOWN))
+        self.assertTrue(pygame.event.peek(pygame.USEREVENT))
+
+    def test_timeout_never_blocks_forever(self):
+        self.scheduler.call_later(-5, lambda: None)
+        self.assertEqual(self.scheduler.timeout(100), 1)
+        self.scheduler.timers.clear()
+        self.assertEqual(self.scheduler.timeout(100), 100)
+
+    def test_wait_with_due_timer_and_empty_queue(self):
+        pygame.event.clear()
+        calls = []
+
+        def slow():
+            # El siguiente temporizador ya vence antes de volver a la espera
+            self.scheduler.call_later(1, lambda: calls.append("listo"))
+            pygame.time.delay(5)
+
+        self.scheduler.call_later(0, slow)
+        pygame.time.set_timer(pygame.USEREVENT, 1000, loops=1)  # Corta la espera si se bloquea
+        self.addCleanup(pygame.time.set_timer, pygame.USEREVENT, 0)
+        start = pygame.time.get_ticks()
+        self.scheduler.wait(30)
+        self.assertLess(pygame.time.get_ticks() - start, 500)
+        self.assertEqual(calls, ["listo"])
+
+    def test_play_messages(self):
+        shown = []
+        self.scheduler.queue_message("Uno", 10, shown.append)
+        self.scheduler.queue_message("Dos", 10, shown.append)
+        self.scheduler.play_messages()
+        self.assertEqual(shown, ["Uno", "Dos"])
+        self.assertFalse(self.scheduler.messages)
+
+if __name__ == '__main__':
+    unittest.main()
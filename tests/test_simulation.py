@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+from tests.test_base import TestBase
+from src.modules.simulation import build_dice_table, simulate_batch, run_simulation
+
+class TestSimulation(TestBase):
+    def test_dice_table(self):
+        table = build_dice_table()
+        self.assertEqual(table["skip"][1:6].tolist(), [1] * 5)
+        self.assertEqual(table["stamina"][40], 2)
+        self.assertEqual(table["life"][52], 1)
+        self.assertEqual(table["shield"][100], 1)
+        self.assertEqual(int(table["stamina"][70]), 0)
+
+    def test_simulate_batch_finishes_games(self):
+        result = simulate_batch(200, seed=3)
+        self.assertTrue(np.all(result["winners"] >= 0))
+        self.assertTrue(np.all(result["lengths"] > 0))
+        self.assertEqual(result["active_count"][0], 200)
+
+    def test_simulate_batch_is_reproducible(self):
+        first = simulate_batch(100, seed=5)
+        second = simulate_batch(100, seed=5)
+        np.testing.assert_array_equal(first["lengths"], second["lengths"])
+
+    def test_run_simulation_with_process_pool(self):
+        report = run_simulation(300, seed=1, workers=2, chunk_size=100)
+        self.assertEqual(report["games"], 300)
+        self.assertAlmostEqual(sum(report["win_rates"].values()), 1.0)
+        self.assertEqual(report["stamina_curve"][0].tolist(), [5.0, 5.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import random
+import tempfile
+import unittest
+from tests.test_base import TestBase
+from src.modules.engine import GameEngine, play_match, random_policy
+from src.modules.bot_ai import density_policy
+from src.modules.snapshot import from_buffer, load_engine, save_engine, to_bytes
+
+POLICIES = (density_policy, random_policy)
+
+class TestSnapshot(TestBase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "partida.sss")
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def half_played(self, compact, seed=2):
+        engine = GameEngine(board_size=10, rng=random.Random(seed), compact=compact)
+        for _ in range(50):
+            engine.step(POLICIES[engine.turn](engine))
+        return engine
+
+    def test_restored_game_continues_identically(self):
+        for compact in (False, True):
+            engine = self.half_played(compact)
+            save_engine(engine, self.path)
+            restored = load_engine(self.path, mmap=compact)
+            self.assertEqual(restored.players[1].fleet_status(), engine.players[1].fleet_status())
+
+            play_match(engine, POLICIES)
+            play_match(restored, POLICIES)
+            self.assertEqual(restored.winner.name, engine.winner.name)
+            self.assertEqual(restored.current_round, engine.current_round)
+            self.assertEqual(
+                [(p.life, p.stamina, p.ships_afloat) for p in restored.players],
+                [(p.life, p.stamina, p.ships_afloat) for p in engine.players],
+            )
+
+    def test_board_and_array_formats_match(self):
+        engine = self.half_played(False)
+        data = to_bytes(engine.players, turn=engine.turn, current_round=engine.current_round)
+        state = from_buffer(data)
+        self.assertEqual(to_bytes(state["players"], turn=state["turn"], current_round=state["current_round"]), data)
+        compact = from_buffer(data, compact=True)
+        self.assertEqual(compact["players"][0].board.to_grid(), engine.players[0].board.grid)
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            from_buffer(b"SSSL" + bytes(40))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from tests.test_base import TestBase
+from src.modules.tournament import (
+    run_tournament, build_report, schedule_games, register_strategy, resolve_strategy, STRATEGIES, ELO_START
+)
+
+class TestTournament(TestBase):
+    def test_schedule_alternates_first_player(self):
+        schedule = schedule_games(["random", "density"], 4, board_size=8, seed=1)
+        self.assertEqual([game[:2] for game in schedule[:2]], [("random", "density"), ("density", "random")])
+        self.assertEqual(schedule, schedule_games(["random", "density"], 4, board_size=8, seed=1))
+
+    def test_report_counts_and_elo(self):
+        results = [("a", "b", 0, 10), ("b", "a", 1, 12), ("a", "b", None, 30)]
+        report = build_report(["a", "b"], results)
+        self.assertEqual(report["table"]["a"]["wins"], 2)
+        self.assertEqual(report["table"]["b"]["draws"], 1)
+        self.assertAlmostEqual(report["table"]["a"]["elo"] + report["table"]["b"]["elo"], 2 * ELO_START)
+        self.assertGreater(report["table"]["a"]["elo"], ELO_START)
+        self.assertAlmostEqual(report["pairs"][("a", "b")], 2.5 / 3)
+
+    def test_run_tournament(self):
+        report = run_tournament(["random", "density"], 4, board_size=8, seed=2, workers=1)
+        self.assertEqual(report["games"], 4)
+        self.assertEqual(sum(stats["games"] for stats in report["table"].values()), 8)
+        self.assertGreater(report["games_per_second"], 0)
+
+    def test_register_strategy_stores_import_path(self):
+        register_strategy("random_copy", "modules.engine:random_policy")
+        self.addCleanup(STRATEGIES.pop, "random_copy")
+        self.assertEqual(resolve_strategy(STRATEGIES["random_copy"]).__name__, "random_policy")
+        with self.assertRaises(ValueError):
+            register_strategy("lambda", lambda engine, rng=None: ("roll",))
+
+    def test_bot_attack_strategy(self):
+        report = run_tournament(["bot_attack", "random"], 2, board_size=8, seed=3, workers=1)
+        self.assertEqual(report["table"]["bot_attack"]["games"], 2)
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            run_tournament(["random", "missing"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from tests.test_base import TestBase
+from src.modules.training_env import VectorGameEnv, random_actions
+
+class TestVectorGameEnv(TestBase):
+    def test_observation_is_shared_with_the_games(self):
+        env = VectorGameEnv(3, board_size=8, seed=1)
+        observation, _ = env.reset()
+        self.assertEqual(observation["board"].shape, (3, 8, 8))
+        for engine in env.engines:
+            self.assertEqual((engine.turn, engine.phase), (0, "attack"))
+
+        row, col = 2, 3
+        state = env.engines[0].player.attack_board
+        result, _, _, _, _ = env.step([[0, row, col, 0]] * 3)
+        self.assertIs(result["board"], observation["board"])
+        if not env.terminated[0]:
+            self.assertNotEqual(observation["board"][0, row, col], 0)
+            self.assertIs(env.engines[0].player.attack_board, state)
+
+    def test_games_auto_reset_and_are_reproducible(self):
+        def run(seed):
+            env = VectorGameEnv(4, board_size=8, seed=seed)
+            env.reset()
+            rng = np.random.default_rng(seed)
+            total, finished = 0.0, 0
+            for _ in range(300):
+                _, rewards, terminated, truncated, infos = env.step(random_actions(env, rng))
+                total += rewards.sum()
+                finished += int(terminated.sum() + truncated.sum())
+                for index in np.flatnonzero(terminated):
+                    self.assertIn(infos["winner"][index], (0, 1))
+            return total, finished, env.stats.copy()
+
+        total, finished, stats = run(5)
+        self.assertGreater(finished, 0)
+        self.assertTrue((stats[:, 0] > 0).all())  # Las partidas terminadas ya se reiniciaron
+        again = run(5)
+        self.assertEqual((total, finished), again[:2])
+        np.testing.assert_array_equal(stats, again[2])
+
+    def test_unaffordable_action_is_penalized(self):
+        env = VectorGameEnv(1, board_size=8, seed=2, invalid_penalty=-1.0)
+        env.reset()
+        env.engines[0].player.stamina = 0
+        env.stats[0, 1] = 0
+        self.assertEqual(env.action_mask()[0].tolist(), [True, False, False, False])
+        _, rewards, _, _, _ = env.step([[2, 0, 0, 0]])
+        self.assertLessEqual(rewards[0], 0.0)  # Un ataque normal hace como mucho 1 de daño
+        self.assertEqual(env.engines[0].player.last_attack_type, "normal_attack")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import pygame
+from tests.test_base import TestBase
+from src.modules.viewport import Viewport, row_label
+from src.modules.board import Board
+
+class TestViewport(TestBase):
+    def test_row_labels(self):
+        self.assertEqual([row_label(row) for row in (0, 25, 26, 51, 52, 255)], ["A", "Z", "AA", "AZ", "BA", "IV"])
+
+    def test_small_board_fits(self):
+        viewport = Viewport(12)
+        self.assertEqual(viewport.cell_size, 25)
+        self.assertFalse(viewport.scrollable)
+
+    def test_scroll_and_ensure_visible(self):
+        viewport = Viewport(256)
+        self.assertTrue(viewport.scrollable)
+        viewport.scroll(-5, 1000)
+        self.assertEqual((viewport.top, viewport.left), (0, 256 - viewport.visible))
+        viewport.ensure_visible(200, 3)
+        self.assertTrue(viewport.is_visible(200, 3))
+        self.assertEqual(viewport.cell_at(0, 0), (viewport.top, viewport.left))
+        self.assertEqual(viewport.cell_at(-1, 0), (None, None))
+
+    def test_zoom_keeps_anchor_in_view(self):
+        viewport = Viewport(256)
+        viewport.ensure_visible(128, 128)
+        version = viewport.version
+        viewport.zoom(2, anchor=(128, 128))
+        self.assertGreater(viewport.cell_size, 6)
+        self.assertTrue(viewport.is_visible(128, 128))
+        self.assertGreater(viewport.version, version)
+
+class TestLargeBoardDrawing(TestBase):
+    def test_draws_only_visible_cells(self):
+        screen = pygame.Surface((1180, 660))
+        board = Board(256)
+        board.start_x, board.start_y = 50, 260
+        board.draw(screen)
+        self.assertEqual(board.renderer.surface.get_width(), 25 + board.pixel_size)
+        self.assertLessEqual(board.pixel_size, 300)
+
+        # Una celda fuera de la vista solo cambia el minimapa
+        board.update_cell(255, 255, state=1, ship="Submarino")
+        changed = board.draw(screen)
+        self.assertEqual([rect.size for rect in changed], [(80, 80)])
+
+        board.viewport.ensure_visible(255, 255)
+        rect = board.cell_rect(255, 255)
+        board.draw(screen)
+        self.assertEqual(screen.get_at(rect.move(2, 2).topleft)[:3], board.get_cell_color(board.grid[255][255]))
+
+if __name__ == '__main__':
+    unittest.main()